@@ -1,96 +1,34 @@
 
-import os
-import time
+import argparse
 import glob
-import pandas as pd
-from src.model.tsp_model import TSPInstance
-from src.constructive.nearest_neighbor import ConstructiveSolver
-from src.local_search.two_opt import LocalSearchSolver
-from src.grasp.grasp_solver import GRASPSolver
-from src.exact.branch_and_bound import BranchAndBoundSolver
+import os
+from src.benchmarking.harness import BenchmarkCase, add_arguments, run_from_args, wide_rows, write_wide_csv
+
+CASES = [
+    BenchmarkCase("constructive", "constructive"),
+    BenchmarkCase("local_search", "local_search", initial_method="constructive"),
+    BenchmarkCase("grasp", "grasp", {"max_iterations": 20}),
+    # B&B runs up to its time limit: a single timed run, no warm-up
+    BenchmarkCase("exact", "exact", {"time_limit": 60}, max_size=20, repeats=1, warmup=0),
+]
+COLUMNS = {"constructive": "Constructive", "local_search": "LocalSearch", "grasp": "GRASP", "exact": "Exact"}
+FIELDNAMES = ["Instance", "Size", "Constructive_Cost", "Constructive_Time", "LocalSearch_Cost",
+              "LocalSearch_Time", "GRASP_Cost", "GRASP_Time", "Exact_Cost", "Exact_Time"]
 
-def run_benchmark():
+def run_benchmark(args):
     # Look for instances in the new_instances folder
     instance_path = "instances/new_instances/*.in"
-    files = glob.glob(instance_path)
-    
+    files = sorted(glob.glob(instance_path), key=os.path.getsize)
     if not files:
         print(f"No instances found in {instance_path}")
         return
 
-    files.sort(key=lambda x: os.path.getsize(x))
-    
-    results = []
-    
-    for file in files:
-        filename = os.path.basename(file)
-        if filename == "benchmark_results.csv": continue
-        
-        print(f"\nProcessing {filename}...")
-        try:
-            instance = TSPInstance(file)
-            n = instance.n
-            print(f"  Size: {n}")
-            
-            # 1. Constructive
-            start = time.time()
-            solver_const = ConstructiveSolver(instance)
-            sol_const = solver_const.solve()
-            time_const = time.time() - start
-            print(f"    Constructive: {sol_const.cost} (Time: {time_const:.4f}s)")
-            
-            # 2. Local Search
-            start = time.time()
-            solver_ls = LocalSearchSolver(instance, sol_const)
-            sol_ls = solver_ls.solve()
-            time_ls = time.time() - start
-            print(f"    Local Search: {sol_ls.cost} (Time: {time_ls:.4f}s)")
-            
-            # 3. GRASP
-            start = time.time()
-            solver_grasp = GRASPSolver(instance, max_iterations=20)
-            sol_grasp = solver_grasp.solve()
-            time_grasp = time.time() - start
-            print(f"    GRASP: {sol_grasp.cost} (Time: {time_grasp:.4f}s)")
-            
-            # 4. Exact (Branch and Bound)
-            sol_exact_cost = "N/A"
-            time_exact = "N/A"
-            if n <= 20: 
-                start = time.time()
-                solver_bb = BranchAndBoundSolver(instance, time_limit=60)
-                sol_bb = solver_bb.solve()
-                time_exact = time.time() - start
-                if sol_bb:
-                    sol_exact_cost = sol_bb.cost
-                    print(f"    Exact: {sol_exact_cost} (Time: {time_exact:.4f}s)")
-                else:
-                    sol_exact_cost = "Timeout/NoSol"
-                    print(f"    Exact: Timeout")
-            else:
-                 print(f"    Exact: Skipped (N={n} too large)")
-            
-            results.append({
-                "Instance": filename,
-                "Size": n,
-                "Constructive_Cost": sol_const.cost,
-                "Constructive_Time": time_const,
-                "LocalSearch_Cost": sol_ls.cost,
-                "LocalSearch_Time": time_ls,
-                "GRASP_Cost": sol_grasp.cost,
-                "GRASP_Time": time_grasp,
-                "Exact_Cost": sol_exact_cost,
-                "Exact_Time": time_exact
-            })
-            
-        except Exception as e:
-            print(f"  Error processing {file}: {e}")
-            
-    if results:
-        df = pd.DataFrame(results)
-        df.to_csv("report/benchmark_results.csv", index=False)
-        print("\nResults saved to report/benchmark_results.csv")
-        print(df.to_markdown())
+    summary, instances = run_from_args(args, files, CASES, "report/benchmark")
+    # Wide table (medians) read by plot_results.py
+    write_wide_csv("report/benchmark_results.csv", FIELDNAMES, wide_rows(summary, instances, COLUMNS))
+    print("Results saved to report/benchmark_results.csv")
 
 if __name__ == "__main__":
-    run_benchmark()
+    parser = argparse.ArgumentParser(description="Benchmark of the four methods on instances/new_instances")
+    add_arguments(parser)
+    run_benchmark(parser.parse_args())
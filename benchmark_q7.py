@@ -1,131 +1,60 @@
 
-import os
-import time
+import argparse
 import glob
-import csv
-from src.model.tsp_model import TSPInstance
-from src.constructive.nearest_neighbor import ConstructiveSolver
-from src.local_search.two_opt import LocalSearchSolver
-from src.grasp.grasp_solver import GRASPSolver
-from src.exact.branch_and_bound import BranchAndBoundSolver
-
-def run_benchmark_q7():
+import os
+from src.benchmarking.harness import (BenchmarkCase, add_arguments, add_gaps, run_from_args,
+                                      wide_rows, write_wide_csv)
+from src.grasp.tuning import load_tuned_params
+
+# GRASP (OPTIMIZED CONFIGURATION): alpha=0.2 and 50 iterations were found best in Q6;
+# used when no tuned configuration table (tune_grasp.py) is available
+BEST_ALPHA = 0.2
+BEST_ITERATIONS = 50
+GRASP_CONFIG = "report/grasp_tuned.json"
+
+def grasp_params(config_path):
+    def params(n):
+        if config_path and os.path.exists(config_path):
+            tuned = load_tuned_params(config_path, n)
+            if tuned is not None:
+                return tuned
+        # Adjustment for large instances
+        return {"max_iterations": 20 if n > 500 else BEST_ITERATIONS, "alpha": BEST_ALPHA}
+    return params
+
+def make_cases(config_path=GRASP_CONFIG):
+    return [
+        BenchmarkCase("exact", "exact", {"time_limit": 60}, max_size=20, repeats=1, warmup=0),
+        BenchmarkCase("constructive", "constructive"),
+        BenchmarkCase("local_search", "local_search", initial_method="constructive"),
+        BenchmarkCase("grasp", "grasp", grasp_params(config_path)),
+    ]
+COLUMNS = {"exact": "Exact", "constructive": "Constructive", "local_search": "LocalSearch", "grasp": "GRASP"}
+FIELDNAMES = ["Instance", "Size", "Exact_Cost", "Exact_Time",
+              "Constructive_Cost", "Constructive_Time", "Constructive_Gap",
+              "LocalSearch_Cost", "LocalSearch_Time", "LocalSearch_Gap",
+              "GRASP_Cost", "GRASP_Time", "GRASP_Gap"]
+
+def run_benchmark_q7(args):
     # Target files in the ROOT directory (excluding subdirectories)
-    # We look for .in files in the current folder
-    files = glob.glob("*.in")
-    
+    files = sorted(glob.glob("*.in"), key=os.path.getsize)
     if not files:
-        print(f"No instances found in current directory")
+        print("No instances found in current directory")
         return
-
-    # Sort files by size
-    files.sort(key=lambda x: os.path.getsize(x))
-    
     print(f"Found {len(files)} instances for validation (Q7).")
-    
-    output_file = "report/benchmark_q7_results.csv"
-    os.makedirs("report", exist_ok=True)
-    
-    fieldnames = ["Instance", "Size", "Exact_Cost", "Exact_Time", 
-                  "Constructive_Cost", "Constructive_Time", "Constructive_Gap",
-                  "LocalSearch_Cost", "LocalSearch_Time", "LocalSearch_Gap",
-                  "GRASP_Cost", "GRASP_Time", "GRASP_Gap"]
-
-    # Write header
-    with open(output_file, 'w', newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-    
-    for file in files:
-        filename = os.path.basename(file)
-        
-        try:
-            temp_instance = TSPInstance(file)
-            n = temp_instance.n
-        except Exception as e:
-            print(f"Skipping {filename}: {e}")
-            continue
-            
-        if n > 1000:
-            print(f"Skipping {filename} (Size {n}) - too large for validation")
-            continue
-            
-        print(f"\nProcessing {filename} (Size: {n})...")
-        try:
-            instance = temp_instance
-            
-            # Exact
-            cost_exact = "N/A"
-            time_exact = "N/A"
-            optimal = False
-            if n <= 20:
-                print("    Running Exact...")
-                start = time.time()
-                solver_bb = BranchAndBoundSolver(instance, time_limit=60)
-                sol_bb = solver_bb.solve()
-                time_exact = time.time() - start
-                if sol_bb:
-                    cost_exact = sol_bb.cost
-                    optimal = True
-                else: 
-                    cost_exact = "Timeout"
 
-            # Constructive
-            print("    Running Constructive...")
-            start_pc = time.perf_counter()
-            sol_const = ConstructiveSolver(instance).solve()
-            time_const = time.perf_counter() - start_pc
-
-            # Local Search
-            print("    Running Local Search...")
-            start_pc = time.perf_counter()
-            sol_ls = LocalSearchSolver(instance, sol_const).solve()
-            time_ls = time.perf_counter() - start_pc
-
-            # GRASP (OPTIMIZED CONFIGURATION)
-            # Assuming alpha=0.2 and 50 iterations were found best in Q6
-            best_alpha = 0.2
-            best_iter = 50
-            if n > 500: best_iter = 20 # Adjustment for large instances
-            
-            print(f"    Running GRASP (alpha={best_alpha}, iter={best_iter})...")
-            start_pc = time.perf_counter()
-            sol_grasp = GRASPSolver(instance, max_iterations=best_iter, alpha=best_alpha).solve()
-            time_grasp = time.perf_counter() - start_pc
-
-            # Gaps
-            gap_const = (sol_const.cost - cost_exact)/cost_exact*100 if (optimal and isinstance(cost_exact, (int, float))) else ""
-            gap_ls = (sol_ls.cost - cost_exact)/cost_exact*100 if (optimal and isinstance(cost_exact, (int, float))) else ""
-            # Calculate gap against BEST KNOWN if Exact not available? 
-            # For now, stick to Exact comparison or just raw verification.
-            gap_grasp = (sol_grasp.cost - cost_exact)/cost_exact*100 if (optimal and isinstance(cost_exact, (int, float))) else ""
-
-            row = {
-                "Instance": filename,
-                "Size": n,
-                "Exact_Cost": cost_exact,
-                "Exact_Time": time_exact,
-                "Constructive_Cost": sol_const.cost,
-                "Constructive_Time": time_const,
-                "Constructive_Gap": gap_const,
-                "LocalSearch_Cost": sol_ls.cost,
-                "LocalSearch_Time": time_ls,
-                "LocalSearch_Gap": gap_ls,
-                "GRASP_Cost": sol_grasp.cost,
-                "GRASP_Time": time_grasp,
-                "GRASP_Gap": gap_grasp
-            }
-            
-            with open(output_file, 'a', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writerow(row)
-                
-            print(f"    -> GRASP Cost: {sol_grasp.cost} (Time: {time_grasp:.4f}s)")
-            
-        except Exception as e:
-            print(f"  Error processing {file}: {e}")
-
-    print(f"\nResults saved to {output_file}")
+    if os.path.exists(args.grasp_config):
+        print(f"GRASP parameters from {args.grasp_config}")
+    summary, instances = run_from_args(args, files, make_cases(args.grasp_config), "report/benchmark_q7", max_size=1000)
+    rows = wide_rows(summary, instances, COLUMNS)
+    add_gaps(rows, "Exact", ["Constructive", "LocalSearch", "GRASP"])
+    output_file = "report/benchmark_q7_results.csv"
+    write_wide_csv(output_file, FIELDNAMES, rows)
+    print(f"Results saved to {output_file}")
 
 if __name__ == "__main__":
-    run_benchmark_q7()
+    parser = argparse.ArgumentParser(description="Q7 validation benchmark")
+    add_arguments(parser)
+    parser.add_argument("--grasp-config", default=GRASP_CONFIG,
+                        help=f"tuned GRASP configuration table (default: {GRASP_CONFIG})")
+    run_benchmark_q7(parser.parse_args())
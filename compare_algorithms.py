@@ -3,7 +3,7 @@
 Script de comparaison des 4 algorithmes TSP avec gestion des timeouts.
 
 Usage:
-    python compare_algorithms.py <fichier.in> [--timeout SECONDS] [--grasp-iterations N] [--grasp-alpha A]
+    python compare_algorithms.py <fichier.in> [--timeout SECONDS] [--grasp-iterations N] [--grasp-alpha A] [--workers N]
 
 Exemple:
     python compare_algorithms.py instances/17.in --timeout 60
@@ -11,103 +11,62 @@ Exemple:
 """
 
 import sys
-import time
 import argparse
-import signal
 from pathlib import Path
 from typing import Optional, Dict, Any
-import multiprocessing as mp
 
 # Ajouter le dossier parent au path pour importer les modules
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.model.tsp_model import TSPInstance, Solution
-from src.exact.branch_and_bound import BranchAndBoundSolver
-from src.constructive.nearest_neighbor import NearestNeighborSolver
-from src.local_search.two_opt import LocalSearchSolver
-from src.grasp.grasp_solver import GRASPSolver
+from src.model.tsp_model import load_instance
+from src.runtime.process_runner import RunSpec, run_isolated, run_many
 
 
-class TimeoutException(Exception):
-    """Exception levée quand un timeout se produit."""
-    pass
-
-
-def timeout_handler(signum, frame):
-    """Handler pour le signal d'alarme (timeout)."""
-    raise TimeoutException("Timeout!")
-
-
-def run_algorithm_with_timeout(solver_class, instance, timeout, **kwargs):
+def run_algorithm_with_timeout(method, instance, timeout, memory_limit_mb=None, **kwargs):
     """
-    Exécute un algorithme avec un timeout.
+    Exécute un algorithme dans un processus fils, avec un timeout.
     
     Args:
-        solver_class: Classe du solver à utiliser
+        method: Nom de la méthode dans le registre des solveurs
         instance: Instance TSP
         timeout: Temps limite en secondes (None = pas de limite)
+        memory_limit_mb: Limite mémoire du processus en Mo (None = pas de limite)
         **kwargs: Arguments supplémentaires pour le solver
     
     Returns:
         dict: Résultats avec 'solution', 'cost', 'time', 'status'
+        (en cas de timeout, la meilleure solution trouvée jusque-là)
     """
-    start_time = time.time()
-    
-    if timeout is not None and timeout > 0:
-        # Configurer le signal d'alarme pour le timeout
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(int(timeout))
-    
-    try:
-        solver = solver_class(instance, **kwargs)
-        solution = solver.solve()
-        elapsed_time = time.time() - start_time
-        
-        # Annuler l'alarme si elle existe
-        if timeout is not None:
-            signal.alarm(0)
-        
-        return {
-            'solution': solution.tour if solution else None,
-            'cost': solution.cost if solution else float('inf'),
-            'time': elapsed_time,
-            'status': 'completed'
-        }
-    
-    except TimeoutException:
-        elapsed_time = time.time() - start_time
-        return {
-            'solution': None,
-            'cost': float('inf'),
-            'time': elapsed_time,
-            'status': 'timeout'
-        }
-    
-    except Exception as e:
-        elapsed_time = time.time() - start_time
-        signal.alarm(0)  # Annuler l'alarme
-        return {
-            'solution': None,
-            'cost': float('inf'),
-            'time': elapsed_time,
-            'status': f'error: {str(e)}'
-        }
+    return run_isolated(method, instance, timeout, memory_limit_mb, **kwargs)
+
+
+def print_result(result: Dict[str, Any]):
+    print(f"   Statut: {result['status']}")
+    if result['cost'] != float('inf'):
+        print(f"   Coût: {result['cost']}")
+    print(f"   Temps: {result['time']:.3f}s\n")
 
 
 def compare_algorithms(
     instance_file: str,
     exact_timeout: int = 60,
     grasp_iterations: int = 50,
-    grasp_alpha: float = 0.2
+    grasp_alpha: float = 0.2,
+    memory_limit_mb: Optional[int] = None,
+    workers: int = 1
 ) -> Dict[str, Any]:
     """
-    Compare les 4 algorithmes sur une instance donnée.
+    Compare les 4 algorithmes sur une instance donnée. Chaque algorithme
+    tourne dans son propre processus, `workers` à la fois (1 par défaut :
+    les temps mesurés restent comparables entre algorithmes).
     
     Args:
         instance_file: Chemin vers le fichier d'instance
         exact_timeout: Timeout pour l'algorithme exact (secondes)
         grasp_iterations: Nombre d'itérations pour GRASP
         grasp_alpha: Paramètre alpha pour GRASP
+        memory_limit_mb: Limite mémoire par algorithme en Mo (optionnel)
+        workers: Nombre d'algorithmes exécutés simultanément
     
     Returns:
         dict: Résultats de la comparaison
@@ -117,17 +76,28 @@ def compare_algorithms(
     print(f"{'='*80}\n")
     
     # Charger l'instance
-    instance = TSPInstance.from_file(instance_file)
+    instance = load_instance(instance_file)
     print(f"Instance chargée: {instance.n} villes\n")
     
-    results = {}
+    # La recherche locale part de la même solution Nearest Neighbor que
+    # l'heuristique constructive (son point de départ par défaut)
+    specs = {
+        'constructive': RunSpec("constructive", None, memory_limit_mb),
+        'local_search': RunSpec("local_search", None, memory_limit_mb),
+        'grasp': RunSpec("grasp", None, memory_limit_mb,
+                         max_iterations=grasp_iterations, alpha=grasp_alpha),
+    }
+    # Pour les grandes instances, on skip l'exact
+    if instance.n <= 20:
+        specs['exact'] = RunSpec("exact", exact_timeout, memory_limit_mb, time_limit=exact_timeout)
+    
+    print(f"Exécution de {len(specs)} algorithmes ({workers} à la fois)...\n")
+    results = dict(zip(specs, run_many(instance, list(specs.values()), workers)))
     
     # 1. Algorithme Exact (Branch & Bound) avec timeout
     print("1. Algorithme Exact (Branch & Bound)...")
     print(f"   Timeout: {exact_timeout}s")
-    
-    # Pour les grandes instances, on skip l'exact
-    if instance.n > 20:
+    if 'exact' not in results:
         print(f"   ⚠️  Instance trop grande (n={instance.n} > 20), algorithme exact ignoré\n")
         results['exact'] = {
             'solution': None,
@@ -136,57 +106,19 @@ def compare_algorithms(
             'status': 'skipped (n > 20)'
         }
     else:
-        results['exact'] = run_algorithm_with_timeout(
-            BranchAndBoundSolver,
-            instance,
-            exact_timeout,
-            time_limit=exact_timeout
-        )
-        print(f"   Statut: {results['exact']['status']}")
-        if results['exact']['status'] == 'completed':
-            print(f"   Coût: {results['exact']['cost']}")
-        print(f"   Temps: {results['exact']['time']:.3f}s\n")
+        print_result(results['exact'])
     
     # 2. Heuristique Constructive (Nearest Neighbor)
     print("2. Heuristique Constructive (Nearest Neighbor)...")
-    results['constructive'] = run_algorithm_with_timeout(
-        NearestNeighborSolver,
-        instance,
-        None  # Pas de timeout, c'est rapide
-    )
-    print(f"   Statut: {results['constructive']['status']}")
-    print(f"   Coût: {results['constructive']['cost']}")
-    print(f"   Temps: {results['constructive']['time']:.3f}s\n")
+    print_result(results['constructive'])
     
     # 3. Recherche Locale (2-Opt)
     print("3. Recherche Locale (2-Opt après Nearest Neighbor)...")
-    # On utilise la solution constructive comme point de départ
-    nn_solution = Solution(
-        results['constructive']['solution'],
-        results['constructive']['cost']
-    )
-    results['local_search'] = run_algorithm_with_timeout(
-        LocalSearchSolver,
-        instance,
-        None,  # Pas de timeout normalement
-        initial_solution=nn_solution
-    )
-    print(f"   Statut: {results['local_search']['status']}")
-    print(f"   Coût: {results['local_search']['cost']}")
-    print(f"   Temps: {results['local_search']['time']:.3f}s\n")
+    print_result(results['local_search'])
     
     # 4. Méta-heuristique (GRASP)
     print(f"4. Méta-heuristique (GRASP, {grasp_iterations} itérations, alpha={grasp_alpha})...")
-    results['grasp'] = run_algorithm_with_timeout(
-        GRASPSolver,
-        instance,
-        None,  # Pas de timeout, mais on peut en ajouter si besoin
-        max_iterations=grasp_iterations,
-        alpha=grasp_alpha
-    )
-    print(f"   Statut: {results['grasp']['status']}")
-    print(f"   Coût: {results['grasp']['cost']}")
-    print(f"   Temps: {results['grasp']['time']:.3f}s\n")
+    print_result(results['grasp'])
     
     return {
         'instance_file': instance_file,
@@ -344,6 +276,10 @@ Exemples:
                         help='Paramètre alpha pour GRASP (défaut: 0.2)')
     parser.add_argument('--latex-output', type=str, default=None,
                         help='Fichier de sortie pour le tableau LaTeX (optionnel)')
+    parser.add_argument('--memory-limit', type=int, default=None,
+                        help='Limite mémoire par algorithme en Mo (optionnel)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Algorithmes exécutés simultanément (défaut: 1, temps comparables)')
     
     args = parser.parse_args()
     
@@ -357,7 +293,9 @@ Exemples:
         args.instance,
         exact_timeout=args.timeout,
         grasp_iterations=args.grasp_iterations,
-        grasp_alpha=args.grasp_alpha
+        grasp_alpha=args.grasp_alpha,
+        memory_limit_mb=args.memory_limit,
+        workers=args.workers
     )
     
     # Afficher le tableau récapitulatif
@@ -11,9 +11,7 @@ Exemple:
 """
 
 import sys
-import time
 import argparse
-import signal
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import matplotlib.pyplot as plt
@@ -23,110 +21,59 @@ matplotlib.use('Agg')  # Backend pour sauvegarder sans afficher
 # Ajouter le dossier parent au path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.model.tsp_model import TSPInstance, Solution
-from src.exact.branch_and_bound import BranchAndBoundSolver
-from src.constructive.nearest_neighbor import NearestNeighborSolver
-from src.local_search.two_opt import LocalSearchSolver
-from src.grasp.grasp_solver import GRASPSolver
+from src.model.tsp_model import load_instance
+from src.runtime.process_runner import RunSpec, run_isolated, run_many
 
 
-class TimeoutException(Exception):
-    pass
-
-
-def timeout_handler(signum, frame):
-    raise TimeoutException("Timeout!")
-
-
-def run_algorithm_with_timeout(solver_class, instance, timeout, **kwargs):
-    """Exécute un algorithme avec timeout."""
-    start_time = time.time()
-    
-    if timeout is not None and timeout > 0:
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(int(timeout))
-    
-    try:
-        solver = solver_class(instance, **kwargs)
-        solution = solver.solve()
-        elapsed_time = time.time() - start_time
-        
-        if timeout is not None:
-            signal.alarm(0)
-        
-        return {
-            'solution': solution.tour if solution else None,
-            'cost': solution.cost if solution else float('inf'),
-            'time': elapsed_time,
-            'status': 'completed'
-        }
-    
-    except TimeoutException:
-        elapsed_time = time.time() - start_time
-        return {
-            'solution': None,
-            'cost': float('inf'),
-            'time': elapsed_time,
-            'status': 'timeout'
-        }
-    
-    except Exception as e:
-        elapsed_time = time.time() - start_time
-        signal.alarm(0)
-        return {
-            'solution': None,
-            'cost': float('inf'),
-            'time': elapsed_time,
-            'status': f'error: {str(e)}'
-        }
+def run_algorithm_with_timeout(method, instance, timeout, memory_limit_mb=None, **kwargs):
+    """Exécute un algorithme dans un processus fils avec timeout (meilleure solution conservée)."""
+    return run_isolated(method, instance, timeout, memory_limit_mb, **kwargs)
 
 
 def compare_algorithms(instance_file: str, exact_timeout: int = 60,
-                      grasp_iterations: int = 50, grasp_alpha: float = 0.2):
-    """Compare les 4 algorithmes."""
+                      grasp_iterations: int = 50, grasp_alpha: float = 0.2,
+                      memory_limit_mb: Optional[int] = None, workers: int = 1):
+    """Compare les 4 algorithmes, `workers` à la fois (1 : temps comparables)."""
     print(f"\n{'='*80}")
     print(f"Comparaison des algorithmes sur: {instance_file}")
     print(f"{'='*80}\n")
     
-    instance = TSPInstance.from_file(instance_file)
+    instance = load_instance(instance_file)
     print(f"Instance chargée: {instance.n} villes\n")
     
-    results = {}
+    specs = {
+        'constructive': RunSpec("constructive", None, memory_limit_mb),
+        'local_search': RunSpec("local_search", None, memory_limit_mb),
+        'grasp': RunSpec("grasp", None, memory_limit_mb,
+                         max_iterations=grasp_iterations, alpha=grasp_alpha),
+    }
+    if instance.n <= 20:
+        specs['exact'] = RunSpec("exact", exact_timeout, memory_limit_mb, time_limit=exact_timeout)
+    results = dict(zip(specs, run_many(instance, list(specs.values()), workers)))
     
     # 1. Exact (Branch & Bound)
     print("1. Algorithme Exact (Branch & Bound)...")
-    if instance.n > 20:
+    if 'exact' not in results:
         print(f"   ⚠️  Instance trop grande (n={instance.n}), ignoré\n")
         results['exact'] = {'solution': None, 'cost': float('inf'), 'time': 0, 'status': 'skipped'}
     else:
-        results['exact'] = run_algorithm_with_timeout(
-            BranchAndBoundSolver, instance, exact_timeout, time_limit=exact_timeout
-        )
         print(f"   Statut: {results['exact']['status']}")
-        if results['exact']['status'] == 'completed':
+        if results['exact']['cost'] != float('inf'):
             print(f"   Coût: {results['exact']['cost']}")
         print(f"   Temps: {results['exact']['time']:.3f}s\n")
     
     # 2. Constructive (Nearest Neighbor)
     print("2. Heuristique Constructive (Nearest Neighbor)...")
-    results['constructive'] = run_algorithm_with_timeout(NearestNeighborSolver, instance, None)
     print(f"   Coût: {results['constructive']['cost']}")
     print(f"   Temps: {results['constructive']['time']:.3f}s\n")
     
-    # 3. Local Search (2-Opt)
+    # 3. Local Search (2-Opt), depuis la même solution Nearest Neighbor
     print("3. Recherche Locale (2-Opt)...")
-    nn_solution = Solution(results['constructive']['solution'], results['constructive']['cost'])
-    results['local_search'] = run_algorithm_with_timeout(
-        LocalSearchSolver, instance, None, initial_solution=nn_solution
-    )
     print(f"   Coût: {results['local_search']['cost']}")
     print(f"   Temps: {results['local_search']['time']:.3f}s\n")
     
     # 4. GRASP
     print(f"4. Méta-heuristique (GRASP, {grasp_iterations} itérations)...")
-    results['grasp'] = run_algorithm_with_timeout(
-        GRASPSolver, instance, None, max_iterations=grasp_iterations, alpha=grasp_alpha
-    )
     print(f"   Coût: {results['grasp']['cost']}")
     print(f"   Temps: {results['grasp']['time']:.3f}s\n")
     
@@ -368,6 +315,10 @@ Exemples:
                         help='Paramètre alpha GRASP (défaut: 0.2)')
     parser.add_argument('--output-dir', type=str, default='results',
                         help='Dossier pour sauvegarder les graphiques (défaut: results)')
+    parser.add_argument('--memory-limit', type=int, default=None,
+                        help='Limite mémoire par algorithme en Mo (optionnel)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Algorithmes exécutés simultanément (défaut: 1, temps comparables)')
     
     args = parser.parse_args()
     
@@ -380,7 +331,9 @@ Exemples:
         args.instance,
         exact_timeout=args.timeout,
         grasp_iterations=args.grasp_iterations,
-        grasp_alpha=args.grasp_alpha
+        grasp_alpha=args.grasp_alpha,
+        memory_limit_mb=args.memory_limit,
+        workers=args.workers
     )
     
     # Afficher le résumé
@@ -0,0 +1,23 @@
+
+import argparse
+from src.model.generator import FAMILIES, generate_instance
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate seeded synthetic TSP instances (.in format)")
+    parser.add_argument("--families", nargs="+", choices=FAMILIES, default=list(FAMILIES))
+    parser.add_argument("--sizes", type=int, nargs="+", required=True, help="numbers of cities")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0])
+    parser.add_argument("--output-dir", default="instances/generated")
+    parser.add_argument("--overwrite", action="store_true", help="regenerate existing files")
+    parser.add_argument("--coordinates", action="store_true",
+                        help="write TSPLIB EUC_2D coordinate files (.tsp) instead of matrices "
+                             "(euclidean and clustered only)")
+    args = parser.parse_args()
+
+    for family in args.families:
+        for n in args.sizes:
+            for seed in args.seeds:
+                print(generate_instance(family, n, seed, args.output_dir, args.overwrite, args.coordinates))
+
+if __name__ == "__main__":
+    main()
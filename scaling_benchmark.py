@@ -0,0 +1,46 @@
+
+import argparse
+import json
+import os
+from src.benchmarking.harness import machine_metadata, pin_cpus, write_wide_csv
+from src.benchmarking.scaling import PHASES, log_sizes, plot_scaling, print_fits, run_scaling
+from src.model.generator import FAMILIES
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling benchmark on generated instances of log-spaced sizes")
+    parser.add_argument("--families", nargs="+", choices=FAMILIES, default=["euclidean"])
+    parser.add_argument("--phases", nargs="+", choices=list(PHASES), default=list(PHASES))
+    parser.add_argument("--min-size", type=int, default=100)
+    parser.add_argument("--max-size", type=int, default=2000)
+    parser.add_argument("--points", type=int, default=6, help="sizes in the sweep (default: 6)")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0, help="instance generator seed")
+    parser.add_argument("--phase-limit", type=float, default=60.0,
+                        help="stop timing a phase once it exceeds this many seconds (default: 60)")
+    parser.add_argument("--instance-dir", default="instances/generated")
+    parser.add_argument("--output", default="report/scaling", help="output prefix (default: report/scaling)")
+    parser.add_argument("--cpus", type=int, nargs="+", default=None, help="pin the benchmark to these CPUs")
+    parser.add_argument("--plot", action="store_true", help="also write <output>.png (matplotlib)")
+    args = parser.parse_args()
+
+    pin_cpus(args.cpus)
+    sizes = log_sizes(args.min_size, args.max_size, args.points)
+    print(f"Sizes: {sizes}")
+    rows, fits = run_scaling(args.families, sizes, args.phases, args.repeats, args.seed,
+                             args.instance_dir, args.phase_limit)
+    print_fits(fits)
+
+    write_wide_csv(f"{args.output}_runs.csv", ["family", "n", "phase", "repeat", "time"], rows)
+    write_wide_csv(f"{args.output}_fits.csv", ["family", "phase", "exponent", "a", "r2", "points"], fits)
+    metadata = machine_metadata()
+    metadata["config"] = {key: value for key, value in vars(args).items() if key != "plot"}
+    metadata["sizes"] = sizes
+    with open(f"{args.output}.json", "w") as f:
+        json.dump({"metadata": metadata, "runs": rows, "fits": fits}, f, indent=2)
+    print(f"Results saved to {args.output}_runs.csv, {args.output}_fits.csv and {args.output}.json")
+    if args.plot:
+        plot_scaling(rows, fits, f"{args.output}.png")
+        print(f"Plot saved to {args.output}.png")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Service de résolution longue durée (voir src/runtime/service.py pour le protocole).
+
+Usage:
+    python serve.py [--workers N] [--max-pending M] [--cache-size K] [--socket PATH]
+
+Exemple:
+    echo '{"id": 1, "instance": "instances/new_instances/51.in", "method": "grasp", "time_budget": 1}' | python serve.py
+"""
+
+import io
+import os
+import sys
+import argparse
+import socketserver
+
+from src.runtime.service import SolveService, serve_stream
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Service de résolution TSP (JSON lines)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Nombre de processus de résolution (défaut: nombre de CPU)')
+    parser.add_argument('--max-pending', type=int, default=16,
+                        help='Nombre maximal de requêtes en cours avant blocage (défaut: 16)')
+    parser.add_argument('--cache-size', type=int, default=8,
+                        help='Nombre d\'instances gardées en cache par processus (défaut: 8)')
+    parser.add_argument('--socket', type=str, default=None,
+                        help='Écouter sur une socket Unix au lieu de stdin/stdout')
+    args = parser.parse_args()
+
+    service = SolveService(args.workers, args.max_pending, args.cache_size)
+    try:
+        if args.socket is None:
+            serve_stream(service, sys.stdin, sys.stdout)
+            return
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                serve_stream(service,
+                             io.TextIOWrapper(self.rfile, encoding='utf-8'),
+                             io.TextIOWrapper(self.wfile, encoding='utf-8', write_through=True))
+
+        if os.path.exists(args.socket):
+            os.remove(args.socket)
+        with socketserver.ThreadingUnixStreamServer(args.socket, Handler) as server:
+            print(f"Listening on {args.socket}", file=sys.stderr)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+    finally:
+        service.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,73 +1,173 @@
-
 import sys
 import os
+import time
 import argparse
-from src.model.tsp_model import TSPInstance
-from src.exact.branch_and_bound import BranchAndBoundSolver
-# from src.metaheuristics.grasp import GraspSolver # TODO: Add other solvers as needed
-# from src.constructive.nearest_neighbor import ConstructiveSolver
-from src.grasp.grasp_solver import GRASPSolver
-from src.constructive.nearest_neighbor import ConstructiveSolver
-from src.local_search.two_opt import LocalSearchSolver
+from src.model.reordering import ORDERINGS, reorder, to_original, to_reordered
+from src.model.tsp_model import Solution, load_instance
+from src.registry import SOLVERS, available_solvers, create_solver, get_spec, parse_params
 
-def main():
-    if len(sys.argv) < 3:
-        print("Usage: python solve.py <instance_file> <method>")
+def build_parser() -> argparse.ArgumentParser:
+    epilog = "Methods:\n" + "\n".join(
+        f"  {name:<14} {spec.description}" + "".join(
+            f"\n      {param}={p.default!r}: {p.help}" for param, p in spec.params.items()
+        )
+        for name, spec in SOLVERS.items()
+    )
+    parser = argparse.ArgumentParser(
+        description="Solve a TSP instance with one of the registered methods",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=epilog,
+    )
+    parser.add_argument("instance_file", nargs="?", help="instance file (.in)")
+    parser.add_argument("method", nargs="?", choices=available_solvers(), help="solving method")
+    parser.add_argument("--param", "-p", action="append", default=[], metavar="KEY=VALUE",
+                        help="solver parameter, may be repeated (e.g. -p alpha=0.3)")
+    # Same as profiling.PROFILE_MODES, which is only imported with --profile (it slows start-up)
+    parser.add_argument("--profile", choices=("cprofile", "sample"),
+                        help="profile the run (cProfile or stack sampling) and record peak memory")
+    parser.add_argument("--profile-dir", default="report/profiles",
+                        help="directory for the profile files (default: report/profiles)")
+    parser.add_argument("--warm-start", nargs="?", const="previous", metavar="PATH",
+                        help="start from the tour of an .out file (default: this method's previous output)")
+    parser.add_argument("--reorder", nargs="?", const="auto", choices=["auto"] + list(ORDERINGS),
+                        help="renumber the cities for memory locality before solving (default: auto, "
+                             "hilbert for coordinates, rcm for matrices); the output uses the original numbers")
+    parser.add_argument("--checkpoint", metavar="PATH",
+                        help="save the search state to PATH periodically and resume from it if it exists "
+                             "(grasp, exact)")
+    parser.add_argument("--checkpoint-interval", type=float, default=60.0,
+                        help="seconds between checkpoint saves (default: 60)")
+    batch = parser.add_argument_group("batch mode")
+    batch.add_argument("--batch", nargs="+", metavar="PATH",
+                       help="instance files, directories or glob patterns (e.g. 'instances/new_instances/*.in')")
+    batch.add_argument("--methods", nargs="+", choices=available_solvers(), help="methods to run on every instance")
+    batch.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes (default: CPU count)")
+    batch.add_argument("--output-dir", default=".", help="directory for the .out files (default: current directory)")
+    return parser
+
+def batch_params(methods, assignments):
+    """In batch mode each -p option goes to the methods that accept it."""
+    params = {method: [] for method in methods}
+    for assignment in assignments:
+        key = assignment.partition("=")[0].strip().replace("-", "_")
+        targets = [m for m in methods if key in get_spec(m).params]
+        if not targets:
+            raise ValueError(f"Parameter '{key}' is not accepted by any of: {', '.join(methods)}")
+        for method in targets:
+            params[method].append(assignment)
+    return {method: parse_params(method, params[method]) for method in methods}
+
+def run_batch_mode(args):
+    # Imported here so that single-instance runs do not load the pool machinery
+    from src.runtime.batch import BatchJob, expand_instances, print_summary, run_batch
+
+    if not args.methods:
+        print("Error: --batch requires --methods")
+        sys.exit(1)
+    files = expand_instances(args.batch)
+    if not files:
+        print(f"Error: no instance found for {' '.join(args.batch)}")
         sys.exit(1)
+    try:
+        params = batch_params(args.methods, args.param)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    jobs = [BatchJob(f, method, params[method], args.output_dir) for f in files for method in args.methods]
+    print(f"Running {len(jobs)} jobs ({len(files)} instances x {len(args.methods)} methods) on {args.workers} workers...")
+    start = time.perf_counter()
+    results = run_batch(jobs, args.workers)
+    print_summary(results, time.perf_counter() - start)
+    if any(row["status"] != "completed" for row in results):
+        sys.exit(1)
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.batch:
+        run_batch_mode(args)
+        return
+    if not args.instance_file or not args.method:
+        parser.error("instance_file and method are required (or use --batch PATH... --methods METHOD...)")
 
-    instance_file = sys.argv[1]
-    method = sys.argv[2]
+    instance_file = args.instance_file
+    method = args.method
 
     if not os.path.exists(instance_file):
         print(f"Error: File '{instance_file}' not found.")
         sys.exit(1)
 
+    base_name = os.path.splitext(os.path.basename(instance_file))[0]
+    output_filename = f"{base_name}_{method}.out"
+
+    try:
+        params = parse_params(method, args.param)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if args.warm_start:
+        if "initial_solution" not in get_spec(method).params:
+            print(f"Error: {method} does not accept a warm start")
+            sys.exit(1)
+        warm_start = output_filename if args.warm_start == "previous" else args.warm_start
+        if os.path.exists(warm_start):
+            params["initial_solution"] = warm_start
+            print(f"Warm start from {warm_start}")
+        elif args.warm_start == "previous":
+            print(f"No previous solution ({warm_start}), starting from scratch")
+        else:
+            print(f"Error: File '{warm_start}' not found.")
+            sys.exit(1)
+
     try:
-        instance = TSPInstance(instance_file)
+        instance = load_instance(instance_file)
     except Exception as e:
         print(f"Error loading instance: {e}")
         sys.exit(1)
 
-    solver = None
-    if method == "exact":
-        solver = BranchAndBoundSolver(instance)
-    elif method == "constructive":
-        solver = ConstructiveSolver(instance)
-    elif method == "local_search":
-        solver = LocalSearchSolver(instance)
-<<<<<<< HEAD
-    # elif method == "grasp":
-    #     solver = GraspSolver(instance)
-=======
-    elif method == "grasp":
-        solver = GRASPSolver(instance)
->>>>>>> 51d6dab (Ajout du projet et fichiers principaux)
-    else:
-        print(f"Unknown method: {method}")
+    order = None
+    if args.reorder:
+        start = time.perf_counter()
+        try:
+            # A warm start tour is numbered like the instance file
+            if isinstance(params.get("initial_solution"), str):
+                params["initial_solution"] = Solution.from_file(params["initial_solution"], instance).tour
+            instance, order = reorder(instance, args.reorder)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        if "initial_solution" in params:
+            params["initial_solution"] = to_reordered(params["initial_solution"], order)
+        print(f"Cities renumbered ({args.reorder}) in {time.perf_counter() - start:.3f}s")
+
+    try:
+        solver = create_solver(method, instance, **params)
+        if args.checkpoint:
+            solver.enable_checkpoint(args.checkpoint, args.checkpoint_interval)
+    except ValueError as e:
+        print(f"Error: {e}")
         sys.exit(1)
+    if args.checkpoint and os.path.exists(args.checkpoint):
+        print(f"Resuming from checkpoint {args.checkpoint}")
 
     print(f"Solving {instance.filename} with {method}...")
-    solution = solver.solve()
+    if args.profile:
+        from src.benchmarking.profiling import profile_call, profile_prefix
+        prefix = profile_prefix(args.profile_dir, instance_file, method, args.profile)
+        solution, profile = profile_call(solver.solve, prefix, args.profile,
+                                         description={"instance": instance_file, "method": method,
+                                                      "params": args.param})
+        print(f"Profile written to {', '.join(profile['files'])} "
+              f"(peak memory {profile['peak_memory_bytes'] / 2**20:.1f} MiB)")
+    else:
+        solution = solver.solve()
     print("Done.")
+    if order is not None:
+        solution = Solution(to_original(solution.tour, order), solution.cost, solution.stats)
 
     # Output file generation
-    base_name = os.path.splitext(os.path.basename(instance_file))[0]
-    output_filename = f"{base_name}_{method}.out"
-    
-    with open(output_filename, 'w') as f:
-        # Line 1: Vertex numbers separated by space (1-based index usually for TSP provided solutions, 
-        # but the request says "numbers of vertices... representing order". 
-        # The input file uses index implicitly 0..N-1. But often output expects 0..N-1 or 1..N.
-        # Let's check the example in the prompt description carefully.
-        # The prompt says: "La première ligne contient les numéros des sommets séparés par un espace".
-        # It doesn't specify 0-based or 1-based. 
-        # Looking at valid TSP formats (TSPLIB), usually 1-based.
-        # However, looking at the input file `17.in`, the first line is N=17. 
-        # Let's stick to 0-based for now as it matches Python indices, or 1-based if standard. 
-        # "2. 0 633..." -> typical distance matrix. 
-        # I will assume 0-indexed as per `tsp_model.py` implementation.
-        f.write(" ".join(map(str, solution.tour)) + "\n")
-        f.write(str(solution.cost) + "\n")
+    solution.write(output_filename)
 
     print(f"Solution written to {output_filename}")
     print(f"Tour: {solution.tour}")
@@ -0,0 +1,192 @@
+
+import math
+import random
+import time
+from typing import List, Optional
+from ..model.tsp_model import Solver, Solution, TSPInstance, InitialSolution, load_initial_solution
+from ..constructive.nearest_neighbor import ConstructiveSolver
+from ..local_search.two_opt import LocalSearchSolver, reverse_segment
+
+# Moves between two clock reads / temperature updates
+CHECK_INTERVAL = 1000
+# Random moves sampled to calibrate the starting temperature
+CALIBRATION_MOVES = 500
+
+class SimulatedAnnealingSolver(Solver):
+    """
+    Simulated annealing on an array tour. Moves are 2-opt and Or-opt moves
+    towards a random neighbour-list city; each one is evaluated in O(1) from
+    the few edges it changes. The temperature decreases geometrically from
+    an auto-calibrated T0 over the time budget (or over max_moves).
+    """
+
+    def __init__(self, instance: TSPInstance, time_limit: Optional[float] = 1.0,
+                 max_moves: Optional[int] = None, neighbor_list_size: int = 10,
+                 or_opt_probability: float = 0.3, initial_acceptance: float = 0.3,
+                 final_acceptance: float = 1e-4, initial_solution: InitialSolution = None,
+                 seed: Optional[int] = None):
+        super().__init__(instance)
+        if time_limit is None and max_moves is None:
+            raise ValueError("SimulatedAnnealingSolver needs time_limit or max_moves")
+        # T0 and T_final are -delta / log(p): p in (0, 1), and T_final below T0
+        if not 0 < final_acceptance < initial_acceptance < 1:
+            raise ValueError("SimulatedAnnealingSolver needs 0 < final_acceptance < initial_acceptance < 1")
+        self.time_limit = time_limit
+        self.max_moves = max_moves
+        self.neighbor_list_size = neighbor_list_size
+        self.or_opt_probability = or_opt_probability
+        self.initial_acceptance = initial_acceptance
+        self.final_acceptance = final_acceptance
+        self.initial_solution = load_initial_solution(instance, initial_solution)
+        self.rng = random.Random(seed)
+
+    def solve(self) -> Solution:
+        start_time = time.perf_counter()
+        n = self.instance.n
+        local_search = self.instrument(LocalSearchSolver(self.instance, neighbor_list_size=self.neighbor_list_size))
+
+        start = self.initial_solution or self.instrument(ConstructiveSolver(self.instance)).solve()
+        if n < 8:
+            return local_search.two_opt(start.tour, start.cost)
+
+        tour = start.tour[:]
+        cost = start.cost
+        positions = [0] * n
+        for i, city in enumerate(tour):
+            positions[city] = i
+        self._tour = tour
+        self._positions = positions
+        self._neighbors = self.instance.neighbor_lists(self.neighbor_list_size)
+
+        with self.phase("calibration"):
+            t_initial, t_final = self._calibrate()
+        temperature = t_initial
+        best_tour = tour[:]
+        best_cost = cost
+        moves = accepted = 0
+        reported_cost = best_cost
+        rng = self.rng
+
+        with self.phase("annealing"):
+            while True:
+                if moves % CHECK_INTERVAL == 0:
+                    progress = self._progress(moves, start_time)
+                    if progress >= 1.0 or self.stop_requested():
+                        break
+                    # Incumbents are reported at most once per check interval
+                    if best_cost < reported_cost:
+                        reported_cost = best_cost
+                        self.report_incumbent(best_tour, best_cost)
+                    temperature = t_initial * (t_final / t_initial) ** progress
+                moves += 1
+
+                move = self._sample_move()
+                if move is None:
+                    continue
+                delta = move[0]
+                if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+                    self._apply(move)
+                    cost += delta
+                    accepted += 1
+                    if cost < best_cost:
+                        best_cost = cost
+                        best_tour = tour[:]
+
+        # Quench: the best tour seen is not necessarily a 2-opt local optimum
+        with self.phase("quench"):
+            best = local_search.two_opt_neighbors(best_tour, best_cost)
+        self.count("moves_sampled", moves)
+        self.count("moves_accepted", accepted)
+        if best.cost < reported_cost:
+            self.report_incumbent(best.tour, best.cost)
+        best.stats.update({
+            "moves": moves,
+            "accepted": accepted,
+            "initial_temperature": t_initial,
+            "final_temperature": temperature,
+            "elapsed": time.perf_counter() - start_time,
+        })
+        return best
+
+    def _progress(self, moves: int, start_time: float) -> float:
+        progress = 0.0
+        if self.time_limit is not None:
+            progress = (time.perf_counter() - start_time) / self.time_limit if self.time_limit > 0 else 1.0
+        if self.max_moves is not None:
+            progress = max(progress, moves / self.max_moves)
+        return progress
+
+    def _calibrate(self):
+        # T such that an average uphill move is accepted with the given probability
+        uphill = []
+        for _ in range(CALIBRATION_MOVES):
+            move = self._sample_move()
+            if move is not None and move[0] > 0:
+                uphill.append(move[0])
+        average = sum(uphill) / len(uphill) if uphill else 1.0
+        t_initial = -average / math.log(self.initial_acceptance)
+        t_final = -average / math.log(self.final_acceptance)
+        return t_initial, t_final
+
+    def _sample_move(self):
+        """A random move as (delta, kind, cities...), or None if degenerate."""
+        tour = self._tour
+        positions = self._positions
+        n = len(tour)
+        distance = self.instance.distance
+        a = self.rng.randrange(n)
+        c = self.rng.choice(self._neighbors[a])
+        pos_a = positions[a]
+        pos_c = positions[c]
+
+        if self.rng.random() >= self.or_opt_probability:
+            # 2-opt: remove (a, b) and (c, d), add (a, c) and (b, d)
+            if self.rng.random() < 0.5:
+                b = tour[(pos_a + 1) % n]
+                d = tour[(pos_c + 1) % n]
+            else:
+                b = tour[pos_a - 1]
+                d = tour[pos_c - 1]
+            if c == b or d == a:
+                return None
+            delta = distance(a, c) + distance(b, d) - distance(a, b) - distance(c, d)
+            return (delta, "2opt", a, b, c, d)
+
+        # Or-opt: move the segment a..e (1 to 3 cities) between c and d
+        length = self.rng.randint(1, 3)
+        if (pos_c - pos_a) % n < length:
+            return None  # c inside the segment
+        e = tour[(pos_a + length - 1) % n]
+        p = tour[pos_a - 1]
+        q = tour[(pos_a + length) % n]
+        d = tour[(pos_c + 1) % n]
+        if c == p:
+            return None
+        removed = distance(p, a) + distance(e, q) + distance(c, d)
+        forward = distance(c, a) + distance(e, d)
+        backward = distance(c, e) + distance(a, d)
+        delta = distance(p, q) + min(forward, backward) - removed
+        return (delta, "oropt", a, e, p, q, c, d, forward < backward)
+
+    def _two_opt_move(self, t1: int, t2: int, t3: int, t4: int):
+        # Remove (t1, t2) and (t3, t4), add (t1, t3) and (t2, t4)
+        tour = self._tour
+        positions = self._positions
+        if tour[(positions[t1] + 1) % len(tour)] == t2:
+            reverse_segment(tour, positions, positions[t2], positions[t3])
+        else:
+            reverse_segment(tour, positions, positions[t3], positions[t2])
+
+    def _apply(self, move):
+        if move[1] == "2opt":
+            _, _, a, b, c, d = move
+            self._two_opt_move(a, b, c, d)
+            return
+
+        # Or-opt as a sequence of 2-opt moves:
+        # p a..e q ... c d -> p c ... q e..a d -> p q ... c e..a d [-> p q ... c a..e d]
+        _, _, a, e, p, q, c, d, keep_orientation = move
+        self._two_opt_move(p, a, c, d)
+        self._two_opt_move(p, c, q, e)
+        if keep_orientation:
+            self._two_opt_move(c, e, a, d)
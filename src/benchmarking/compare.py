@@ -0,0 +1,176 @@
+
+"""
+Compare two benchmark result sets and flag regressions.
+
+Both sides can be harness outputs (<prefix>_runs.csv or <prefix>.json, one
+row per run) or the historical wide tables (Instance, Size, <X>_Cost,
+<X>_Time, one run per cell). Cells with at least two runs on both sides are
+tested with a one-sided Mann-Whitney U test (normal approximation with tie
+correction); single-run cells can only be checked against the threshold.
+"""
+
+import csv
+import json
+import math
+import statistics
+from typing import Dict, List, Optional, Tuple
+
+# Wide-table column prefixes and the harness case labels they correspond to
+WIDE_CASES = {"Constructive": "constructive", "LocalSearch": "local_search", "GRASP": "grasp", "Exact": "exact"}
+METRICS = ("time", "cost")
+
+Samples = Dict[Tuple[str, str, str], List[float]]
+
+def _number(value) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+def _add_long_rows(rows, samples: Samples):
+    for row in rows:
+        if row.get("status", "completed") != "completed":
+            continue
+        for metric in METRICS:
+            value = _number(row.get(metric))
+            if value is not None:
+                samples.setdefault((row["instance"], row["case"], metric), []).append(value)
+
+def _add_wide_rows(rows, samples: Samples):
+    for row in rows:
+        for column, text in row.items():
+            prefix, _, suffix = column.rpartition("_")
+            if suffix.lower() not in METRICS:
+                continue
+            value = _number(text)
+            if value is not None:
+                case = WIDE_CASES.get(prefix, prefix.lower())
+                samples.setdefault((row["Instance"], case, suffix.lower()), []).append(value)
+
+def load_samples(path: str) -> Samples:
+    """Per (instance, case, metric) list of measured values."""
+    samples: Samples = {}
+    if path.endswith(".json"):
+        with open(path) as f:
+            _add_long_rows(json.load(f)["runs"], samples)
+        return samples
+
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        fields = reader.fieldnames or []
+        if "case" in fields and "instance" in fields:
+            _add_long_rows(reader, samples)
+        elif "Instance" in fields:
+            _add_wide_rows(reader, samples)
+        else:
+            raise ValueError(f"{path}: unrecognised benchmark result format")
+    return samples
+
+def mann_whitney_greater(baseline: List[float], current: List[float]) -> float:
+    """One-sided p-value for 'current tends to be larger than baseline'."""
+    n1, n2 = len(baseline), len(current)
+    values = sorted([(v, 0) for v in baseline] + [(v, 1) for v in current])
+    total = n1 + n2
+
+    # Average ranks over ties
+    rank_sum = 0.0
+    tie_term = 0.0
+    i = 0
+    while i < total:
+        j = i
+        while j + 1 < total and values[j + 1][0] == values[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        rank_sum += rank * sum(values[k][1] for k in range(i, j + 1))
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+
+    u = rank_sum - n2 * (n2 + 1) / 2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0  # every value tied
+    z = (u - mean - 0.5) / math.sqrt(variance)  # continuity correction
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def compare(baseline: Samples, current: Samples, alpha: float = 0.05,
+            thresholds: Optional[Dict[str, float]] = None) -> List[Dict]:
+    """
+    One entry per (instance, case, metric) present on both sides. A cell is a
+    regression when the median grows by more than the metric threshold
+    (relative) and, when both sides have repeated runs, the increase is
+    significant at level alpha.
+    """
+    thresholds = thresholds or {"time": 0.05, "cost": 0.0}
+    results = []
+    for key in sorted(set(baseline) & set(current)):
+        before, after = baseline[key], current[key]
+        median_before = statistics.median(before)
+        median_after = statistics.median(after)
+        if median_before:
+            change = (median_after - median_before) / abs(median_before)
+        else:
+            change = 0.0 if median_after == median_before else math.inf
+        # p-value of the observed direction of change
+        p_value = None
+        if len(before) >= 2 and len(after) >= 2:
+            if change < 0:
+                p_value = mann_whitney_greater(after, before)
+            else:
+                p_value = mann_whitney_greater(before, after)
+        significant = p_value is None or p_value < alpha
+
+        if change > thresholds[key[2]] and significant:
+            verdict = "regression"
+        elif change < -thresholds[key[2]] and significant:
+            verdict = "improvement"
+        else:
+            verdict = "unchanged"
+        results.append({
+            "instance": key[0], "case": key[1], "metric": key[2],
+            "baseline_runs": len(before), "current_runs": len(after),
+            "baseline_median": median_before, "current_median": median_after,
+            "change": change, "p_value": p_value, "verdict": verdict,
+        })
+    return results
+
+def print_report(results: List[Dict]):
+    print(f"{'Instance':<12} {'Case':<14} {'Metric':<6} {'Baseline':>12} {'Current':>12} "
+          f"{'Change':>9} {'p-value':>8}  Verdict")
+    print("-" * 90)
+    for r in results:
+        p_value = f"{r['p_value']:.4f}" if r["p_value"] is not None else "n/a"
+        print(f"{r['instance']:<12} {r['case']:<14} {r['metric']:<6} {r['baseline_median']:>12.6g} "
+              f"{r['current_median']:>12.6g} {r['change']:>+8.1%} {p_value:>8}  {r['verdict']}")
+    regressions = sum(r["verdict"] == "regression" for r in results)
+    improvements = sum(r["verdict"] == "improvement" for r in results)
+    print(f"\n{len(results)} cells compared: {regressions} regressions, {improvements} improvements")
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Compare a benchmark run against a baseline; exits with 1 on regressions")
+    parser.add_argument("baseline", help="baseline results (*_runs.csv, *.json or a wide *_results.csv)")
+    parser.add_argument("current", help="results to check, same formats")
+    parser.add_argument("--alpha", type=float, default=0.05, help="significance level (default: 0.05)")
+    parser.add_argument("--time-threshold", type=float, default=0.05,
+                        help="relative median time increase tolerated (default: 0.05)")
+    parser.add_argument("--cost-threshold", type=float, default=0.0,
+                        help="relative median cost increase tolerated (default: 0)")
+    parser.add_argument("--metrics", nargs="+", choices=METRICS, default=list(METRICS),
+                        help="metrics to check (default: time cost)")
+    args = parser.parse_args(argv)
+
+    baseline = load_samples(args.baseline)
+    current = load_samples(args.current)
+    results = [r for r in compare(baseline, current, args.alpha,
+                                  {"time": args.time_threshold, "cost": args.cost_threshold})
+               if r["metric"] in args.metrics]
+    if not results:
+        print("No (instance, case) in common between the two result sets")
+        return 2
+    print_report(results)
+    return 1 if any(r["verdict"] == "regression" for r in results) else 0
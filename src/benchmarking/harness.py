@@ -0,0 +1,433 @@
+
+"""
+Benchmark harness shared by the benchmark scripts.
+
+Every (instance, case) pair gets warm-up runs that are not recorded, then
+`repeats` timed runs per seed. Only `solve()` is timed: instances are loaded
+once, before any run. Each run is one row of a long-format table; the rows
+are summarised per (instance, case) with median, IQR and minimum of time and
+cost, and written as CSV and JSON together with machine metadata.
+"""
+
+import csv
+import gc
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from ..model.tsp_model import TSPInstance, load_instance
+from ..registry import create_solver, get_spec
+from .profiling import PROFILE_MODES, profile_call, profile_prefix
+
+RUN_FIELDS = ["instance", "size", "case", "method", "seed", "repeat", "cost", "time", "status"]
+SUMMARY_FIELDS = ["instance", "size", "case", "method", "runs", "errors",
+                  "cost_median", "cost_iqr", "cost_min", "time_median", "time_iqr", "time_min"]
+
+class BenchmarkCase:
+    """
+    One algorithm configuration. `params` is a dict or a function of the
+    instance size returning one. `initial_method` names a solver whose result
+    is passed as initial_solution; it runs before the timer starts.
+    """
+
+    def __init__(self, label: str, method: str,
+                 params: Union[Dict[str, Any], Callable[[int], Dict[str, Any]], None] = None,
+                 max_size: Optional[int] = None, initial_method: Optional[str] = None,
+                 repeats: Optional[int] = None, warmup: Optional[int] = None):
+        self.label = label
+        self.method = method
+        self.params = params or {}
+        self.max_size = max_size
+        self.initial_method = initial_method
+        self.repeats = repeats
+        self.warmup = warmup
+
+    def params_for(self, n: int) -> Dict[str, Any]:
+        return dict(self.params(n) if callable(self.params) else self.params)
+
+    def seeded(self) -> bool:
+        return "seed" in get_spec(self.method).params
+
+class RunCheckpoint:
+    """
+    Append-only log of completed (instance, case, seed) cells, one JSON line
+    per cell with its run rows. A resumed campaign reuses the logged rows and
+    only runs the missing cells; a cell interrupted midway runs again.
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        self.path = path
+        self.cells: Dict[tuple, List[Dict[str, Any]]] = {}
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if not resume:
+            # Never overwrite the runs of an interrupted campaign by accident
+            if os.path.exists(path) and os.path.getsize(path) > 0:
+                raise FileExistsError(f"{path} holds the runs of an interrupted campaign: "
+                                      f"use --resume to reuse them or --fresh to discard them")
+            return
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # partial last line of a killed run
+                    self.cells[tuple(entry["cell"])] = entry["rows"]
+        # Rewritten without a possibly truncated last line
+        with open(path, "w") as f:
+            for cell, rows in self.cells.items():
+                f.write(json.dumps({"cell": list(cell), "rows": rows}) + "\n")
+
+    def completed(self, instance_name: str, label: str, seed: Optional[int],
+                  repeats: int) -> Optional[List[Dict[str, Any]]]:
+        rows = self.cells.get((instance_name, label, seed))
+        return rows if rows is not None and len(rows) == repeats else None
+
+    def record(self, instance_name: str, label: str, seed: Optional[int], rows: List[Dict[str, Any]]):
+        self.cells[(instance_name, label, seed)] = rows
+        with open(self.path, "a") as f:
+            f.write(json.dumps({"cell": [instance_name, label, seed], "rows": rows}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+def pin_cpus(cpus: Optional[Sequence[int]]) -> Optional[List[int]]:
+    """Restrict this process to the given CPUs (Linux only); returns the affinity in use."""
+    if not hasattr(os, "sched_getaffinity"):
+        return None
+    if cpus:
+        os.sched_setaffinity(0, set(cpus))
+    return sorted(os.sched_getaffinity(0))
+
+def _git_commit() -> Optional[str]:
+    try:
+        output = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                timeout=5, cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
+
+def machine_metadata() -> Dict[str, Any]:
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    clock = time.get_clock_info("perf_counter")
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "hostname": socket.gethostname(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "cpu_affinity": pin_cpus(None),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "numpy": numpy_version,
+        "clock_resolution": clock.resolution,
+        "git_commit": _git_commit(),
+    }
+
+def _with_seed(params: Dict[str, Any], seed: Optional[int]) -> Dict[str, Any]:
+    return dict(params, seed=seed) if seed is not None else params
+
+def _timed_run(instance: TSPInstance, case: BenchmarkCase, params: Dict[str, Any],
+               instrument: bool = False):
+    gc.collect()
+    solver = create_solver(case.method, instance, **params)
+    if instrument:
+        solver.enable_instrumentation()
+    start = time.perf_counter()
+    solution = solver.solve()
+    return solution, time.perf_counter() - start, solver.instrumentation
+
+def instrumentation_columns(instrumentation) -> Dict[str, Any]:
+    """Flat run-row columns: t_<phase> seconds, n_<counter>, incumbent count and time to best."""
+    data = instrumentation.as_dict()
+    columns = {f"t_{name}": seconds for name, seconds in data["timers"].items()}
+    columns.update({f"n_{name}": value for name, value in data["counters"].items()})
+    columns["incumbents"] = len(data["incumbents"])
+    columns["time_to_best"] = data["incumbents"][-1][0] if data["incumbents"] else None
+    # Kept out of the CSV (not a scalar), written to the JSON rows
+    columns["incumbent_history"] = data["incumbents"]
+    return columns
+
+def run_case(instance: TSPInstance, instance_name: str, case: BenchmarkCase,
+             repeats: int = 5, seeds: Sequence[Optional[int]] = (0,), warmup: int = 1,
+             verbose: bool = True, instrument: bool = False, profile: Optional[str] = None,
+             profile_dir: str = "report/profiles",
+             checkpoint: Optional[RunCheckpoint] = None) -> List[Dict[str, Any]]:
+    """
+    Warm-up then timed runs of one case on one instance; returns the run rows.
+    With `instrument`, rows also get the solver instrumentation columns (and
+    the times include its overhead). With `profile`, one extra untimed run
+    is profiled into `profile_dir`. Seeds already in `checkpoint` are not run
+    again.
+    """
+    if not case.seeded():
+        seeds = [None]  # deterministic solver: repeats only measure time
+    repeats = case.repeats if case.repeats is not None else repeats
+    warmup = case.warmup if case.warmup is not None else warmup
+
+    rows = []
+    pending = []
+    for seed in seeds:
+        done = checkpoint.completed(instance_name, case.label, seed, repeats) if checkpoint else None
+        if done is None:
+            pending.append(seed)
+            continue
+        rows.extend(done)
+        if verbose:
+            print(f"    {case.label} seed={seed}: {repeats} runs from checkpoint")
+    if not pending and not profile:
+        return rows
+
+    params = case.params_for(instance.n)
+    if case.initial_method:
+        params["initial_solution"] = create_solver(case.initial_method, instance).solve()
+    for _ in range(warmup if pending else 0):
+        try:
+            _timed_run(instance, case, _with_seed(params, pending[0]))
+        except Exception:
+            break  # reported by the timed runs
+    for seed in pending:
+        run_params = _with_seed(params, seed)
+        seed_rows = []
+        for repeat in range(repeats):
+            row = {"instance": instance_name, "size": instance.n, "case": case.label,
+                   "method": case.method, "seed": seed, "repeat": repeat,
+                   "cost": None, "time": None, "status": "completed"}
+            try:
+                solution, elapsed, instrumentation = _timed_run(instance, case, run_params, instrument)
+                row["cost"] = solution.cost
+                row["time"] = elapsed
+                if instrumentation is not None:
+                    row.update(instrumentation_columns(instrumentation))
+            except Exception as e:
+                row["status"] = f"error: {e}"
+            seed_rows.append(row)
+            if verbose:
+                if row["status"] == "completed":
+                    print(f"    {case.label} seed={seed} #{repeat}: {row['cost']} ({row['time']:.4f}s)")
+                else:
+                    print(f"    {case.label} seed={seed} #{repeat}: {row['status']}")
+        rows.extend(seed_rows)
+        if checkpoint is not None:
+            checkpoint.record(instance_name, case.label, seed, seed_rows)
+
+    if profile:
+        solver = create_solver(case.method, instance, **_with_seed(params, seeds[0]))
+        prefix = profile_prefix(profile_dir, instance_name, case.label, profile)
+        try:
+            _, summary = profile_call(solver.solve, prefix, profile,
+                                      description={"instance": instance_name, "case": case.label,
+                                                   "method": case.method, "seed": seeds[0]})
+            if verbose:
+                print(f"    {case.label} profile: {prefix}.* "
+                      f"(peak memory {summary['peak_memory_bytes'] / 2**20:.1f} MiB)")
+        except Exception as e:
+            print(f"    {case.label} profile failed: {e}")
+    return rows
+
+def run_benchmark(instance_files: Sequence[str], cases: Sequence[BenchmarkCase], repeats: int = 5,
+                  seeds: Sequence[Optional[int]] = (0,), warmup: int = 1, max_size: Optional[int] = None,
+                  verbose: bool = True, instrument: bool = False, profile: Optional[str] = None,
+                  profile_dir: str = "report/profiles", checkpoint: Optional[RunCheckpoint] = None):
+    """Run every case on every instance; returns (run rows, per-instance info)."""
+    rows = []
+    instances = {}
+    for instance_file in instance_files:
+        name = os.path.basename(instance_file)
+        start = time.perf_counter()
+        try:
+            instance = load_instance(instance_file)
+        except Exception as e:
+            print(f"Skipping {name}: {e}")
+            continue
+        instances[name] = {"size": instance.n, "load_time": time.perf_counter() - start}
+        if max_size is not None and instance.n > max_size:
+            if verbose:
+                print(f"Skipping {name} (Size {instance.n} > {max_size})")
+            continue
+
+        if verbose:
+            print(f"\nProcessing {name} (Size: {instance.n})...")
+        for case in cases:
+            if case.max_size is not None and instance.n > case.max_size:
+                if verbose:
+                    print(f"    {case.label}: skipped (N={instance.n} > {case.max_size})")
+                continue
+            rows.extend(run_case(instance, name, case, repeats, seeds, warmup, verbose, instrument,
+                                 profile, profile_dir, checkpoint))
+    return rows, instances
+
+def _quartiles(values: List[float]):
+    if len(values) < 2:
+        return values[0], values[0]
+    q1, _, q3 = statistics.quantiles(values, n=4, method="inclusive")
+    return q1, q3
+
+def summarize(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Median, IQR and min of cost and time per (instance, case), in first-seen order."""
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault((row["instance"], row["case"]), []).append(row)
+
+    summary = []
+    for group in groups.values():
+        completed = [row for row in group if row["status"] == "completed"]
+        entry = {field: group[0][field] for field in ("instance", "size", "case", "method")}
+        entry["runs"] = len(completed)
+        entry["errors"] = len(group) - len(completed)
+        for metric in ("cost", "time"):
+            values = sorted(row[metric] for row in completed)
+            if values:
+                q1, q3 = _quartiles(values)
+                entry[f"{metric}_median"] = statistics.median(values)
+                entry[f"{metric}_iqr"] = q3 - q1
+                entry[f"{metric}_min"] = values[0]
+            else:
+                entry[f"{metric}_median"] = entry[f"{metric}_iqr"] = entry[f"{metric}_min"] = None
+        summary.append(entry)
+    return summary
+
+def _write_csv(path: str, fieldnames: List[str], rows: List[Dict[str, Any]]):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+def write_results(prefix: str, rows: List[Dict[str, Any]], summary: List[Dict[str, Any]],
+                  metadata: Dict[str, Any]) -> List[str]:
+    """Write <prefix>_runs.csv, <prefix>_summary.csv and <prefix>.json; returns the paths."""
+    directory = os.path.dirname(prefix)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    paths = [f"{prefix}_runs.csv", f"{prefix}_summary.csv", f"{prefix}.json"]
+    extra = sorted({key for row in rows for key in row} - set(RUN_FIELDS) - {"incumbent_history"})
+    _write_csv(paths[0], RUN_FIELDS + extra, rows)
+    _write_csv(paths[1], SUMMARY_FIELDS, summary)
+    with open(paths[2], "w") as f:
+        json.dump({"metadata": metadata, "runs": rows, "summary": summary}, f, indent=2)
+    return paths
+
+def wide_rows(summary: List[Dict[str, Any]], instances: Dict[str, Dict[str, Any]],
+              columns: Dict[str, str], missing: Any = "N/A") -> List[Dict[str, Any]]:
+    """
+    One row per instance with <column>_Cost and <column>_Time (medians), the
+    layout of the historical report CSVs. `columns` maps case labels to
+    column prefixes; cases that did not run on an instance get `missing`.
+    """
+    by_key = {(entry["instance"], entry["case"]): entry for entry in summary}
+    rows = []
+    for name, info in instances.items():
+        if not any(key[0] == name for key in by_key):
+            continue
+        row = {"Instance": name, "Size": info["size"]}
+        for label, prefix in columns.items():
+            entry = by_key.get((name, label))
+            ok = entry is not None and entry["runs"] > 0
+            row[f"{prefix}_Cost"] = entry["cost_median"] if ok else missing
+            row[f"{prefix}_Time"] = entry["time_median"] if ok else missing
+        rows.append(row)
+    return rows
+
+def add_gaps(rows: List[Dict[str, Any]], reference: str, prefixes: Sequence[str]):
+    """Add <prefix>_Gap (% above the <reference>_Cost column), or "" where there is no reference."""
+    for row in rows:
+        best = row.get(f"{reference}_Cost")
+        for prefix in prefixes:
+            cost = row.get(f"{prefix}_Cost")
+            if isinstance(best, (int, float)) and best and isinstance(cost, (int, float)):
+                row[f"{prefix}_Gap"] = (cost - best) / best * 100
+            else:
+                row[f"{prefix}_Gap"] = ""
+
+def write_wide_csv(path: str, fieldnames: List[str], rows: List[Dict[str, Any]]):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    _write_csv(path, fieldnames, rows)
+
+def print_summary(summary: List[Dict[str, Any]]):
+    print(f"\n{'Instance':<12} {'Size':>6} {'Case':<14} {'Runs':>4} {'Cost med':>10} {'Cost IQR':>9} "
+          f"{'Time med':>10} {'Time IQR':>9} {'Time min':>10}")
+    print("-" * 92)
+    for entry in summary:
+        if entry["runs"] == 0:
+            print(f"{entry['instance']:<12} {entry['size']:>6} {entry['case']:<14} {0:>4}  all runs failed")
+            continue
+        print(f"{entry['instance']:<12} {entry['size']:>6} {entry['case']:<14} {entry['runs']:>4} "
+              f"{entry['cost_median']:>10g} {entry['cost_iqr']:>9g} {entry['time_median']:>10.4f} "
+              f"{entry['time_iqr']:>9.4f} {entry['time_min']:>10.4f}")
+
+def add_arguments(parser):
+    """Options shared by the benchmark scripts."""
+    group = parser.add_argument_group("benchmark harness")
+    group.add_argument("--repeats", type=int, default=5, help="timed runs per seed (default: 5)")
+    group.add_argument("--seeds", type=int, nargs="+", default=[0],
+                       help="seeds for the randomized solvers (default: 0)")
+    group.add_argument("--warmup", type=int, default=1, help="untimed warm-up runs (default: 1)")
+    group.add_argument("--cpus", type=int, nargs="+", default=None,
+                       help="pin the benchmark to these CPUs (Linux)")
+    group.add_argument("--instrument", action="store_true",
+                       help="record solver phase timers and counters in the runs CSV (slower runs)")
+    group.add_argument("--profile", choices=PROFILE_MODES, default=None,
+                       help="profile one extra run per instance and case (cProfile or stack sampling)")
+    group.add_argument("--profile-dir", default="report/profiles",
+                       help="directory for the profile files (default: report/profiles)")
+    resume = group.add_mutually_exclusive_group()
+    resume.add_argument("--resume", action="store_true",
+                        help="reuse the runs logged by an interrupted campaign (<prefix>_checkpoint.jsonl)")
+    resume.add_argument("--fresh", action="store_true",
+                        help="discard the runs logged by an interrupted campaign and start over")
+    return group
+
+def run_from_args(args, instance_files: Sequence[str], cases: Sequence[BenchmarkCase], prefix: str,
+                  max_size: Optional[int] = None):
+    """
+    Pin, run, summarise and write the long-format results; returns (summary,
+    instances). Completed cells are logged to <prefix>_checkpoint.jsonl,
+    removed once the results are written.
+    """
+    pin_cpus(args.cpus)
+    metadata = machine_metadata()
+    metadata["config"] = {
+        "repeats": args.repeats, "seeds": args.seeds, "warmup": args.warmup, "max_size": max_size,
+        "instrument": args.instrument, "profile": args.profile,
+        "cases": [{"label": c.label, "method": c.method, "max_size": c.max_size,
+                   "initial_method": c.initial_method} for c in cases],
+    }
+    checkpoint_path = f"{prefix}_checkpoint.jsonl"
+    if args.fresh and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    try:
+        checkpoint = RunCheckpoint(checkpoint_path, resume=args.resume)
+    except FileExistsError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if checkpoint.cells:
+        print(f"Resuming: {len(checkpoint.cells)} completed cells in {checkpoint.path}")
+    start = time.perf_counter()
+    rows, instances = run_benchmark(instance_files, cases, args.repeats, args.seeds, args.warmup, max_size,
+                                    instrument=args.instrument, profile=args.profile,
+                                    profile_dir=args.profile_dir, checkpoint=checkpoint)
+    metadata["elapsed"] = time.perf_counter() - start
+    metadata["instances"] = instances
+    summary = summarize(rows)
+    print_summary(summary)
+    for path in write_results(prefix, rows, summary, metadata):
+        print(f"Results saved to {path}")
+    checkpoint.remove()
+    return summary, instances
@@ -0,0 +1,134 @@
+
+"""
+Profiling of a single solver run.
+
+Two modes:
+- cprofile: deterministic profile, saved as <prefix>.pstats (load it with
+  pstats or snakeviz) plus a text report of the top functions;
+- sample: a background thread samples the solving thread's stack with
+  sys._current_frames(); the samples are saved as <prefix>.collapsed, one
+  "frame;frame;... count" line per distinct stack, the input format of
+  flamegraph.pl and speedscope.
+
+Both also trace allocations with tracemalloc and record the peak. A
+<prefix>.json file keeps the run description, the git commit and the peak
+memory, so profiles can be compared across commits.
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Callable, Dict, Optional, Tuple
+
+PROFILE_MODES = ("cprofile", "sample")
+# Default sampling period; the interpreter switch interval (5 ms) bounds the
+# effective rate while the solver holds the GIL
+SAMPLE_INTERVAL = 0.001
+# Functions listed in the text report of cProfile runs
+TOP_FUNCTIONS = 30
+
+class StackSampler:
+    """Samples the stack of one thread at a fixed period into collapsed-stack counts."""
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+            self.samples += 1
+
+    def write_collapsed(self, filepath: str):
+        with open(filepath, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+def profile_call(func: Callable[[], Any], prefix: str, mode: str = "cprofile",
+                 interval: float = SAMPLE_INTERVAL, description: Optional[Dict[str, Any]] = None
+                 ) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Run func() under the profiler and write <prefix>.* files. Returns the
+    result of func and the profile summary (also written to <prefix>.json).
+    """
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown profile mode: {mode} (available: {', '.join(PROFILE_MODES)})")
+    directory = os.path.dirname(prefix)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    profiler = cProfile.Profile() if mode == "cprofile" else None
+    sampler = StackSampler(threading.get_ident(), interval) if mode == "sample" else None
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        if profiler is not None:
+            result = profiler.runcall(func)
+        else:
+            sampler.start()
+            try:
+                result = func()
+            finally:
+                sampler.stop()
+    finally:
+        elapsed = time.perf_counter() - start
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    files = []
+    if profiler is not None:
+        profiler.dump_stats(f"{prefix}.pstats")
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        with open(f"{prefix}.txt", "w") as f:
+            f.write(report.getvalue())
+        files += [f"{prefix}.pstats", f"{prefix}.txt"]
+    else:
+        sampler.write_collapsed(f"{prefix}.collapsed")
+        files.append(f"{prefix}.collapsed")
+
+    # Imported here: harness imports this module
+    from .harness import machine_metadata
+    summary = {
+        "mode": mode,
+        "elapsed": elapsed,
+        "peak_memory_bytes": peak_memory,
+        "samples": sampler.samples if sampler is not None else None,
+        "files": files,
+        "description": description or {},
+        "metadata": machine_metadata(),
+    }
+    with open(f"{prefix}.json", "w") as f:
+        json.dump(summary, f, indent=2)
+    return result, summary
+
+def profile_prefix(profile_dir: str, *parts: str) -> str:
+    """<profile_dir>/<part>_<part>..., with instance file extensions dropped."""
+    names = [os.path.splitext(os.path.basename(str(part)))[0] for part in parts if part is not None]
+    return os.path.join(profile_dir, "_".join(names))
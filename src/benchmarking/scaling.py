@@ -0,0 +1,150 @@
+
+"""
+Scaling benchmark: times each phase of the pipeline on generated instances
+of log-spaced sizes and fits t = a * n^b per phase by least squares on
+(log n, log t).
+
+Phases run on one freshly loaded instance per repeat, in order, so that
+neighbour lists and the other caches are built by the phase that needs
+them. A phase slower than `phase_limit` seconds is not run on larger sizes.
+"""
+
+import math
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from ..model.generator import generate_instance
+from ..model.tsp_model import TSPInstance
+from ..registry import create_solver
+
+def _load(context):
+    context["instance"] = TSPInstance(context["path"])
+
+def _neighbor_lists(context):
+    context["instance"].neighbor_lists(10)
+
+def _constructive(context):
+    context["initial"] = create_solver("constructive", context["instance"]).solve()
+
+def _local_search(context):
+    create_solver("local_search", context["instance"], initial_solution=context.get("initial")).solve()
+
+def _local_search_neighbors(context):
+    create_solver("local_search", context["instance"], initial_solution=context.get("initial"),
+                  neighbor_list_size=10).solve()
+
+def _grasp(context):
+    create_solver("grasp", context["instance"], max_iterations=5, seed=0).solve()
+
+# Phase name -> function of the shared context; order matters (load first)
+PHASES: Dict[str, Callable[[Dict[str, Any]], None]] = {
+    "load": _load,
+    "neighbor_lists": _neighbor_lists,
+    "constructive": _constructive,
+    "local_search": _local_search,
+    "local_search_nl": _local_search_neighbors,
+    "grasp": _grasp,
+}
+
+def log_sizes(min_size: int, max_size: int, points: int) -> List[int]:
+    """`points` sizes evenly spaced on a log scale, rounded and deduplicated."""
+    if points <= 1:
+        return [max_size]
+    ratio = (max_size / min_size) ** (1 / (points - 1))
+    return sorted({int(round(min_size * ratio ** k)) for k in range(points)})
+
+def fit_exponent(sizes: Sequence[float], times: Sequence[float]) -> Optional[Dict[str, float]]:
+    """Least-squares fit of log t = log a + b log n; returns a, b and R^2."""
+    pairs = [(math.log(n), math.log(t)) for n, t in zip(sizes, times) if t > 0]
+    if len(pairs) < 2:
+        return None
+    xs, ys = zip(*pairs)
+    mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    if sxx == 0:
+        return None
+    b = sum((x - mean_x) * (y - mean_y) for x, y in pairs) / sxx
+    log_a = mean_y - b * mean_x
+    ss_tot = sum((y - mean_y) ** 2 for y in ys)
+    ss_res = sum((y - log_a - b * x) ** 2 for x, y in pairs)
+    return {"a": math.exp(log_a), "exponent": b, "r2": 1 - ss_res / ss_tot if ss_tot else 1.0,
+            "points": len(pairs)}
+
+def run_scaling(families: Sequence[str], sizes: Sequence[int], phases: Sequence[str],
+                repeats: int = 3, seed: int = 0, instance_dir: str = "instances/generated",
+                phase_limit: Optional[float] = 60.0, verbose: bool = True):
+    """Returns (rows, fits): one row per (family, n, phase, repeat), one fit per (family, phase)."""
+    rows = []
+    fits = []
+    for family in families:
+        skipped = set()
+        for n in sizes:
+            path = generate_instance(family, n, seed, instance_dir)
+            if verbose:
+                print(f"{family} n={n}")
+            for repeat in range(repeats):
+                context = {"path": path}
+                for phase in PHASES:
+                    # load always runs: later phases need the instance
+                    if phase != "load" and (phase not in phases or phase in skipped):
+                        continue
+                    start = time.perf_counter()
+                    PHASES[phase](context)
+                    elapsed = time.perf_counter() - start
+                    if phase in phases:
+                        rows.append({"family": family, "n": n, "phase": phase,
+                                     "repeat": repeat, "time": elapsed})
+            for phase in phases:
+                times = [r["time"] for r in rows if (r["family"], r["n"], r["phase"]) == (family, n, phase)]
+                if not times:
+                    continue
+                if verbose:
+                    print(f"    {phase:<16} {statistics.median(times):.4f}s")
+                if phase_limit is not None and statistics.median(times) > phase_limit and phase != "load":
+                    skipped.add(phase)
+                    if verbose:
+                        print(f"    {phase}: over {phase_limit}s, skipped for larger sizes")
+
+        for phase in phases:
+            medians = {}
+            for r in rows:
+                if r["family"] == family and r["phase"] == phase:
+                    medians.setdefault(r["n"], []).append(r["time"])
+            ns = sorted(medians)
+            fit = fit_exponent(ns, [statistics.median(medians[n]) for n in ns])
+            if fit is not None:
+                fits.append(dict({"family": family, "phase": phase}, **fit))
+    return rows, fits
+
+def print_fits(fits: List[Dict[str, Any]]):
+    print(f"\n{'Family':<15} {'Phase':<16} {'Exponent':>9} {'R^2':>6} {'Points':>7}")
+    print("-" * 58)
+    for fit in fits:
+        print(f"{fit['family']:<15} {fit['phase']:<16} {fit['exponent']:>9.2f} {fit['r2']:>6.3f} {fit['points']:>7}")
+
+def plot_scaling(rows: List[Dict[str, Any]], fits: List[Dict[str, Any]], output_path: str):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    families = sorted({r["family"] for r in rows})
+    fig, axes = plt.subplots(1, len(families), figsize=(6 * len(families), 5), squeeze=False)
+    for ax, family in zip(axes[0], families):
+        for fit in (f for f in fits if f["family"] == family):
+            medians = {}
+            for r in rows:
+                if r["family"] == family and r["phase"] == fit["phase"]:
+                    medians.setdefault(r["n"], []).append(r["time"])
+            ns = sorted(medians)
+            ax.plot(ns, [statistics.median(medians[n]) for n in ns], marker="o",
+                    label=f"{fit['phase']} (n^{fit['exponent']:.2f})")
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_xlabel("Number of Cities (n)")
+        ax.set_ylabel("Time (s)")
+        ax.set_title(family)
+        ax.grid(True, which="both", ls="-", alpha=0.2)
+        ax.legend()
+    fig.tight_layout()
+    fig.savefig(output_path)
+    plt.close(fig)
@@ -0,0 +1,275 @@
+
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from ..grasp.tour_merging import ReducedInstance
+from ..local_search.two_opt import LocalSearchSolver
+from ..model.tsp_model import Solver, Solution, TSPInstance, InitialSolution, load_initial_solution
+from ..model.reordering import hilbert_order, nearest_neighbor_order
+from ..registry import create_solver, get_spec
+
+# Neighbour list size given to the sub-problem solvers that accept one
+SUB_NEIGHBORS = 10
+
+class DecompositionSolver(Solver):
+    """
+    Decomposition for large instances:
+    1. the cities are ordered along a space-filling curve (coordinates) or a
+       nearest-neighbour chain (matrices) and cut into clusters of
+       `cluster_size` consecutive cities, visited in the order of a 2-opt
+       tour of one representative city each;
+    2. between consecutive clusters, the closest pair of cities gives the
+       exit of one and the entry of the next;
+    3. every cluster is solved by `method`, in parallel, as a path from its
+       entry to its exit, and the paths are chained;
+    4. neighbour-list 2-opt on the whole tour;
+    5. POPMUSIC-style passes re-optimize windows of `window_size` consecutive
+       tour cities as paths with fixed end points. Windows of one batch are
+       disjoint and solved in parallel; every other batch is shifted by half
+       a window so that window borders get optimized too. Passes stop when
+       none improves, after `max_passes` or at the time limit.
+
+    Sub-problems are in-memory matrix instances, so the original instance
+    is never expanded to a full matrix. Path end points are forced with the
+    non-negative penalty weights of tour merging (see ReducedInstance), so
+    every sub-problem method, branch and bound included, stays valid; the
+    methods that accept a warm start begin from the current order.
+    """
+
+    def __init__(self, instance: TSPInstance, cluster_size: int = 200, window_size: int = 100,
+                 method: str = "ils", sub_iterations: int = 200, max_passes: int = 5,
+                 time_limit: Optional[float] = None, workers: int = 1,
+                 initial_solution: InitialSolution = None, seed: Optional[int] = None):
+        super().__init__(instance)
+        if cluster_size < 3 or window_size < 4:
+            raise ValueError("DecompositionSolver needs cluster_size >= 3 and window_size >= 4")
+        self.cluster_size = cluster_size
+        self.window_size = window_size
+        self.method = method
+        self.sub_iterations = sub_iterations
+        self.max_passes = max_passes
+        self.time_limit = time_limit
+        self.workers = workers
+        # Warm start: skip the clustering and only run 2-opt and the window passes
+        self.initial_solution = load_initial_solution(instance, initial_solution)
+        self.rng = random.Random(seed)
+        try:
+            self._accepted = get_spec(method).params
+        except KeyError:
+            raise ValueError(f"unknown sub-problem method {method!r}") from None
+        # Set by solve(); the time limit runs from there
+        self._start_time: Optional[float] = None
+
+    def solve(self) -> Solution:
+        start_time = self._start_time = time.perf_counter()
+        executor = ProcessPoolExecutor(self.workers) if self.workers > 1 else None
+        try:
+            if self.initial_solution is not None:
+                tour = self.initial_solution.tour[:]
+            else:
+                with self.phase("clustering"):
+                    clusters = self._clusters()
+                    portals = self._portals(clusters)
+                with self.phase("clusters"):
+                    tour = self._cluster_paths(clusters, portals, executor)
+            cost = self.calculate_cost(tour)
+            self.report_incumbent(tour, cost)
+            with self.phase("local_search"):
+                local_search = self.instrument(LocalSearchSolver(self.instance, neighbor_list_size=SUB_NEIGHBORS))
+                improved = local_search.two_opt_neighbors(tour, cost)
+            if improved.cost < cost:
+                tour, cost = improved.tour, improved.cost
+                self.report_incumbent(tour, cost)
+            trace = [cost]
+
+            passes = 0
+            with self.phase("popmusic"):
+                while passes < self.max_passes and not self._out_of_time():
+                    improved = False
+                    for offset in (0, self.window_size // 2):
+                        gain = self._window_batch(tour, offset, executor)
+                        improved = improved or gain > 0
+                        cost -= gain
+                        if self._out_of_time():
+                            break
+                    passes += 1
+                    trace.append(cost)
+                    if not improved:
+                        break
+                    self.report_incumbent(tour, cost)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.count("passes", passes)
+        return Solution(tour, cost, {"passes": passes, "trace": trace,
+                                     "elapsed": time.perf_counter() - start_time})
+
+    def _out_of_time(self) -> bool:
+        if self.stop_requested():
+            return True
+        return (self.time_limit is not None and self._start_time is not None
+                and time.perf_counter() - self._start_time >= self.time_limit)
+
+    def _clusters(self) -> List[List[int]]:
+        """Clusters of consecutive cities along the ordering, in the order they are visited."""
+        if self.instance.has_coordinates:
+            order = hilbert_order(self.instance)
+        else:
+            order = nearest_neighbor_order(self.instance)
+        n = len(order)
+        count = max(1, round(n / self.cluster_size))
+        # Equal sizes: no tiny last cluster
+        bounds = [n * i // count for i in range(count + 1)]
+        clusters = [order[bounds[i]:bounds[i + 1]] for i in range(count)]
+        if count <= 3:
+            return clusters
+        # The ordering is a path: chained as is, the tour would close with an
+        # edge across the whole instance. Visit the clusters along a 2-opt
+        # tour of one representative city each instead.
+        representatives = [cluster[len(cluster) // 2] for cluster in clusters]
+        distance = self.instance.distance
+        matrix = [[distance(a, b) for b in representatives] for a in representatives]
+        solver = LocalSearchSolver(TSPInstance.from_matrix(matrix, "clusters"), neighbor_list_size=SUB_NEIGHBORS)
+        return [clusters[k] for k in self.instrument(solver).solve().tour]
+
+    def _portals(self, clusters: List[List[int]]) -> List[Tuple[int, int]]:
+        """
+        (entry, exit) city of every cluster. The exit of a cluster and the
+        entry of the next one are the closest pair found between them on the
+        neighbour lists; for clusters that are not neighbours, the city
+        closest to the middle of the next cluster and its nearest city there.
+        Entry and exit of a cluster are distinct cities.
+        """
+        count = len(clusters)
+        if count == 1:
+            return []
+        distance = self.instance.distance
+        neighbors = self.instance.neighbor_lists(SUB_NEIGHBORS)
+        owner = [0] * self.instance.n
+        for k, cluster in enumerate(clusters):
+            for city in cluster:
+                owner[city] = k
+
+        entries: List[Optional[int]] = [None] * count
+        exits: List[Optional[int]] = [None] * count
+        for k in range(count):
+            following = (k + 1) % count
+            # Cities already taken as the other portal of their cluster
+            taken_x, taken_y = entries[k], exits[following]
+            best = None
+            for x in clusters[k]:
+                if x == taken_x:
+                    continue
+                for y in neighbors[x]:
+                    if owner[y] == following and y != taken_y:
+                        d = distance(x, y)
+                        if best is None or d < best[0]:
+                            best = (d, x, y)
+                        break  # closest first: the next ones are farther
+            if best is None:
+                anchor = clusters[following][len(clusters[following]) // 2]
+                x = min((c for c in clusters[k] if c != taken_x), key=lambda c: distance(c, anchor))
+                y = min((c for c in clusters[following] if c != taken_y), key=lambda c: distance(x, c))
+            else:
+                _, x, y = best
+            exits[k], entries[following] = x, y
+        return list(zip(entries, exits))
+
+    def _cluster_paths(self, clusters: List[List[int]], portals: List[Tuple[int, int]], executor) -> List[int]:
+        """Solve every cluster as a path from its entry to its exit, and chain the paths."""
+        if not portals:
+            # A single cluster is the whole instance: solved as a closed tour
+            jobs = [(self.instance.permuted(clusters[0]), self._sub_params(len(clusters[0])))]
+            local = self._run(jobs, executor)[0]
+            return [clusters[0][c] for c in local] if local is not None else clusters[0]
+        windows = [[entry] + [c for c in cluster if c != entry and c != exit] + [exit]
+                   for cluster, (entry, exit) in zip(clusters, portals)]
+        return [city for path in self._solve_paths(windows, executor) for city in path]
+
+    def _solve_paths(self, windows: List[List[int]], executor) -> List[List[int]]:
+        """
+        Best path found through every window, its end points fixed (the
+        window itself if none was found, or if the window was not solved in
+        time).
+        """
+        paths: List[Optional[List[int]]] = [window if len(window) <= 3 else None for window in windows]
+        todo = [i for i, path in enumerate(paths) if path is None]
+        jobs = [(_path_instance(self.instance, windows[i]), self._sub_params(len(windows[i]))) for i in todo]
+        for i, local in zip(todo, self._run(jobs, executor)):
+            path = _path_from_cycle(local, len(windows[i])) if local is not None else None
+            paths[i] = [windows[i][c] for c in path] if path is not None else windows[i]
+        return paths
+
+    def _sub_params(self, m: int) -> Dict[str, Any]:
+        params = {}
+        if "initial_solution" in self._accepted:
+            # The sub-problem in its current order: the result is never worse,
+            # and for paths it always uses the forced end-point edge
+            params["initial_solution"] = list(range(m))
+        if "max_iterations" in self._accepted:
+            params["max_iterations"] = self.sub_iterations
+        if "neighbor_list_size" in self._accepted:
+            params["neighbor_list_size"] = SUB_NEIGHBORS
+        if "seed" in self._accepted:
+            params["seed"] = self.rng.randrange(2**32)
+        return params
+
+    def _run(self, jobs: List[Tuple[TSPInstance, Dict[str, Any]]], executor) -> List[Optional[List[int]]]:
+        """Tours of the sub-problems; None for those skipped at the time limit (sequential runs only)."""
+        if executor is not None:
+            # Worker processes do not see stop requests: they are checked between batches
+            return list(executor.map(_solve_subproblem, [self.method] * len(jobs), *zip(*jobs)))
+        tours: List[Optional[List[int]]] = []
+        for sub, params in jobs:
+            if self._out_of_time():
+                tours.append(None)
+            else:
+                tours.append(self.instrument(create_solver(self.method, sub, **params)).solve().tour)
+        return tours
+
+    def _window_batch(self, tour: List[int], offset: int, executor) -> int:
+        """Re-optimize disjoint windows starting at offset; returns the total gain."""
+        n = len(tour)
+        w = min(self.window_size, n)
+        if w < 4:
+            return 0
+        starts = list(range(offset, offset + n - w + 1, w)) if n > w else [0]
+        windows = [[tour[(s + k) % n] for k in range(w)] for s in starts]
+
+        gain = 0
+        for s, window, new_path in zip(starts, windows, self._solve_paths(windows, executor)):
+            delta = _path_cost(self.instance, window) - _path_cost(self.instance, new_path)
+            if delta > 0:
+                for k, city in enumerate(new_path):
+                    tour[(s + k) % n] = city
+                gain += delta
+                self.count("windows_improved")
+        self.count("windows", len(windows))
+        return gain
+
+def _solve_subproblem(method: str, instance: TSPInstance, params: Dict[str, Any]) -> List[int]:
+    return create_solver(method, instance, **params).solve().tour
+
+def _path_instance(instance: TSPInstance, window: List[int]) -> TSPInstance:
+    """
+    Matrix of the window cities where the edge between the two end points
+    is forced as in tour merging (weight 0, every other edge penalized):
+    every good tour of it uses that edge, and removing it leaves a path
+    between the fixed end points.
+    """
+    return ReducedInstance(instance.permuted(window), frozenset({(0, len(window) - 1)})).reduced
+
+def _path_from_cycle(cycle: List[int], m: int) -> Optional[List[int]]:
+    """The path 0 -> ... -> m-1 of a cycle using the edge (m-1, 0), or None without it."""
+    start = cycle.index(0)
+    rotated = cycle[start:] + cycle[:start]
+    if rotated[-1] == m - 1:
+        return rotated
+    if rotated[1] == m - 1:
+        return [0] + rotated[:0:-1]
+    return None
+
+def _path_cost(instance: TSPInstance, path: List[int]) -> int:
+    return sum(instance.distance(path[k], path[k + 1]) for k in range(len(path) - 1))
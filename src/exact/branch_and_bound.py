@@ -1,47 +1,85 @@
 
 import time
 from typing import List
-from ..model.tsp_model import Solver, Solution, TSPInstance
+from ..model.tsp_model import Solver, Solution, TSPInstance, InitialSolution, load_initial_solution
 from ..constructive.nearest_neighbor import ConstructiveSolver
 
 class BranchAndBoundSolver(Solver):
-    def __init__(self, instance: TSPInstance, time_limit: int = 300):
+    # The search tree is not saved, only the incumbent: a resumed run searches
+    # again from the root, with the saved incumbent as upper bound
+    supports_checkpoint = True
+
+    def __init__(self, instance: TSPInstance, time_limit: int = 300, initial_solution: InitialSolution = None):
         super().__init__(instance)
+        # Warm start: initial incumbent instead of the nearest neighbour tour
+        self.initial_solution = load_initial_solution(instance, initial_solution)
         self.best_solution = None
         self.upper_bound = float('inf')
         self.time_limit = time_limit
         self.start_time = 0
+        self.nodes_expanded = 0
+        self.nodes_pruned = 0
+        # False when the time limit or a stop request cut the search
+        self.search_complete = True
+        self._unsaved_incumbent = False
 
     def solve(self) -> Solution:
         self.start_time = time.time()
         
         # Initial upper bound
-        constructive = ConstructiveSolver(self.instance)
-        initial_sol = constructive.solve()
+        if self.initial_solution is not None:
+            initial_sol = Solution(self.initial_solution.tour[:], self.initial_solution.cost)
+        else:
+            constructive = self.instrument(ConstructiveSolver(self.instance))
+            initial_sol = constructive.solve()
         self.best_solution = initial_sol
         self.upper_bound = initial_sol.cost
+        self.report_incumbent(initial_sol.tour, initial_sol.cost)
+
+        state = self.checkpoint.load(self) if self.checkpoint is not None else None
+        if state is not None and state["cost"] <= self.upper_bound:
+            self.best_solution = Solution(state["tour"], state["cost"])
+            self.upper_bound = state["cost"]
+            self.report_incumbent(self.best_solution.tour, self.best_solution.cost)
+            if state["optimal"]:
+                return self.best_solution
         
         start_node = 0
         visited = {start_node}
         path = [start_node]
+        self.nodes_expanded = 0
+        self.nodes_pruned = 0
+        self.search_complete = True
         
-        self._dfs(start_node, visited, 0, path)
+        with self.phase("search"):
+            self._dfs(start_node, visited, 0, path)
+        self.count("nodes_expanded", self.nodes_expanded)
+        self.count("nodes_pruned", self.nodes_pruned)
+        if self.checkpoint is not None:
+            self._save_checkpoint(optimal=self.search_complete)
         
         return self.best_solution
 
     def _dfs(self, current_node: int, visited: set, current_cost: int, path: List[int]):
-        if time.time() - self.start_time > self.time_limit:
+        if time.time() - self.start_time > self.time_limit or self.stop_requested():
+            self.search_complete = False
             return
+        if self._unsaved_incumbent and self.checkpoint.due():
+            self._save_checkpoint(optimal=False)
 
         # Pruning with Lower Bound
         if self._bound(current_node, visited, current_cost) >= self.upper_bound:
+            self.nodes_pruned += 1
             return
+        self.nodes_expanded += 1
 
         if len(visited) == self.instance.n:
             total_cost = current_cost + self.instance.distance(current_node, path[0])
             if total_cost < self.upper_bound:
                 self.upper_bound = total_cost
                 self.best_solution = Solution(path[:], total_cost)
+                self.report_incumbent(path, total_cost)
+                self._unsaved_incumbent = self.checkpoint is not None
             return
 
         remaining_nodes = []
@@ -61,6 +99,13 @@ class BranchAndBoundSolver(Solver):
                  self._dfs(next_city, visited, current_cost + dist, path)
                  path.pop()
                  visited.remove(next_city)
+             else:
+                 self.nodes_pruned += 1
+
+    def _save_checkpoint(self, optimal: bool):
+        self.checkpoint.save(self, {"tour": self.best_solution.tour, "cost": self.best_solution.cost,
+                                    "optimal": optimal})
+        self._unsaved_incumbent = False
 
     def _bound(self, current_node: int, visited: set, current_cost: int) -> float:
         """
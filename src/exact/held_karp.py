@@ -0,0 +1,66 @@
+
+from typing import List
+from ..model.tsp_model import Solver, Solution, TSPInstance
+
+class HeldKarpSolver(Solver):
+    """
+    Held-Karp dynamic programming: best path from city 0 through every
+    subset of the other cities, O(n^2 2^n) time and O(n 2^n) memory. Exact,
+    and only practical for small instances (`max_size` guards against
+    accidental use on big ones).
+    """
+
+    def __init__(self, instance: TSPInstance, max_size: int = 16):
+        super().__init__(instance)
+        if instance.n > max_size:
+            raise ValueError(f"HeldKarpSolver is limited to {max_size} cities (instance has {instance.n})")
+
+    def solve(self) -> Solution:
+        n = self.instance.n
+        if n <= 3:
+            tour = list(range(n))
+            cost = self.calculate_cost(tour) if n > 1 else 0
+            self.report_incumbent(tour, cost)
+            return Solution(tour, cost)
+
+        # City c >= 1 is bit c - 1 of the subset masks
+        m = n - 1
+        distance = [self.instance.distance_row(i) for i in range(n)]
+        infinity = float("inf")
+        best = [[infinity] * m for _ in range(1 << m)]
+        parent = [[-1] * m for _ in range(1 << m)]
+        for j in range(m):
+            best[1 << j][j] = distance[0][j + 1]
+
+        with self.phase("dynamic_programming"):
+            for mask in range(1, 1 << m):
+                row = best[mask]
+                for j in range(m):
+                    cost = row[j]
+                    if cost == infinity or not mask >> j & 1:
+                        continue
+                    to = distance[j + 1]
+                    for k in range(m):
+                        if mask >> k & 1:
+                            continue
+                        extended = mask | 1 << k
+                        candidate = cost + to[k + 1]
+                        if candidate < best[extended][k]:
+                            best[extended][k] = candidate
+                            parent[extended][k] = j
+        self.count("subsets", 1 << m)
+
+        full = (1 << m) - 1
+        last = min(range(m), key=lambda j: best[full][j] + distance[j + 1][0])
+        cost = best[full][last] + distance[last + 1][0]
+        tour = self._path(parent, full, last)
+        self.report_incumbent(tour, cost)
+        return Solution(tour, cost)
+
+    @staticmethod
+    def _path(parent: List[List[int]], mask: int, last: int) -> List[int]:
+        reversed_path = []
+        while last != -1:
+            reversed_path.append(last + 1)
+            mask, last = mask & ~(1 << last), parent[mask][last]
+        return [0] + reversed_path[::-1]
@@ -0,0 +1,269 @@
+
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Set, Tuple
+from ..model.tsp_model import Solver, Solution, TSPInstance, InitialSolution, load_initial_solution
+from ..local_search.two_opt import LocalSearchSolver
+from ..grasp.grasp_solver import GRASPSolver
+from ..grasp.tour_cache import canonical_tour
+
+CROSSOVERS = ("ox", "eax")
+
+class GeneticSolver(Solver):
+    """
+    (mu + lambda) genetic algorithm: tournament selection, order (OX)
+    or edge-assembly (EAX) crossover, random 2-opt mutation and optional
+    neighbour-list 2-opt on the offspring, possibly spread over processes.
+    """
+
+    def __init__(self, instance: TSPInstance, population_size: int = 30, generations: Optional[int] = 100,
+                 time_limit: Optional[float] = None, crossover: str = "ox", mutation_rate: float = 0.2,
+                 tournament_size: int = 3, local_search: bool = True, neighbor_list_size: int = 10,
+                 initial_alpha: float = 0.3, workers: int = 1,
+                 initial_solution: InitialSolution = None, seed: Optional[int] = None):
+        super().__init__(instance)
+        if crossover not in CROSSOVERS:
+            raise ValueError(f"Unknown crossover: {crossover}")
+        if generations is None and time_limit is None:
+            raise ValueError("GeneticSolver needs generations or time_limit")
+        self.population_size = population_size
+        self.generations = generations
+        self.time_limit = time_limit
+        self.crossover = crossover
+        self.mutation_rate = mutation_rate
+        self.tournament_size = tournament_size
+        self.local_search = local_search
+        self.neighbor_list_size = neighbor_list_size
+        self.initial_alpha = initial_alpha
+        self.workers = workers
+        self.initial_solution = load_initial_solution(instance, initial_solution)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+    def solve(self) -> Solution:
+        start_time = time.perf_counter()
+        n = self.instance.n
+        executor = None
+        if self.local_search and self.workers > 1:
+            executor = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                           initargs=(self.instance, self.neighbor_list_size))
+        try:
+            # Initial population: randomized greedy tours
+            with self.phase("initialization"):
+                grasp = GRASPSolver(self.instance, alpha=self.initial_alpha, seed=self.rng.randrange(2**32))
+                tours = []
+                # A stop request keeps the tours built so far (at least one)
+                while len(tours) < self.population_size and not (tours and self.stop_requested()):
+                    tours.append(grasp.construct_randomized_greedy())
+                if self.initial_solution:
+                    tours[0] = self.initial_solution.tour[:]
+                    self.report_incumbent(self.initial_solution.tour, self.initial_solution.cost)
+            population = self._survivors(self._improve(tours, executor))
+            # Consumers get a tour before the first generation, which may be long
+            if not self.initial_solution or population[0].cost < self.initial_solution.cost:
+                self.report_incumbent(population[0].tour, population[0].cost)
+
+            best_trace = [population[0].cost]
+            generation = 0
+            while self.generations is None or generation < self.generations:
+                if self.stop_requested():
+                    break
+                if self.time_limit is not None and time.perf_counter() - start_time >= self.time_limit:
+                    break
+                generation += 1
+
+                offspring = []
+                with self.phase("crossover"):
+                    for _ in range(self.population_size):
+                        parent_a = self._tournament(population)
+                        parent_b = self._tournament(population)
+                        if self.crossover == "eax" and n >= 8:
+                            child = self.eax_crossover(parent_a.tour, parent_b.tour)
+                        else:
+                            child = self.order_crossover(parent_a.tour, parent_b.tour)
+                        if self.rng.random() < self.mutation_rate:
+                            self._mutate(child)
+                        offspring.append(child)
+
+                population = self._survivors(population + self._improve(offspring, executor))
+                if population[0].cost < best_trace[-1]:
+                    self.report_incumbent(population[0].tour, population[0].cost)
+                best_trace.append(population[0].cost)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.count("generations", generation)
+        best = population[0]
+        best.stats.update({
+            "generations": generation,
+            "elapsed": time.perf_counter() - start_time,
+            "best_trace": best_trace,
+        })
+        return best
+
+    def _improve(self, tours: List[List[int]], executor) -> List[Solution]:
+        # Whole population scored at once over a (pop, n) array
+        with self.phase("evaluation"):
+            costs = self.instance.tour_costs(tours)
+        self.count("tours_evaluated", len(tours))
+        if not self.local_search:
+            return [Solution(tour, cost) for tour, cost in zip(tours, costs)]
+        with self.phase("local_search"):
+            if executor is not None:
+                return list(executor.map(_improve_in_worker, tours, costs))
+            solver = self.instrument(LocalSearchSolver(self.instance, neighbor_list_size=self.neighbor_list_size))
+            return [solver.two_opt_neighbors(tour, cost) for tour, cost in zip(tours, costs)]
+
+    def _survivors(self, candidates: List[Solution]) -> List[Solution]:
+        # Best distinct tours; duplicates would make the population collapse
+        survivors = []
+        seen = set()
+        for solution in sorted(candidates, key=lambda s: s.cost):
+            key = canonical_tour(solution.tour)
+            if key not in seen:
+                seen.add(key)
+                survivors.append(solution)
+                if len(survivors) == self.population_size:
+                    break
+        return survivors
+
+    def _tournament(self, population: List[Solution]) -> Solution:
+        contestants = self.rng.sample(population, min(self.tournament_size, len(population)))
+        return min(contestants, key=lambda s: s.cost)
+
+    def _mutate(self, tour: List[int]):
+        # Random 2-opt move
+        i, j = sorted(self.rng.sample(range(len(tour)), 2))
+        tour[i:j + 1] = reversed(tour[i:j + 1])
+
+    def order_crossover(self, parent_a: List[int], parent_b: List[int]) -> List[int]:
+        """OX: keep a slice of the first parent, fill the rest in the order of the second."""
+        n = len(parent_a)
+        i, j = sorted(self.rng.sample(range(n + 1), 2))
+        kept = set(parent_a[i:j])
+        child = [None] * n
+        child[i:j] = parent_a[i:j]
+        order = parent_b[j:] + parent_b[:j]
+        fill = [city for city in order if city not in kept]
+        for k, city in enumerate(fill):
+            child[(j + k) % n] = city
+        return child
+
+    def eax_crossover(self, parent_a: List[int], parent_b: List[int]) -> List[int]:
+        """
+        EAX with a single AB-cycle: edges of A on the cycle are replaced by the
+        B edges of the cycle, then the resulting subtours are merged greedily.
+        """
+        n = len(parent_a)
+        adjacency_a = _adjacency(parent_a)
+        adjacency_b = _adjacency(parent_b)
+        only_a = [set(adjacency_a[c]) - set(adjacency_b[c]) for c in range(n)]
+        only_b = [set(adjacency_b[c]) - set(adjacency_a[c]) for c in range(n)]
+        starts = [c for c in range(n) if only_a[c]]
+        if not starts:
+            return parent_a[:]
+
+        # Alternating walk A, B, A, B... back to the start through a B edge
+        start = self.rng.choice(starts)
+        removed: List[Tuple[int, int]] = []
+        added: List[Tuple[int, int]] = []
+        current = start
+        use_a = True
+        while True:
+            edges = only_a if use_a else only_b
+            following = self.rng.choice(sorted(edges[current]))
+            edges[current].discard(following)
+            edges[following].discard(current)
+            (removed if use_a else added).append((current, following))
+            current = following
+            if not use_a and current == start:
+                break
+            use_a = not use_a
+
+        children = [list(neighbors) for neighbors in adjacency_a]
+        for u, v in removed:
+            children[u].remove(v)
+            children[v].remove(u)
+        for u, v in added:
+            children[u].append(v)
+            children[v].append(u)
+        self._merge_subtours(children)
+        return _tour_from_adjacency(children)
+
+    def _merge_subtours(self, adjacency: List[List[int]]):
+        distance = self.instance.distance
+        neighbors = self.instance.neighbor_lists(self.neighbor_list_size)
+        subtours = _subtours(adjacency)
+        while len(subtours) > 1:
+            # Reconnect the smallest subtour with the cheapest 2-opt style exchange
+            subtours.sort(key=len)
+            smallest = subtours[0]
+            members = set(smallest)
+            best = None
+            for u in smallest:
+                candidates = [v for v in neighbors[u] if v not in members]
+                if not candidates:
+                    continue
+                for u_next in adjacency[u]:
+                    for v in candidates:
+                        for v_next in adjacency[v]:
+                            gain = (distance(u, v) + distance(u_next, v_next)
+                                    - distance(u, u_next) - distance(v, v_next))
+                            if best is None or gain < best[0]:
+                                best = (gain, u, u_next, v, v_next)
+            if best is None:
+                # No neighbour-list city outside the subtour: scan every city
+                u = smallest[0]
+                u_next = adjacency[u][0]
+                v = min((c for c in range(len(adjacency)) if c not in members), key=lambda c: distance(u, c))
+                best = (0, u, u_next, v, adjacency[v][0])
+
+            _, u, u_next, v, v_next = best
+            adjacency[u].remove(u_next)
+            adjacency[u_next].remove(u)
+            adjacency[v].remove(v_next)
+            adjacency[v_next].remove(v)
+            adjacency[u].append(v)
+            adjacency[v].append(u)
+            adjacency[u_next].append(v_next)
+            adjacency[v_next].append(u_next)
+            subtours = _subtours(adjacency)
+
+def _adjacency(tour: List[int]) -> List[List[int]]:
+    n = len(tour)
+    adjacency = [[] for _ in range(n)]
+    for i, city in enumerate(tour):
+        adjacency[city] = [tour[i - 1], tour[(i + 1) % n]]
+    return adjacency
+
+def _subtours(adjacency: List[List[int]]) -> List[List[int]]:
+    seen: Set[int] = set()
+    subtours = []
+    for start in range(len(adjacency)):
+        if start in seen:
+            continue
+        subtour = _tour_from_adjacency(adjacency, start)
+        seen.update(subtour)
+        subtours.append(subtour)
+    return subtours
+
+def _tour_from_adjacency(adjacency: List[List[int]], start: int = 0) -> List[int]:
+    tour = [start]
+    previous, current = start, adjacency[start][0]
+    while current != start:
+        tour.append(current)
+        a, b = adjacency[current]
+        previous, current = current, (b if a == previous else a)
+    return tour
+
+# Worker-side state for parallel local search (one instance copy per process)
+_worker_solver: Optional[LocalSearchSolver] = None
+
+def _init_worker(instance: TSPInstance, neighbor_list_size: int):
+    global _worker_solver
+    _worker_solver = LocalSearchSolver(instance, neighbor_list_size=neighbor_list_size)
+
+def _improve_in_worker(tour: List[int], cost: int) -> Solution:
+    return _worker_solver.two_opt_neighbors(tour, cost)
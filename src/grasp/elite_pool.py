@@ -0,0 +1,69 @@
+
+from typing import FrozenSet, List, Optional, Tuple
+from ..model.tsp_model import Solution
+
+def tour_edges(tour: List[int]) -> FrozenSet[Tuple[int, int]]:
+    """Undirected edge set of a tour, independent of rotation and direction."""
+    n = len(tour)
+    return frozenset(
+        (a, b) if a < b else (b, a)
+        for a, b in ((tour[i], tour[(i + 1) % n]) for i in range(n))
+    )
+
+def tour_distance(edges_a: FrozenSet[Tuple[int, int]], edges_b: FrozenSet[Tuple[int, int]]) -> int:
+    """Number of edges of the first tour missing from the second one."""
+    return len(edges_a - edges_b)
+
+class ElitePool:
+    """
+    Size-bounded pool of good and mutually different local optima.
+
+    A candidate enters a non-full pool if it is at least `min_distance` edges
+    away from every member. Once full, it must beat the worst member and be
+    either a new best or diverse enough; it then replaces the most similar
+    member among those it beats.
+    """
+
+    def __init__(self, max_size: int = 10, min_distance: int = 1):
+        self.max_size = max_size
+        self.min_distance = min_distance
+        self.solutions: List[Solution] = []
+        self._edges: List[FrozenSet[Tuple[int, int]]] = []
+
+    def __len__(self) -> int:
+        return len(self.solutions)
+
+    def best(self) -> Optional[Solution]:
+        return min(self.solutions, key=lambda s: s.cost) if self.solutions else None
+
+    def worst(self) -> Optional[Solution]:
+        return max(self.solutions, key=lambda s: s.cost) if self.solutions else None
+
+    def add(self, solution: Solution) -> bool:
+        if self.max_size <= 0:
+            return False
+
+        edges = tour_edges(solution.tour)
+        distances = [tour_distance(edges, other) for other in self._edges]
+        if 0 in distances:
+            return False  # already in the pool
+        diverse = all(d >= self.min_distance for d in distances)
+
+        if len(self.solutions) < self.max_size:
+            if not diverse:
+                return False
+            self.solutions.append(solution)
+            self._edges.append(edges)
+            return True
+
+        if solution.cost >= self.worst().cost:
+            return False
+        if not diverse and solution.cost >= self.best().cost:
+            return False
+
+        # Replace the most similar member among the ones the candidate beats
+        worse = [i for i, s in enumerate(self.solutions) if s.cost > solution.cost]
+        victim = min(worse, key=lambda i: distances[i])
+        self.solutions[victim] = solution
+        self._edges[victim] = edges
+        return True
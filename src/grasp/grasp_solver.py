@@ -1,56 +1,305 @@
 
+import heapq
 import random
-from typing import List
-from ..model.tsp_model import Solver, Solution, TSPInstance
+import time
+from statistics import NormalDist, mean, pstdev
+from typing import List, Optional, Sequence
+from ..model.tsp_model import Solver, Solution, TSPInstance, InitialSolution, load_initial_solution
 from ..local_search.two_opt import LocalSearchSolver
+from .elite_pool import ElitePool
+from .path_relinking import RELINKING_MODES, path_relinking
+from .tour_cache import TourCache, canonical_tour
+from .tour_merging import merge_tours
+
+# Alpha grid explored by the reactive mode (same grid as tune_grasp.py)
+DEFAULT_REACTIVE_ALPHAS = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+
+# Local optima needed before the improvement probability is trusted
+MIN_PROBABILITY_SAMPLES = 10
 
 class GRASPSolver(Solver):
-    def __init__(self, instance: TSPInstance, max_iterations: int = 50, alpha: float = 0.2):
+    supports_checkpoint = True
+
+    def __init__(self, instance: TSPInstance, max_iterations: Optional[int] = 50, alpha: float = 0.2,
+                 reactive: bool = False, alphas: Optional[Sequence[float]] = None,
+                 reactive_period: int = 10, reactive_delta: float = 10.0,
+                 elite_size: int = 10, elite_min_distance: int = 1,
+                 path_relinking: Optional[str] = None,
+                 max_no_improvement: Optional[int] = None, target_cost: Optional[int] = None,
+                 time_limit: Optional[float] = None, min_improvement_probability: Optional[float] = None,
+                 cache_size: int = 1024, candidate_list_size: Optional[int] = None,
+                 neighbor_list_size: Optional[int] = None, tour_merging: bool = False, merge_top_k: int = 5,
+                 initial_solution: InitialSolution = None, seed: Optional[int] = None):
         super().__init__(instance)
         self.max_iterations = max_iterations
-        self.alpha = alpha 
+        self.alpha = alpha
+        # At most this many cities in the RCL (the cheapest under the alpha threshold)
+        self.candidate_list_size = candidate_list_size
+        # Local search variant: None for exhaustive 2-opt, k for neighbour-list 2-opt
+        self.neighbor_list_size = neighbor_list_size
+        self.rng = random.Random(seed)
+        # Warm start: the first incumbent and elite solution
+        self.initial_solution = load_initial_solution(instance, initial_solution)
+
+        # Reactive GRASP (Prais & Ribeiro): alpha is drawn from a discrete set
+        # whose probabilities are periodically biased towards the values that
+        # produced the best local optima so far.
+        self.reactive = reactive or alphas is not None
+        self.alphas = list(alphas) if alphas is not None else list(DEFAULT_REACTIVE_ALPHAS)
+        self.reactive_period = reactive_period
+        self.reactive_delta = reactive_delta
+        self.alpha_probabilities = [1.0 / len(self.alphas)] * len(self.alphas)
+        self._alpha_cost_sums = [0.0] * len(self.alphas)
+        self._alpha_counts = [0] * len(self.alphas)
+
+        # Elite pool of diverse local optima, used as guiding solutions for
+        # path relinking (forward, backward or mixed; None disables it)
+        if path_relinking is not None and path_relinking not in RELINKING_MODES:
+            raise ValueError(f"Unknown path relinking mode: {path_relinking}")
+        self.path_relinking = path_relinking
+        self.elite_pool = ElitePool(elite_size, elite_min_distance)
+        # Post-processing: fix the edges shared by the merge_top_k best elite
+        # tours and solve the reduced instance
+        self.tour_merging = tour_merging
+        self.merge_top_k = merge_top_k
+
+        # Stopping rules, checked after every iteration (None disables a rule)
+        if max_iterations is None and max_no_improvement is None and target_cost is None \
+                and time_limit is None and min_improvement_probability is None:
+            raise ValueError("GRASPSolver needs at least one stopping criterion")
+        # Without a warm start, the first iteration provides the incumbent
+        if max_iterations is not None and max_iterations < 1 and self.initial_solution is None:
+            raise ValueError("GRASPSolver needs max_iterations >= 1 without an initial solution")
+        self.max_no_improvement = max_no_improvement
+        self.target_cost = target_cost
+        self.time_limit = time_limit
+        self.min_improvement_probability = min_improvement_probability
+
+        # Constructed tours already seen (canonical form -> local optimum) so
+        # that duplicates skip 2-opt, and local optima already reached
+        self.cache_size = cache_size
 
     def solve(self) -> Solution:
         best_solution = None
-        
-        for _ in range(self.max_iterations):
+        start_time = time.perf_counter()
+        trace = []
+        best_trace = []
+        last_improvement = 0
+        stop_reason = "max_iterations"
+        construction_cache = TourCache(self.cache_size)
+        optima_cache = TourCache(self.cache_size)
+        duplicate_optima = 0
+
+        iteration = 0
+        state = self.checkpoint.load(self) if self.checkpoint is not None else None
+        if state is not None:
+            best_solution, iteration, last_improvement, trace, best_trace = self._restore(state)
+            start_time -= state["elapsed"]
+        elif self.initial_solution is not None:
+            best_solution = Solution(self.initial_solution.tour[:], self.initial_solution.cost)
+            self.elite_pool.add(best_solution)
+            self.report_incumbent(best_solution.tour, best_solution.cost)
+        while self.max_iterations is None or iteration < self.max_iterations:
             # Phase 1: Construction (Randomized Greedy)
-            tour = self.construct_randomized_greedy()
-            cost = self.calculate_cost(tour)
-            
-            # Phase 2: Local Search
-            ls_solver = LocalSearchSolver(self.instance, Solution(tour, cost))
-            local_optimum = ls_solver.solve()
-            
+            with self.phase("construction"):
+                if self.reactive:
+                    alpha_index = self._choose_alpha()
+                    tour = self.construct_randomized_greedy(self.alphas[alpha_index])
+                else:
+                    tour = self.construct_randomized_greedy()
+                cost = self.calculate_cost(tour)
+
+            # Phase 2: Local Search (skipped for starting tours already seen)
+            key = canonical_tour(tour)
+            cached = construction_cache.get(key) if self.cache_size > 0 else None
+            if cached is not None:
+                local_optimum = Solution(cached.tour[:], cached.cost)
+            else:
+                ls_solver = self.instrument(LocalSearchSolver(self.instance, Solution(tour, cost),
+                                                              self.neighbor_list_size))
+                with self.phase("local_search"):
+                    local_optimum = ls_solver.solve()
+                construction_cache.put(key, local_optimum)
+
+            optimum_key = canonical_tour(local_optimum.tour)
+            if optimum_key in optima_cache:
+                duplicate_optima += 1
+            optima_cache.put(optimum_key)
+
+            # Phase 3: Path relinking towards an elite solution
+            if self.path_relinking and len(self.elite_pool):
+                with self.phase("path_relinking"):
+                    relinked = self._relink(local_optimum)
+                if relinked is not None and relinked.cost < local_optimum.cost:
+                    self.elite_pool.add(local_optimum)
+                    local_optimum = relinked
+            self.elite_pool.add(local_optimum)
+
             if best_solution is None or local_optimum.cost < best_solution.cost:
                 best_solution = local_optimum
-                
+                last_improvement = iteration
+                self.report_incumbent(best_solution.tour, best_solution.cost)
+
+            if self.reactive:
+                self._alpha_cost_sums[alpha_index] += local_optimum.cost
+                self._alpha_counts[alpha_index] += 1
+                if (iteration + 1) % self.reactive_period == 0:
+                    self._update_alpha_probabilities(best_solution.cost)
+
+            trace.append(local_optimum.cost)
+            best_trace.append(best_solution.cost)
+            iteration += 1
+
+            if self.checkpoint is not None and self.checkpoint.due():
+                self._save_checkpoint(best_solution, iteration, last_improvement, trace, best_trace, start_time)
+
+            reason = self._stop_reason(iteration, last_improvement, best_solution.cost, trace, start_time)
+            if reason:
+                stop_reason = reason
+                break
+
+        if self.checkpoint is not None:
+            self._save_checkpoint(best_solution, iteration, last_improvement, trace, best_trace, start_time)
+
+        merging = None
+        if self.tour_merging and len(self.elite_pool) >= 2:
+            with self.phase("tour_merging"):
+                merged, merging = merge_tours(self.instance, self.elite_pool.solutions, self.merge_top_k,
+                                              seed=self.rng.randrange(2**32), parent=self)
+            if merged.cost < best_solution.cost:
+                best_solution = merged
+                self.report_incumbent(best_solution.tour, best_solution.cost)
+
+        self.count("iterations", iteration)
+        self.count("cache_hits", construction_cache.hits)
+        best_solution.stats.update({
+            "iterations": iteration,
+            "stop_reason": stop_reason,
+            "elapsed": time.perf_counter() - start_time,
+            "trace": trace,
+            "best_trace": best_trace,
+            "cache": dict(construction_cache.counters(), duplicate_optima=duplicate_optima),
+            "tour_merging": merging,
+        })
         return best_solution
 
-    def construct_randomized_greedy(self) -> List[int]:
+    def _save_checkpoint(self, best_solution: Solution, iteration: int, last_improvement: int,
+                         trace: List[int], best_trace: List[int], start_time: float):
+        # The tour caches are not saved: they only avoid repeated local searches
+        self.checkpoint.save(self, {
+            "iteration": iteration,
+            "elapsed": time.perf_counter() - start_time,
+            "best_tour": best_solution.tour,
+            "best_cost": best_solution.cost,
+            "last_improvement": last_improvement,
+            "trace": trace,
+            "best_trace": best_trace,
+            "rng_state": self.rng.getstate(),
+            "elite": [[s.tour, s.cost] for s in self.elite_pool.solutions],
+            "alpha_probabilities": self.alpha_probabilities,
+            "alpha_cost_sums": self._alpha_cost_sums,
+            "alpha_counts": self._alpha_counts,
+        })
+
+    def _restore(self, state):
+        version, internal, gauss = state["rng_state"]
+        self.rng.setstate((version, tuple(internal), gauss))
+        for tour, cost in state["elite"]:
+            self.elite_pool.add(Solution(tour, cost))
+        if len(state["alpha_counts"]) == len(self.alphas):
+            self.alpha_probabilities = state["alpha_probabilities"]
+            self._alpha_cost_sums = state["alpha_cost_sums"]
+            self._alpha_counts = state["alpha_counts"]
+        best_solution = Solution(state["best_tour"], state["best_cost"])
+        self.report_incumbent(best_solution.tour, best_solution.cost)
+        return best_solution, state["iteration"], state["last_improvement"], state["trace"], state["best_trace"]
+
+    def _stop_reason(self, iteration: int, last_improvement: int, best_cost: int,
+                     trace: List[int], start_time: float) -> Optional[str]:
+        if self.stop_requested():
+            return "stopped"
+        if self.target_cost is not None and best_cost <= self.target_cost:
+            return "target_cost"
+        if self.max_no_improvement is not None and iteration - 1 - last_improvement >= self.max_no_improvement:
+            return "no_improvement"
+        if self.time_limit is not None and time.perf_counter() - start_time >= self.time_limit:
+            return "time_limit"
+        if self.min_improvement_probability is not None \
+                and self.improvement_probability(trace, best_cost) < self.min_improvement_probability:
+            return "improvement_probability"
+        return None
+
+    @staticmethod
+    def improvement_probability(trace: List[int], best_cost: int) -> float:
+        """
+        Probability that the next local optimum beats the incumbent, assuming
+        local optimum costs are normally distributed (fitted on the trace).
+        """
+        if len(trace) < MIN_PROBABILITY_SAMPLES:
+            return 1.0
+        sigma = pstdev(trace)
+        if sigma == 0:
+            return 0.0
+        # Costs are integers: improving means reaching best_cost - 1 or less
+        return NormalDist(mean(trace), sigma).cdf(best_cost - 0.5)
+
+    def _relink(self, local_optimum: Solution) -> Optional[Solution]:
+        guiding = self.rng.choice(self.elite_pool.solutions)
+        intermediate = path_relinking(self.instance, local_optimum, guiding, self.path_relinking)
+        if intermediate is None:
+            return None
+        # The best tour on the path is rarely 2-opt optimal
+        return self.instrument(LocalSearchSolver(self.instance, intermediate, self.neighbor_list_size)).solve()
+
+    def _choose_alpha(self) -> int:
+        return self.rng.choices(range(len(self.alphas)), weights=self.alpha_probabilities)[0]
+
+    def _update_alpha_probabilities(self, best_cost: int):
+        # q_i = (best / avg_i) ^ delta: the closer the average local optimum of
+        # alpha_i is to the incumbent, the more likely alpha_i is drawn.
+        scores = [None] * len(self.alphas)
+        for i, count in enumerate(self._alpha_counts):
+            if count:
+                average = self._alpha_cost_sums[i] / count
+                scores[i] = (best_cost / average) ** self.reactive_delta if average > 0 else 1.0
+
+        used = [score for score in scores if score is not None]
+        if not used:
+            return
+        # Alphas never drawn yet keep the best score so that they still get explored
+        fallback = max(used)
+        scores = [fallback if score is None else score for score in scores]
+        total = sum(scores)
+        self.alpha_probabilities = [score / total for score in scores]
+
+    def construct_randomized_greedy(self, alpha: Optional[float] = None) -> List[int]:
+        if alpha is None:
+            alpha = self.alpha
         unvisited = set(range(self.instance.n))
-        start_node = random.randint(0, self.instance.n - 1)
+        start_node = self.rng.randint(0, self.instance.n - 1)
         current = start_node
         tour = [current]
         unvisited.remove(current)
-        
+
         while unvisited:
             candidates = list(unvisited)
             costs = [self.instance.distance(current, city) for city in candidates]
             min_cost = min(costs)
             max_cost = max(costs)
-            
-            threshold = min_cost + self.alpha * (max_cost - min_cost)
-            
-            rcl = [city for city, cost in zip(candidates, costs) if cost <= threshold]
-            
+
+            threshold = min_cost + alpha * (max_cost - min_cost)
+
+            rcl = [(cost, city) for city, cost in zip(candidates, costs) if cost <= threshold]
+            if self.candidate_list_size and len(rcl) > self.candidate_list_size:
+                rcl = heapq.nsmallest(self.candidate_list_size, rcl)
+
             if not rcl:
                  next_city = min(unvisited, key=lambda city: self.instance.distance(current, city))
             else:
-                next_city = random.choice(rcl)
-            
+                next_city = self.rng.choice(rcl)[1]
+
             tour.append(next_city)
             unvisited.remove(next_city)
             current = next_city
-            
+
         return tour
@@ -0,0 +1,87 @@
+
+from typing import List, Optional
+from ..model.tsp_model import Solution, TSPInstance
+
+RELINKING_MODES = ("forward", "backward", "mixed")
+
+def path_relinking(instance: TSPInstance, initial: Solution, guiding: Solution,
+                   mode: str = "forward") -> Optional[Solution]:
+    """
+    Explore the path of swap moves between two tours and return the best
+    intermediate tour found (None if the tours are too close to have one).
+
+    forward:  walk from `initial` towards `guiding`
+    backward: walk from `guiding` towards `initial`
+    mixed:    walk from both ends alternately until they meet
+    """
+    if mode == "forward":
+        return _relink(instance, initial, guiding, alternate=False)
+    if mode == "backward":
+        return _relink(instance, guiding, initial, alternate=False)
+    if mode == "mixed":
+        return _relink(instance, initial, guiding, alternate=True)
+    raise ValueError(f"Unknown path relinking mode: {mode}")
+
+def _align(tour: List[int], reference: List[int]) -> List[int]:
+    # Same starting city as the reference, in the orientation sharing the most positions
+    start = tour.index(reference[0])
+    forward = tour[start:] + tour[:start]
+    backward = [forward[0]] + forward[:0:-1]
+    matches_forward = sum(a == b for a, b in zip(forward, reference))
+    matches_backward = sum(a == b for a, b in zip(backward, reference))
+    return forward if matches_forward >= matches_backward else backward
+
+def _swap_delta(instance: TSPInstance, tour: List[int], i: int, j: int) -> int:
+    n = len(tour)
+    # Edges (p, p+1) touching positions i or j
+    starts = {(i - 1) % n, i, (j - 1) % n, j}
+    old = sum(instance.distance(tour[p], tour[(p + 1) % n]) for p in starts)
+    tour[i], tour[j] = tour[j], tour[i]
+    new = sum(instance.distance(tour[p], tour[(p + 1) % n]) for p in starts)
+    tour[i], tour[j] = tour[j], tour[i]
+    return new - old
+
+def _relink(instance: TSPInstance, source: Solution, target: Solution, alternate: bool) -> Optional[Solution]:
+    ends = [_align(source.tour, target.tour), target.tour[:]]
+    costs = [source.cost, target.cost]
+    positions = [{city: i for i, city in enumerate(tour)} for tour in ends]
+    n = len(ends[0])
+
+    best_tour = None
+    best_cost = float('inf')
+    side = 0
+
+    while True:
+        moving, goal = ends[side], ends[1 - side]
+        pos = positions[side]
+        diff = [i for i in range(1, n) if moving[i] != goal[i]]
+        # With two mismatches left the next swap lands on the other end
+        if len(diff) <= 2:
+            break
+
+        # Greedy step: the swap fixing one position with the best cost delta
+        best_move = None
+        best_delta = None
+        for i in diff:
+            j = pos[goal[i]]
+            delta = _swap_delta(instance, moving, i, j)
+            if best_delta is None or delta < best_delta:
+                best_delta = delta
+                best_move = (i, j)
+
+        i, j = best_move
+        moving[i], moving[j] = moving[j], moving[i]
+        pos[moving[i]] = i
+        pos[moving[j]] = j
+        costs[side] += best_delta
+
+        if costs[side] < best_cost:
+            best_cost = costs[side]
+            best_tour = moving[:]
+
+        if alternate:
+            side = 1 - side
+
+    if best_tour is None:
+        return None
+    return Solution(best_tour, best_cost)
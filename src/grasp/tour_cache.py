@@ -0,0 +1,60 @@
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+def canonical_tour(tour: List[int]) -> Tuple[int, ...]:
+    """
+    Rotation- and direction-invariant key of a tour: it starts at the smallest
+    city and goes towards the smaller of its two neighbours.
+    """
+    start = tour.index(min(tour))
+    rotated = tour[start:] + tour[:start]
+    if len(rotated) > 2 and rotated[-1] < rotated[1]:
+        rotated = [rotated[0]] + rotated[:0:-1]
+    return tuple(rotated)
+
+class TourCache:
+    """Bounded mapping with least-recently-used eviction and hit counters."""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, value: Any = None):
+        if self.max_size <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def counters(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate(),
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
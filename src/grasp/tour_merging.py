@@ -0,0 +1,130 @@
+
+"""
+Tour merging: fix the edges shared by several good tours and solve what
+is left.
+
+Edges common to every tour of a set can always be kept together (they are
+a subset of one tour, hence disjoint paths). Each path is contracted to its
+two end points, which are linked by a forced edge; cities outside every
+path stay as they are. In the reduced matrix, forced edges weigh 0 and the
+other edges distance + M, with M larger than any tour length, so the best
+reduced tours use every forced edge and, among those, are ordered by their
+real length. The weights stay non-negative, as branch and bound requires.
+
+The reduced instance is solved with Held-Karp when tiny, branch and bound
+when small, and iterated local search otherwise; the last two are
+warm-started from the best tour, so the merged tour is never worse than it.
+"""
+
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+from ..model.tsp_model import Solution, Solver, TSPInstance
+from ..registry import create_solver
+from .elite_pool import tour_edges
+
+# Reduced instances up to this size are solved with Held-Karp
+HELD_KARP_MAX = 12
+
+def consensus_edges(tours: Sequence[Sequence[int]]) -> FrozenSet[Tuple[int, int]]:
+    """Undirected edges present in every tour."""
+    edges = tour_edges(list(tours[0]))
+    for tour in tours[1:]:
+        edges &= tour_edges(list(tour))
+    return edges
+
+class ReducedInstance:
+    """The instance with the fixed paths contracted, and the way back to full tours."""
+
+    def __init__(self, instance: TSPInstance, fixed_edges: FrozenSet[Tuple[int, int]]):
+        self.instance = instance
+        adjacency: Dict[int, List[int]] = {}
+        for a, b in fixed_edges:
+            adjacency.setdefault(a, []).append(b)
+            adjacency.setdefault(b, []).append(a)
+
+        # Reduced nodes: free cities and path end points; interior cities are dropped
+        self.nodes = [city for city in range(instance.n) if len(adjacency.get(city, ())) < 2]
+        self.partner: Dict[int, int] = {}
+        self.interior: Dict[Tuple[int, int], List[int]] = {}
+        for start in self.nodes:
+            if start in self.partner or not adjacency.get(start):
+                continue
+            previous, city, inner = start, adjacency[start][0], []
+            while len(adjacency[city]) == 2:
+                inner.append(city)
+                previous, city = city, next(c for c in adjacency[city] if c != previous)
+            self.partner[start], self.partner[city] = city, start
+            self.interior[(start, city)] = inner
+            self.interior[(city, start)] = inner[::-1]
+
+        nodes = self.nodes
+        rows = [[instance.distance(a, b) for b in nodes] for a in nodes]
+        penalty = len(nodes) * max((max(row) for row in rows), default=0) + 1
+        position = {city: i for i, city in enumerate(nodes)}
+        matrix = [[value + penalty for value in row] for row in rows]
+        for i, city in enumerate(nodes):
+            matrix[i][i] = 0
+            if city in self.partner:
+                matrix[i][position[self.partner[city]]] = 0
+        self.reduced = TSPInstance.from_matrix(matrix, f"{instance.filename}_reduced")
+        self._position = position
+
+    def reduce_tour(self, tour: Sequence[int]) -> List[int]:
+        """Reduced tour of a full tour that contains every fixed edge."""
+        return [self._position[city] for city in tour if city in self._position]
+
+    def expand_tour(self, reduced_tour: Sequence[int]) -> Optional[List[int]]:
+        """Full tour of a reduced tour, or None if it does not use every forced edge."""
+        tour = []
+        count = len(reduced_tour)
+        for i, node in enumerate(reduced_tour):
+            city = self.nodes[node]
+            following = self.nodes[reduced_tour[(i + 1) % count]]
+            tour.append(city)
+            if self.partner.get(city) == following and count > 1:
+                tour.extend(self.interior[(city, following)])
+        if len(tour) != self.instance.n or len(set(tour)) != self.instance.n:
+            return None
+        return tour
+
+def merge_tours(instance: TSPInstance, solutions: Sequence[Solution], top_k: int = 5,
+                exact_max: int = 20, time_limit: float = 10.0, iterations: int = 1000,
+                seed: Optional[int] = None, parent: Optional[Solver] = None) -> Tuple[Solution, Dict[str, Any]]:
+    """
+    Merge the `top_k` cheapest solutions; returns the merged solution (the
+    best input one if merging does not improve it) and merging statistics.
+    The reduced instance solver shares the instrumentation and stop flag of
+    `parent` if given.
+    """
+    ranked = sorted(solutions, key=lambda s: s.cost)[:top_k]
+    best = ranked[0]
+    fixed = consensus_edges([s.tour for s in ranked])
+    stats = {"tours": len(ranked), "fixed_edges": len(fixed), "reduced_size": None,
+             "method": None, "improved": False}
+    if len(ranked) < 2 or len(fixed) >= instance.n - 1:
+        return best, stats
+
+    reduction = ReducedInstance(instance, fixed)
+    size = reduction.reduced.n
+    stats["reduced_size"] = size
+    initial = reduction.reduce_tour(best.tour)
+    if size <= HELD_KARP_MAX:
+        solver = create_solver("held_karp", reduction.reduced)
+        stats["method"] = "held_karp"
+    elif size <= exact_max:
+        solver = create_solver("exact", reduction.reduced, time_limit=time_limit, initial_solution=initial)
+        stats["method"] = "exact"
+    else:
+        solver = create_solver("ils", reduction.reduced, max_iterations=iterations, time_limit=time_limit,
+                               initial_solution=initial, seed=seed)
+        stats["method"] = "ils"
+    if parent is not None:
+        parent.instrument(solver)
+
+    tour = reduction.expand_tour(solver.solve().tour)
+    if tour is None:
+        return best, stats
+    cost = instance.tour_costs([tour])[0]
+    if cost >= best.cost:
+        return best, stats
+    stats["improved"] = True
+    return Solution(tour, cost), stats
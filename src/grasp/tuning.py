@@ -0,0 +1,182 @@
+
+"""
+GRASP parameter tuning by successive halving.
+
+Configurations (alpha, iterations, local search variant, candidate list
+size) are raced on (instance, seed) evaluations of a size class. Every
+round evaluates the surviving configurations on more evaluations, in
+parallel, then keeps the best 1/eta of them. A configuration's score is
+its mean gap (%) to the best cost seen on each instance, plus `time_weight`
+per second of run time, so that longer runs have to pay for themselves.
+
+The result is a table of one configuration per size class, written as JSON
+and read back with load_tuned_params().
+"""
+
+import itertools
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from ..model.coordinate_instance import is_tsplib_file, tsplib_dimension
+from ..model.tsp_model import TSPInstance, load_instance
+from .grasp_solver import GRASPSolver
+
+# Upper bounds of the default size classes (the last class is unbounded)
+DEFAULT_SIZE_CLASSES = [100, 500]
+
+Config = Dict[str, Any]
+Evaluation = Tuple[str, int]  # (instance file, seed)
+
+def config_grid(alphas: Sequence[float], iterations: Sequence[int],
+                neighbor_list_sizes: Sequence[Optional[int]],
+                candidate_list_sizes: Sequence[Optional[int]]) -> List[Config]:
+    return [
+        {"alpha": alpha, "max_iterations": iters, "neighbor_list_size": k, "candidate_list_size": c}
+        for alpha, iters, k, c in itertools.product(alphas, iterations, neighbor_list_sizes, candidate_list_sizes)
+    ]
+
+def size_class_bounds(sizes: Sequence[int], n: int) -> Optional[int]:
+    """Upper bound of the class containing n (None for the last, unbounded class)."""
+    for bound in sorted(sizes):
+        if n <= bound:
+            return bound
+    return None
+
+@lru_cache(maxsize=8)
+def _load_instance(instance_file: str) -> TSPInstance:
+    # Per-process cache: workers evaluate many configurations on few instances
+    return load_instance(instance_file)
+
+def _evaluate(instance_file: str, config: Config, seed: int) -> Tuple[int, float]:
+    instance = _load_instance(instance_file)
+    solver = GRASPSolver(instance, seed=seed, **config)
+    start = time.perf_counter()
+    solution = solver.solve()
+    return solution.cost, time.perf_counter() - start
+
+class SuccessiveHalving:
+    def __init__(self, configs: List[Config], evaluations: List[Evaluation], eta: int = 2,
+                 min_evaluations: int = 1, time_weight: float = 0.1, executor=None, verbose: bool = True):
+        self.configs = configs
+        self.evaluations = evaluations
+        self.eta = eta
+        self.min_evaluations = min_evaluations
+        self.time_weight = time_weight
+        self.executor = executor
+        self.verbose = verbose
+        # results[config index][evaluation index] = (cost, time)
+        self.results: List[Dict[int, Tuple[int, float]]] = [{} for _ in configs]
+        self.best_costs: Dict[str, int] = {}
+
+    def run(self) -> Tuple[Config, float]:
+        alive = list(range(len(self.configs)))
+        budget = self.min_evaluations
+        round_index = 0
+        while True:
+            budget = min(budget, len(self.evaluations))
+            self._evaluate(alive, budget)
+            ranked = sorted(alive, key=lambda c: self.score(c, budget))
+            if self.verbose:
+                best = ranked[0]
+                print(f"  round {round_index}: {len(alive)} configurations x {budget} evaluations, "
+                      f"best score {self.score(best, budget):.3f} {self.configs[best]}")
+            if len(ranked) == 1 or budget == len(self.evaluations):
+                return self.configs[ranked[0]], self.score(ranked[0], budget)
+            alive = ranked[:max(1, math.ceil(len(ranked) / self.eta))]
+            budget *= self.eta
+            round_index += 1
+
+    def _evaluate(self, alive: List[int], budget: int):
+        jobs = [(c, e) for c in alive for e in range(budget) if e not in self.results[c]]
+        if self.executor is not None:
+            futures = [self.executor.submit(_evaluate, self.evaluations[e][0], self.configs[c],
+                                            self.evaluations[e][1]) for c, e in jobs]
+            outcomes = [future.result() for future in futures]
+        else:
+            outcomes = [_evaluate(self.evaluations[e][0], self.configs[c], self.evaluations[e][1])
+                        for c, e in jobs]
+        for (c, e), outcome in zip(jobs, outcomes):
+            self.results[c][e] = outcome
+            instance_file = self.evaluations[e][0]
+            self.best_costs[instance_file] = min(self.best_costs.get(instance_file, outcome[0]), outcome[0])
+
+    def score(self, config_index: int, budget: int) -> float:
+        """Mean of gap (%) to the best known cost + time_weight * seconds over the first evaluations."""
+        total = 0.0
+        for e in range(budget):
+            cost, elapsed = self.results[config_index][e]
+            best = self.best_costs[self.evaluations[e][0]]
+            gap = (cost - best) / best * 100 if best else 0.0
+            total += gap + self.time_weight * elapsed
+        return total / budget
+
+def tune(instance_files: Sequence[str], configs: List[Config], seeds: Sequence[int],
+         size_classes: Sequence[int] = DEFAULT_SIZE_CLASSES, eta: int = 2, min_evaluations: int = 1,
+         time_weight: float = 0.1, workers: int = 1, verbose: bool = True) -> List[Dict[str, Any]]:
+    """One tuned configuration per size class that has training instances."""
+    classes: Dict[Optional[int], List[str]] = {}
+    for instance_file in instance_files:
+        n = instance_size(instance_file)
+        classes.setdefault(size_class_bounds(size_classes, n), []).append(instance_file)
+
+    executor = ProcessPoolExecutor(workers) if workers > 1 else None
+    table = []
+    try:
+        ordered = sorted(classes, key=lambda bound: math.inf if bound is None else bound)
+        for bound in ordered:
+            files = classes[bound]
+            if verbose:
+                print(f"Size class n <= {bound if bound is not None else 'inf'}: "
+                      f"{len(files)} instances, {len(configs)} configurations")
+            # Instances vary fastest, so that early rounds already see every instance
+            evaluations = [(f, seed) for seed in seeds for f in files]
+            race = SuccessiveHalving(configs, evaluations, eta, min_evaluations, time_weight, executor, verbose)
+            config, score = race.run()
+            table.append({
+                "max_size": bound,
+                "config": config,
+                "score": score,
+                "instances": [os.path.basename(f) for f in files],
+                "evaluations": sum(len(r) for r in race.results),
+            })
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return table
+
+def instance_size(instance_file: str) -> int:
+    # Header only (DIMENSION of TSPLIB files, first line of the .in format);
+    # avoids parsing the whole matrix
+    if is_tsplib_file(instance_file):
+        dimension = tsplib_dimension(instance_file)
+        return dimension if dimension is not None else load_instance(instance_file).n
+    with open(instance_file) as f:
+        for line in f:
+            if line.strip():
+                return int(line.split()[0])
+    raise ValueError(f"{instance_file}: empty instance file")
+
+def save_table(filepath: str, table: List[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None):
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(filepath, "w") as f:
+        json.dump({"classes": table, "metadata": metadata or {}}, f, indent=2)
+
+def load_tuned_params(filepath: str, n: int) -> Optional[Config]:
+    """GRASP parameters tuned for the size class of n, or None if no class applies."""
+    with open(filepath) as f:
+        classes = json.load(f)["classes"]
+    bounded = sorted((c for c in classes if c["max_size"] is not None), key=lambda c: c["max_size"])
+    for entry in bounded:
+        if n <= entry["max_size"]:
+            return dict(entry["config"])
+    for entry in classes:
+        if entry["max_size"] is None:
+            return dict(entry["config"])
+    # Larger than every tuned class: use the class of the largest instances
+    return dict(bounded[-1]["config"]) if bounded else None
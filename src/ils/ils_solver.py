@@ -0,0 +1,133 @@
+
+import random
+import time
+from typing import List, Optional, Tuple
+from ..model.tsp_model import Solver, Solution, TSPInstance, InitialSolution, load_initial_solution
+from ..constructive.nearest_neighbor import ConstructiveSolver
+from ..local_search.two_opt import LocalSearchSolver, undo_reversals
+
+ACCEPTANCE_CRITERIA = ("better", "better_or_equal", "walk")
+
+class IteratedLocalSearchSolver(Solver):
+    """
+    Iterated Local Search: a local double-bridge kick on the current tour,
+    followed by neighbour-list 2-opt restricted to the kicked cities, then an
+    acceptance test. Each iteration touches O(segment_length) cities instead
+    of rebuilding and re-optimizing the whole tour: a rejected kick is
+    reverted by replaying its moves backwards, not by restoring a copy.
+    """
+
+    def __init__(self, instance: TSPInstance, max_iterations: Optional[int] = 1000,
+                 time_limit: Optional[float] = None, neighbor_list_size: int = 10,
+                 segment_length: int = 50, acceptance: str = "better",
+                 initial_solution: InitialSolution = None, seed: Optional[int] = None):
+        super().__init__(instance)
+        if acceptance not in ACCEPTANCE_CRITERIA:
+            raise ValueError(f"Unknown acceptance criterion: {acceptance}")
+        if max_iterations is None and time_limit is None:
+            raise ValueError("IteratedLocalSearchSolver needs max_iterations or time_limit")
+        self.max_iterations = max_iterations
+        self.time_limit = time_limit
+        self.segment_length = segment_length
+        self.acceptance = acceptance
+        self.initial_solution = load_initial_solution(instance, initial_solution)
+        self.rng = random.Random(seed)
+        self.local_search = LocalSearchSolver(instance, neighbor_list_size=neighbor_list_size)
+
+    def solve(self) -> Solution:
+        start_time = time.perf_counter()
+        n = self.instance.n
+
+        self.instrument(self.local_search)
+        if self.initial_solution:
+            start = self.initial_solution
+        else:
+            start = self.instrument(ConstructiveSolver(self.instance)).solve()
+        with self.phase("local_search"):
+            current = self.local_search.two_opt_neighbors(start.tour, start.cost)
+        tour = current.tour
+        cost = current.cost
+        positions = [0] * n
+        for i, city in enumerate(tour):
+            positions[city] = i
+
+        best_tour = tour[:]
+        best_cost = cost
+        iterations = accepted = improvements = 0
+
+        # A double bridge needs three non-empty segments plus a prefix
+        if n >= 8:
+            while self.max_iterations is None or iterations < self.max_iterations:
+                if self.stop_requested():
+                    break
+                if self.time_limit is not None and time.perf_counter() - start_time >= self.time_limit:
+                    break
+                iterations += 1
+
+                reversals: List[Tuple[int, int]] = []
+                new_cost, touched, kick = self._double_bridge(tour, positions, cost)
+                with self.phase("local_search"):
+                    new_cost = self.local_search.two_opt_neighbors_inplace(tour, positions, new_cost, touched,
+                                                                           reversals)
+
+                if self._accept(new_cost, cost):
+                    cost = new_cost
+                    accepted += 1
+                    if cost < best_cost:
+                        best_cost = cost
+                        best_tour = tour[:]
+                        improvements += 1
+                        self.report_incumbent(best_tour, best_cost)
+                else:
+                    undo_reversals(tour, positions, reversals)
+                    self._undo_double_bridge(tour, positions, kick)
+
+        self.count("kicks", iterations)
+        self.count("kicks_accepted", accepted)
+        return Solution(best_tour, best_cost, {
+            "iterations": iterations,
+            "accepted": accepted,
+            "improvements": improvements,
+            "elapsed": time.perf_counter() - start_time,
+        })
+
+    def _accept(self, new_cost: int, cost: int) -> bool:
+        if self.acceptance == "better":
+            return new_cost < cost
+        if self.acceptance == "better_or_equal":
+            return new_cost <= cost
+        return True
+
+    def _double_bridge(self, tour: List[int], positions: List[int],
+                       cost: int) -> Tuple[int, List[int], Tuple[int, int, int]]:
+        """
+        Swap two short consecutive segments B and C (A B C D -> A C B D) in
+        place. Returns the new cost, the endpoints of the broken edges and
+        the cut points (p1, p2, p3) needed to undo the kick.
+        """
+        n = len(tour)
+        length = max(1, min(self.segment_length, (n - 2) // 3))
+        p1 = self.rng.randint(1, n - 2 * length - 1)
+        p2 = p1 + self.rng.randint(1, length)
+        p3 = p2 + self.rng.randint(1, length)
+
+        distance = self.instance.distance
+        a1, a2 = tour[p1 - 1], tour[p1]
+        b1, b2 = tour[p2 - 1], tour[p2]
+        c1, c2 = tour[p3 - 1], tour[p3]
+        delta = (distance(a1, b2) + distance(c1, a2) + distance(b1, c2)
+                 - distance(a1, a2) - distance(b1, b2) - distance(c1, c2))
+
+        tour[p1:p3] = tour[p2:p3] + tour[p1:p2]
+        for i in range(p1, p3):
+            positions[tour[i]] = i
+        return cost + delta, [a1, a2, b1, b2, c1, c2], (p1, p2, p3)
+
+    @staticmethod
+    def _undo_double_bridge(tour: List[int], positions: List[int], kick: Tuple[int, int, int]):
+        # C now starts at p1 and B right after it: swap them back
+        p1, p2, p3 = kick
+        middle = p1 + p3 - p2
+        tour[p1:p3] = tour[middle:p3] + tour[p1:middle]
+        for i in range(p1, p3):
+            positions[tour[i]] = i
@@ -1,12 +1,44 @@
 
-from typing import List, Optional
-from ..model.tsp_model import Solver, Solution, TSPInstance
+from typing import Iterable, List, Optional, Tuple
+from ..model.tsp_model import Solver, Solution, TSPInstance, InitialSolution, load_initial_solution
 from ..constructive.nearest_neighbor import ConstructiveSolver
 
+def reverse_segment(tour: List[int], positions: List[int], i: int, j: int):
+    """
+    Reverse the cyclic segment tour[i..j], or its shorter complement. The
+    move is its own inverse: calling it again with the same i, j undoes it.
+    """
+    n = len(tour)
+    length = (j - i) % n + 1
+    if 2 * length > n:
+        # Reversing the complement yields the same cycle
+        i, j = (j + 1) % n, (i - 1) % n
+        length = n - length
+    if i <= j:
+        # Contiguous segment: one slice reversal, then one pass over positions
+        tour[i:j + 1] = tour[i:j + 1][::-1]
+        for k in range(i, j + 1):
+            positions[tour[k]] = k
+        return
+    for _ in range(length // 2):
+        tour[i], tour[j] = tour[j], tour[i]
+        positions[tour[i]] = i
+        positions[tour[j]] = j
+        i = (i + 1) % n
+        j = (j - 1) % n
+
+def undo_reversals(tour: List[int], positions: List[int], undo: List[Tuple[int, int]]):
+    """Revert the reversals logged by two_opt_neighbors_inplace, last first."""
+    for i, j in reversed(undo):
+        reverse_segment(tour, positions, i, j)
+
 class LocalSearchSolver(Solver):
-    def __init__(self, instance: TSPInstance, initial_solution: Optional[Solution] = None):
+    def __init__(self, instance: TSPInstance, initial_solution: InitialSolution = None,
+                 neighbor_list_size: Optional[int] = None):
         super().__init__(instance)
-        self.initial_solution = initial_solution
+        self.initial_solution = load_initial_solution(instance, initial_solution)
+        # None: exhaustive 2-opt, otherwise 2-opt restricted to the k nearest neighbours
+        self.neighbor_list_size = neighbor_list_size
 
     def solve(self) -> Solution:
         if self.initial_solution:
@@ -14,11 +46,13 @@ class LocalSearchSolver(Solver):
             current_cost = self.initial_solution.cost
         else:
             # Generate a random or simple constructive solution first if none provided
-            constructive = ConstructiveSolver(self.instance)
+            constructive = self.instrument(ConstructiveSolver(self.instance))
             sol = constructive.solve()
             current_tour = sol.tour
             current_cost = sol.cost
-            
+
+        if self.neighbor_list_size:
+            return self.two_opt_neighbors(current_tour, current_cost)
         return self.two_opt(current_tour, current_cost)
 
     def two_opt(self, tour: List[int], cost: int) -> Solution:
@@ -26,23 +60,115 @@ class LocalSearchSolver(Solver):
         best_tour = tour[:]
         best_cost = cost
         n = len(tour)
-        
-        while improved:
+        passes = applied = 0
+
+        while improved and not self.stop_requested():
             improved = False
+            passes += 1
             for i in range(1, n - 1):
+                if self.stop_requested():
+                    break
                 for j in range(i + 1, n):
                     if j - i == 1: continue # No change for adjacent edges
-                    
+
                     u1, v1 = best_tour[i-1], best_tour[i]
                     u2, v2 = best_tour[j], best_tour[(j+1)%n]
-                    
+
                     current_delta = self.instance.distance(u1, v1) + self.instance.distance(u2, v2)
                     new_delta = self.instance.distance(u1, u2) + self.instance.distance(v1, v2)
-                    
+
                     if new_delta < current_delta:
                         # Perform swap
                         best_tour[i:j+1] = reversed(best_tour[i:j+1])
                         best_cost -= (current_delta - new_delta)
                         improved = True
-        
+                        applied += 1
+            if improved:
+                self.report_incumbent(best_tour, best_cost)
+
+        if self.instrumentation is not None:
+            # Every pass scans all (i, j) pairs with j > i + 1
+            self.count("two_opt_passes", passes)
+            self.count("moves_evaluated", passes * max(0, (n - 2) * (n - 3) // 2))
+            self.count("moves_applied", applied)
+        return Solution(best_tour, best_cost)
+
+    def two_opt_neighbors(self, tour: List[int], cost: int, active: Optional[Iterable[int]] = None) -> Solution:
+        """
+        2-opt restricted to neighbour lists with don't-look bits. Only the
+        cities in `active` (all of them by default) are scanned at first;
+        cities touched by an improving move are scanned again.
+        """
+        best_tour = tour[:]
+        positions = [0] * len(tour)
+        for i, city in enumerate(best_tour):
+            positions[city] = i
+        if active is None:
+            active = best_tour
+        best_cost = self.two_opt_neighbors_inplace(best_tour, positions, cost, active)
+        if best_cost < cost:
+            self.report_incumbent(best_tour, best_cost)
         return Solution(best_tour, best_cost)
+
+    def two_opt_neighbors_inplace(self, tour: List[int], positions: List[int], cost: int,
+                                  active: Iterable[int], undo: Optional[List[Tuple[int, int]]] = None) -> int:
+        """
+        Same as two_opt_neighbors on a tour/position array pair; returns the
+        new cost. The (i, j) of every applied reversal is appended to `undo`
+        if given, so that the caller can revert them (see undo_reversals).
+        """
+        n = len(tour)
+        if n < 4:
+            return cost
+        distance = self.instance.distance
+        neighbors = self.instance.neighbor_lists(self.neighbor_list_size or 10)
+
+        stop_requested = self._stop_event.is_set
+        queue = list(active)
+        queued = set(queue)
+        scanned = applied = 0
+        while queue and not stop_requested():
+            a = queue.pop()
+            queued.discard(a)
+            scanned += 1
+
+            improved = False
+            for forward in (True, False):
+                pos_a = positions[a]
+                b = tour[(pos_a + 1) % n] if forward else tour[pos_a - 1]
+                d_ab = distance(a, b)
+                for c in neighbors[a]:
+                    d_ac = distance(a, c)
+                    if d_ac >= d_ab:
+                        break  # neighbours are sorted: no gain possible beyond
+                    pos_c = positions[c]
+                    d = tour[(pos_c + 1) % n] if forward else tour[pos_c - 1]
+                    if c == b or d == a:
+                        continue
+                    delta = d_ac + distance(b, d) - d_ab - distance(c, d)
+                    if delta < 0:
+                        if forward:
+                            # a b ... c d  ->  a c ... b d
+                            i, j = positions[b], pos_c
+                        else:
+                            # d c ... b a  ->  d b ... c a
+                            i, j = pos_c, positions[b]
+                        reverse_segment(tour, positions, i, j)
+                        if undo is not None:
+                            undo.append((i, j))
+                        cost += delta
+                        applied += 1
+                        for city in (a, b, c, d):
+                            if city not in queued:
+                                queued.add(city)
+                                queue.append(city)
+                        improved = True
+                        break
+                if improved:
+                    break
+
+        if self.instrumentation is not None:
+            # Counted per scanned city, not per candidate, to keep the inner loop bare
+            self.count("cities_scanned", scanned)
+            self.count("moves_applied", applied)
+        return cost
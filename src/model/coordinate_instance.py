@@ -0,0 +1,185 @@
+
+"""
+Instances given by point coordinates (TSPLIB NODE_COORD_SECTION, EUC_2D).
+
+Only the coordinates are stored, so memory is O(n) and loading is a single
+pass over n lines; distances are computed on demand with the TSPLIB nint
+rounding. Neighbour lists come from a uniform grid (about two points per
+cell) searched ring by ring, instead of sorting full matrix rows.
+"""
+
+import copy
+import heapq
+import math
+from typing import List, Optional, Sequence, Tuple
+from .tsp_model import TSPInstance, np
+
+# Distance functions understood (TSPLIB EDGE_WEIGHT_TYPE)
+EDGE_WEIGHT_TYPES = ("EUC_2D",)
+# Average number of points per grid cell
+POINTS_PER_CELL = 2
+
+def is_tsplib_file(filepath: str) -> bool:
+    """Whether the file starts with a TSPLIB header rather than the city count of the .in format."""
+    with open(filepath) as f:
+        for line in f:
+            if line.strip():
+                return not line.split()[0].isdigit()
+    return False
+
+def read_tsplib_coordinates(filepath: str) -> Tuple[List[float], List[float]]:
+    header = {}
+    xs: List[float] = []
+    ys: List[float] = []
+    with open(filepath) as f:
+        lines = iter(f)
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("NODE_COORD_SECTION"):
+                break
+            key, _, value = line.partition(":")
+            header[key.strip().upper()] = value.strip()
+        else:
+            raise ValueError(f"{filepath}: no NODE_COORD_SECTION")
+
+        weight_type = header.get("EDGE_WEIGHT_TYPE", "EUC_2D").upper()
+        if weight_type not in EDGE_WEIGHT_TYPES:
+            raise ValueError(f"{filepath}: unsupported EDGE_WEIGHT_TYPE {weight_type} "
+                             f"(supported: {', '.join(EDGE_WEIGHT_TYPES)})")
+        for line in lines:
+            fields = line.split()
+            if not fields:
+                continue
+            if fields[0] == "EOF":
+                break
+            # Node ids are ignored: cities are numbered 0..n-1 in file order
+            xs.append(float(fields[1]))
+            ys.append(float(fields[2]))
+
+    if "DIMENSION" in header and int(header["DIMENSION"]) != len(xs):
+        raise ValueError(f"{filepath}: DIMENSION is {header['DIMENSION']} but {len(xs)} nodes were read")
+    return xs, ys
+
+def tsplib_dimension(filepath: str) -> Optional[int]:
+    """DIMENSION from the header of a TSPLIB file, without reading the coordinates (None if absent)."""
+    with open(filepath) as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            key = key.strip().upper()
+            if key == "DIMENSION":
+                return int(value)
+            if key.startswith("NODE_COORD_SECTION"):
+                return None
+    return None
+
+class CoordinateInstance(TSPInstance):
+    """
+    Euclidean instance with on-demand distances. It has the TSPInstance
+    interface except `matrix`; use distance() or distance_row().
+    """
+
+    has_coordinates = True
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.filename = filepath.split("/")[-1]
+        self.xs, self.ys = read_tsplib_coordinates(filepath)
+        self.n = len(self.xs)
+        self._neighbor_lists = {}
+        self._distance_array = None
+        self._points = np.column_stack([self.xs, self.ys]) if np is not None else None
+
+    def distance(self, i: int, j: int) -> int:
+        return int(math.hypot(self.xs[i] - self.xs[j], self.ys[i] - self.ys[j]) + 0.5)
+
+    def distance_row(self, i: int) -> List[int]:
+        if self._points is not None:
+            deltas = self._points - self._points[i]
+            return (np.hypot(deltas[:, 0], deltas[:, 1]) + 0.5).astype(np.int64).tolist()
+        xi, yi = self.xs[i], self.ys[i]
+        return [int(math.hypot(xi - x, yi - y) + 0.5) for x, y in zip(self.xs, self.ys)]
+
+    def distance_array(self):
+        # Never materialised: the point of this class is to avoid the n x n matrix
+        return None
+
+    def tour_costs(self, tours: Sequence[Sequence[int]]) -> List[int]:
+        if len(tours) == 0:
+            return []
+        if self._points is None:
+            return [sum(self.distance(a, b) for a, b in zip(tour, list(tour[1:]) + [tour[0]])) for tour in tours]
+        batch = np.asarray(tours, dtype=np.intp)
+        deltas = self._points[batch] - self._points[np.roll(batch, -1, axis=1)]
+        lengths = (np.hypot(deltas[..., 0], deltas[..., 1]) + 0.5).astype(np.int64)
+        return lengths.sum(axis=1).tolist()
+
+    def permuted(self, order: Sequence[int]) -> "CoordinateInstance":
+        instance = copy.copy(self)
+        instance.n = len(order)
+        instance.xs = [self.xs[i] for i in order]
+        instance.ys = [self.ys[i] for i in order]
+        instance._neighbor_lists = {}
+        instance._points = np.column_stack([instance.xs, instance.ys]) if np is not None else None
+        return instance
+
+    def neighbor_lists(self, k: int) -> List[List[int]]:
+        k = min(k, self.n - 1)
+        if k not in self._neighbor_lists:
+            self._neighbor_lists[k] = self._grid_neighbor_lists(k)
+        return self._neighbor_lists[k]
+
+    def _grid_neighbor_lists(self, k: int) -> List[List[int]]:
+        if k <= 0:
+            return [[] for _ in range(self.n)]
+        xs, ys = self.xs, self.ys
+        min_x, min_y = min(xs), min(ys)
+        width = max(max(xs) - min_x, max(ys) - min_y) or 1.0
+        cells_per_side = max(1, int(math.sqrt(self.n / POINTS_PER_CELL)))
+        cell = width / cells_per_side
+        grid = {}
+        coordinates = []
+        for city in range(self.n):
+            cx = min(int((xs[city] - min_x) / cell), cells_per_side - 1)
+            cy = min(int((ys[city] - min_y) / cell), cells_per_side - 1)
+            grid.setdefault((cx, cy), []).append(city)
+            coordinates.append((cx, cy))
+
+        lists = []
+        hypot = math.hypot
+        for city in range(self.n):
+            cx, cy = coordinates[city]
+            xi, yi = xs[city], ys[city]
+            # (rounded distance, city): the order of the matrix instances, ties included
+            candidates = []
+            ring = 0
+            while True:
+                for cell_key in _ring_cells(cx, cy, ring):
+                    for other in grid.get(cell_key, ()):
+                        if other != city:
+                            candidates.append((int(hypot(xi - xs[other], yi - ys[other]) + 0.5), other))
+                # Cities outside the rings scanned so far are at least ring * cell away.
+                # Strictly below that bound, none of them can tie with the k-th city
+                if ring > 0 and len(candidates) >= k:
+                    nearest = heapq.nsmallest(k, candidates)
+                    if nearest[-1][0] < int(ring * cell + 0.5) or ring > cells_per_side:
+                        break
+                elif ring > cells_per_side:
+                    nearest = sorted(candidates)
+                    break
+                ring += 1
+            lists.append([other for _, other in nearest])
+        return lists
+
+def _ring_cells(cx: int, cy: int, ring: int):
+    """Grid cells at Chebyshev distance `ring` from (cx, cy)."""
+    if ring == 0:
+        yield cx, cy
+        return
+    for dx in range(-ring, ring + 1):
+        yield cx + dx, cy - ring
+        yield cx + dx, cy + ring
+    for dy in range(-ring + 1, ring):
+        yield cx - ring, cy + dy
+        yield cx + ring, cy + dy
@@ -0,0 +1,122 @@
+
+"""
+Seeded generator of synthetic instances, written in the .in format
+(n on the first line, then the n rows of the distance matrix).
+
+Families:
+- euclidean: uniform points in a square, TSPLIB EUC_2D rounding;
+- clustered: Gaussian clusters around uniform centres, same rounding;
+- random_metric: i.i.d. integer weights in [L, 2L], which always satisfy
+  the triangle inequality (a <= 2L <= b + c).
+
+Rows are produced one at a time, so memory stays O(n) whatever the size.
+The two point families can also be written as TSPLIB EUC_2D coordinate
+files (.tsp), loaded as CoordinateInstance without any matrix.
+"""
+
+import math
+import os
+import random
+from typing import Iterator, List, Optional, Tuple
+
+FAMILIES = ("euclidean", "clustered", "random_metric")
+MASK64 = (1 << 64) - 1
+
+Point = Tuple[float, float]
+
+def euclidean_points(n: int, rng: random.Random, side: float = 10000.0) -> List[Point]:
+    return [(rng.uniform(0, side), rng.uniform(0, side)) for _ in range(n)]
+
+def clustered_points(n: int, rng: random.Random, side: float = 10000.0,
+                     clusters: Optional[int] = None) -> List[Point]:
+    # DIMACS-style: about one centre per 100 cities, spread side / sqrt(n)
+    clusters = clusters or max(1, n // 100)
+    centres = euclidean_points(clusters, rng, side)
+    spread = side / math.sqrt(n)
+    points = []
+    for _ in range(n):
+        cx, cy = rng.choice(centres)
+        x = min(max(rng.gauss(cx, spread), 0.0), side)
+        y = min(max(rng.gauss(cy, spread), 0.0), side)
+        points.append((x, y))
+    return points
+
+def euclidean_rows(points: List[Point]) -> Iterator[List[int]]:
+    """Rows of the rounded Euclidean distance matrix (nint, as TSPLIB EUC_2D)."""
+    for xi, yi in points:
+        yield [int(math.hypot(xi - xj, yi - yj) + 0.5) for xj, yj in points]
+
+def _mix(x: int) -> int:
+    # splitmix64 finaliser
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+def random_metric_rows(n: int, rng: random.Random, low: int = 500) -> Iterator[List[int]]:
+    """Rows of a symmetric matrix with weights in [low, 2 * low]."""
+    # w(i, j) is a hash of (key, min(i, j), max(i, j)): symmetric without
+    # storing the matrix
+    key = rng.getrandbits(64)
+    for i in range(n):
+        row = []
+        for j in range(n):
+            if i == j:
+                row.append(0)
+            else:
+                a, b = (i, j) if i < j else (j, i)
+                row.append(low + _mix(key ^ (a * n + b)) % (low + 1))
+        yield row
+
+def generate_rows(family: str, n: int, seed: int) -> Iterator[List[int]]:
+    rng = random.Random(seed)
+    if family == "euclidean":
+        return euclidean_rows(euclidean_points(n, rng))
+    if family == "clustered":
+        return euclidean_rows(clustered_points(n, rng))
+    if family == "random_metric":
+        return random_metric_rows(n, rng)
+    raise ValueError(f"Unknown family: {family} (available: {', '.join(FAMILIES)})")
+
+def write_instance(filepath: str, n: int, rows: Iterator[List[int]]):
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(filepath, "w") as f:
+        f.write(f"{n}\n")
+        for row in rows:
+            f.write(" ".join(map(str, row)))
+            f.write("\n")
+
+def generate_points(family: str, n: int, seed: int) -> List[Point]:
+    rng = random.Random(seed)
+    if family == "euclidean":
+        return euclidean_points(n, rng)
+    if family == "clustered":
+        return clustered_points(n, rng)
+    raise ValueError(f"No coordinates for family: {family} (available: euclidean, clustered)")
+
+def write_coordinate_instance(filepath: str, name: str, points: List[Point]):
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(filepath, "w") as f:
+        f.write(f"NAME : {name}\nTYPE : TSP\nDIMENSION : {len(points)}\n"
+                f"EDGE_WEIGHT_TYPE : EUC_2D\nNODE_COORD_SECTION\n")
+        for index, (x, y) in enumerate(points, 1):
+            f.write(f"{index} {x:.3f} {y:.3f}\n")
+        f.write("EOF\n")
+
+def instance_path(output_dir: str, family: str, n: int, seed: int, extension: str = ".in") -> str:
+    return os.path.join(output_dir, f"{family}_{n}_s{seed}{extension}")
+
+def generate_instance(family: str, n: int, seed: int = 0, output_dir: str = "instances/generated",
+                      overwrite: bool = False, coordinates: bool = False) -> str:
+    """Write the instance (unless it already exists) and return its path."""
+    filepath = instance_path(output_dir, family, n, seed, ".tsp" if coordinates else ".in")
+    if overwrite or not os.path.exists(filepath):
+        if coordinates:
+            write_coordinate_instance(filepath, os.path.basename(filepath)[:-4], generate_points(family, n, seed))
+        else:
+            write_instance(filepath, n, generate_rows(family, n, seed))
+    return filepath
@@ -0,0 +1,139 @@
+
+"""
+City renumbering for memory locality.
+
+Solvers walk tours and neighbour lists, so consecutive accesses go to
+cities that are close in the plane but may be far apart in the instance
+arrays. Renumbering the cities so that close cities get close numbers
+makes those accesses hit neighbouring rows (matrix instances) or
+neighbouring coordinates (coordinate instances).
+
+Orderings:
+- hilbert: position along a Hilbert curve (coordinate instances);
+- nn: greedy nearest-neighbour chain over the k-nearest-neighbour lists;
+- rcm: reverse Cuthill-McKee on the symmetric k-nearest-neighbour graph,
+  which only needs distances (matrix instances).
+
+An ordering is a list `order` where new city i is original city order[i];
+tours found on the reordered instance are mapped back with to_original().
+"""
+
+from collections import deque
+from typing import Callable, Dict, List, Sequence, Tuple
+from .tsp_model import TSPInstance
+
+# Neighbour list size used by the nn and rcm orderings
+ORDERING_NEIGHBORS = 10
+# Hilbert curve resolution: 2^16 x 2^16 cells
+HILBERT_BITS = 16
+
+def hilbert_index(x: int, y: int, bits: int = HILBERT_BITS) -> int:
+    """Distance along the Hilbert curve of the cell (x, y) of a 2^bits grid."""
+    d = 0
+    s = 1 << (bits - 1)
+    while s > 0:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        d += s * s * ((3 * rx) ^ ry)
+        # Rotate the quadrant so that the curve stays continuous
+        if ry == 0:
+            if rx == 1:
+                x = s - 1 - x
+                y = s - 1 - y
+            x, y = y, x
+        s >>= 1
+    return d
+
+def hilbert_order(instance: TSPInstance) -> List[int]:
+    if not instance.has_coordinates:
+        raise ValueError("The hilbert ordering needs a coordinate instance")
+    xs, ys = instance.xs, instance.ys
+    min_x, min_y = min(xs), min(ys)
+    width = max(max(xs) - min_x, max(ys) - min_y) or 1.0
+    scale = ((1 << HILBERT_BITS) - 1) / width
+    keys = [hilbert_index(int((x - min_x) * scale), int((y - min_y) * scale)) for x, y in zip(xs, ys)]
+    return sorted(range(instance.n), key=keys.__getitem__)
+
+def nearest_neighbor_order(instance: TSPInstance) -> List[int]:
+    """
+    Greedy chain: next the closest unvisited city of the current city's
+    neighbour list. When the whole list is visited, the chain jumps to the
+    nearest unvisited city (matrix instances) or to the next unvisited city
+    along the Hilbert curve (coordinate instances, where a full scan would
+    cost O(n) per jump).
+    """
+    n = instance.n
+    neighbors = instance.neighbor_lists(ORDERING_NEIGHBORS)
+    visited = [False] * n
+    fallback = iter(hilbert_order(instance)) if instance.has_coordinates else None
+    order = []
+    current = 0
+    while True:
+        visited[current] = True
+        order.append(current)
+        if len(order) == n:
+            return order
+        next_city = next((c for c in neighbors[current] if not visited[c]), None)
+        if next_city is None:
+            if fallback is not None:
+                next_city = next(c for c in fallback if not visited[c])
+            else:
+                row = instance.distance_row(current)
+                next_city = min((c for c in range(n) if not visited[c]), key=row.__getitem__)
+        current = next_city
+
+def rcm_order(instance: TSPInstance) -> List[int]:
+    """Reverse Cuthill-McKee: BFS from a low-degree city, lower degrees first, reversed."""
+    n = instance.n
+    adjacency = [set() for _ in range(n)]
+    for i, neighbors in enumerate(instance.neighbor_lists(ORDERING_NEIGHBORS)):
+        for j in neighbors:
+            adjacency[i].add(j)
+            adjacency[j].add(i)
+    degree = [len(a) for a in adjacency]
+
+    visited = [False] * n
+    order = []
+    # One BFS per connected component, each started from its lowest-degree city
+    for start in sorted(range(n), key=degree.__getitem__):
+        if visited[start]:
+            continue
+        visited[start] = True
+        queue = deque([start])
+        while queue:
+            city = queue.popleft()
+            order.append(city)
+            for other in sorted((c for c in adjacency[city] if not visited[c]), key=degree.__getitem__):
+                visited[other] = True
+                queue.append(other)
+    order.reverse()
+    return order
+
+ORDERINGS: Dict[str, Callable[[TSPInstance], List[int]]] = {
+    "hilbert": hilbert_order,
+    "nn": nearest_neighbor_order,
+    "rcm": rcm_order,
+}
+
+def default_ordering(instance: TSPInstance) -> str:
+    return "hilbert" if instance.has_coordinates else "rcm"
+
+def reorder(instance: TSPInstance, method: str = "auto") -> Tuple[TSPInstance, List[int]]:
+    """The renumbered instance and its order ('auto': hilbert with coordinates, rcm otherwise)."""
+    if method == "auto":
+        method = default_ordering(instance)
+    if method not in ORDERINGS:
+        raise ValueError(f"Unknown ordering: {method} (available: auto, {', '.join(ORDERINGS)})")
+    order = ORDERINGS[method](instance)
+    return instance.permuted(order), order
+
+def to_original(tour: Sequence[int], order: Sequence[int]) -> List[int]:
+    """Tour of the reordered instance in the original city numbers."""
+    return [order[city] for city in tour]
+
+def to_reordered(tour: Sequence[int], order: Sequence[int]) -> List[int]:
+    """Tour in original city numbers expressed on the reordered instance."""
+    position = [0] * len(order)
+    for new, original in enumerate(order):
+        position[original] = new
+    return [position[city] for city in tour]
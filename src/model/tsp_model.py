@@ -1,11 +1,41 @@
 
-from typing import List, Tuple
+import copy
+import heapq
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # batch APIs fall back to plain Python loops
+    np = None
 
 class TSPInstance:
+    # Whether the cities have plane coordinates (xs, ys); see CoordinateInstance
+    has_coordinates = False
+
     def __init__(self, filepath: str):
         self.filepath = filepath
         self.filename = filepath.split("/")[-1]
         self.n, self.matrix = self._load_instance(filepath)
+        self._neighbor_lists = {}
+        self._distance_array = None
+
+    @classmethod
+    def from_matrix(cls, matrix: List[List[int]], name: str = "matrix") -> "TSPInstance":
+        """Instance built in memory from a distance matrix (e.g. a sub-problem)."""
+        instance = cls.__new__(cls)
+        instance.filepath = instance.filename = name
+        instance.n = len(matrix)
+        instance.matrix = matrix
+        instance._neighbor_lists = {}
+        instance._distance_array = None
+        return instance
 
     def _load_instance(self, filepath: str) -> Tuple[int, List[List[int]]]:
         with open(filepath, 'r') as f:
@@ -37,21 +67,320 @@ class TSPInstance:
     def distance(self, i: int, j: int) -> int:
         return self.matrix[i][j]
 
+    def distance_row(self, i: int) -> List[int]:
+        """Distances from city i to every city (do not modify)."""
+        return self.matrix[i]
+
+    def distance_array(self):
+        """The distance matrix as a NumPy array (built once), None without NumPy."""
+        if np is None:
+            return None
+        if self._distance_array is None:
+            self._distance_array = np.asarray(self.matrix, dtype=np.int64)
+        return self._distance_array
+
+    def tour_costs(self, tours: Sequence[Sequence[int]]) -> List[int]:
+        """
+        Costs of a batch of tours given as a (batch, n) array-like, computed
+        with a single gather-and-sum over the distance matrix.
+        """
+        if len(tours) == 0:
+            return []
+        if np is None:
+            matrix = self.matrix
+            return [sum(matrix[a][b] for a, b in zip(tour, list(tour[1:]) + [tour[0]])) for tour in tours]
+        batch = np.asarray(tours, dtype=np.intp)
+        successors = np.roll(batch, -1, axis=1)
+        return self.distance_array()[batch, successors].sum(axis=1).tolist()
+
+    def iter_tour_costs(self, tours: Iterable[Sequence[int]], chunk_size: int = 1024) -> Iterator[int]:
+        """Streaming variant of tour_costs: scores `chunk_size` tours at a time."""
+        tours = iter(tours)
+        while True:
+            chunk = list(islice(tours, chunk_size))
+            if not chunk:
+                return
+            yield from self.tour_costs(chunk)
+
+    def validate_tours(self, tours: Sequence[Sequence[int]]) -> List[bool]:
+        """For each tour, whether it is a permutation of the n cities."""
+        if len(tours) == 0:
+            return []
+        if np is None:
+            cities = list(range(self.n))
+            return [len(tour) == self.n and sorted(tour) == cities for tour in tours]
+        if any(len(tour) != self.n for tour in tours):
+            return [len(tour) == self.n and sorted(tour) == list(range(self.n)) for tour in tours]
+        batch = np.sort(np.asarray(tours, dtype=np.intp), axis=1)
+        return (batch == np.arange(self.n)).all(axis=1).tolist()
+
+    def neighbor_lists(self, k: int) -> List[List[int]]:
+        """The k nearest cities of every city, closest first (computed once per k)."""
+        k = min(k, self.n - 1)
+        if k not in self._neighbor_lists:
+            self._neighbor_lists[k] = [
+                heapq.nsmallest(k, (j for j in range(self.n) if j != i), key=self.matrix[i].__getitem__)
+                for i in range(self.n)
+            ]
+        return self._neighbor_lists[k]
+
+    def permuted(self, order: Sequence[int]) -> "TSPInstance":
+        """
+        Copy of the instance with city i of the copy being city order[i] of
+        this one; the matrix is rebuilt row by row in the new order. With a
+        subset of the cities, the copy is the sub-instance they induce.
+        """
+        instance = copy.copy(self)
+        instance.n = len(order)
+        instance.matrix = [[row[j] for j in order] for row in (self.matrix[i] for i in order)]
+        instance._neighbor_lists = {}
+        instance._distance_array = None
+        return instance
+
+def load_instance(filepath: str) -> TSPInstance:
+    """Matrix instance (.in) or, for TSPLIB coordinate files, a CoordinateInstance."""
+    # Imported here: coordinate_instance imports this module
+    from .coordinate_instance import CoordinateInstance, is_tsplib_file
+    if is_tsplib_file(filepath):
+        return CoordinateInstance(filepath)
+    return TSPInstance(filepath)
+
 class Solution:
-    def __init__(self, tour: List[int], cost: int):
+    def __init__(self, tour: List[int], cost: int, stats: Optional[Dict[str, Any]] = None):
         self.tour = tour
         self.cost = cost
+        # Optional run information filled by the solver (traces, counters...)
+        self.stats = stats if stats is not None else {}
 
     def __str__(self):
         return f"Cost: {self.cost}, Tour: {self.tour}"
 
+    def write(self, filepath: str):
+        """Write the .out format: 0-based vertex numbers on line 1, cost on line 2."""
+        with open(filepath, 'w') as f:
+            f.write(" ".join(map(str, self.tour)) + "\n")
+            f.write(str(self.cost) + "\n")
+
+    @classmethod
+    def from_file(cls, filepath: str, instance: Optional[TSPInstance] = None) -> "Solution":
+        """
+        Read the .out format back. With an instance, the tour is checked to be
+        a permutation of its cities and the cost is recomputed.
+        """
+        with open(filepath) as f:
+            lines = [line.strip() for line in f if line.strip()]
+        if not lines:
+            raise ValueError(f"{filepath}: empty solution file")
+        tour = [int(city) for city in lines[0].split()]
+        cost = int(lines[1]) if len(lines) > 1 else None
+        if instance is not None:
+            return solution_from_tour(instance, tour, filepath)
+        if cost is None:
+            raise ValueError(f"{filepath}: missing cost line")
+        return cls(tour, cost)
+
+# A warm start: a solution, a tour, or the path of an .out file
+InitialSolution = Union[Solution, Sequence[int], str, None]
+
+def solution_from_tour(instance: TSPInstance, tour: Sequence[int], source: str = "tour") -> Solution:
+    tour = list(tour)
+    if not instance.validate_tours([tour])[0]:
+        raise ValueError(f"{source}: not a tour of the {instance.n} cities of {instance.filename}")
+    return Solution(tour, instance.tour_costs([tour])[0])
+
+def load_initial_solution(instance: TSPInstance, initial: InitialSolution) -> Optional[Solution]:
+    """Solution to start from, whatever the form the warm start was given in (None: cold start)."""
+    if initial is None or isinstance(initial, Solution):
+        return initial
+    if isinstance(initial, str):
+        return Solution.from_file(initial, instance)
+    return solution_from_tour(instance, initial)
+
+class Instrumentation:
+    """
+    Phase timers, counters and incumbent history of one solver run. Solvers
+    only touch it when instrumentation is enabled; hot loops keep their
+    counts in locals and add them once at the end.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.timers: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        # (seconds since start, cost) of every reported incumbent
+        self.incumbents: List[Tuple[float, int]] = []
+        self.distance_lookups = 0
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timers[name] = self.timers.get(name, 0.0) + time.perf_counter() - start
+
+    def record_incumbent(self, cost: int):
+        self.incumbents.append((time.perf_counter() - self.start, cost))
+
+    def as_dict(self) -> Dict[str, Any]:
+        counters = dict(self.counters, distance_lookups=self.distance_lookups)
+        return {"timers": dict(self.timers), "counters": counters, "incumbents": list(self.incumbents)}
+
+def write_json_atomic(filepath: str, data: Any):
+    """Write JSON to a temporary file then rename it, so a killed writer never leaves a truncated file."""
+    directory = os.path.dirname(os.path.abspath(filepath))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, filepath)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+class Checkpoint:
+    """
+    On-disk state of a long solver run, saved at most every `interval`
+    seconds. The solver decides what the state holds; the checkpoint adds
+    the solver class and the instance size, checked when it is loaded back.
+    """
+
+    def __init__(self, path: str, interval: float = 60.0):
+        self.path = path
+        self.interval = interval
+        self._last_save = time.perf_counter()
+
+    def due(self) -> bool:
+        return time.perf_counter() - self._last_save >= self.interval
+
+    def save(self, solver: "Solver", state: Dict[str, Any]):
+        write_json_atomic(self.path, dict(state, solver=type(solver).__name__, n=solver.instance.n))
+        self._last_save = time.perf_counter()
+
+    def load(self, solver: "Solver") -> Optional[Dict[str, Any]]:
+        """The saved state, or None if there is no checkpoint file yet."""
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path) as f:
+            state = json.load(f)
+        if state.get("solver") != type(solver).__name__ or state.get("n") != solver.instance.n:
+            raise ValueError(f"{self.path}: checkpoint of {state.get('solver')} on n={state.get('n')}, "
+                             f"not {type(solver).__name__} on n={solver.instance.n}")
+        return state
+
+class CountingInstance:
+    """
+    TSPInstance proxy counting distance lookups into an Instrumentation: one
+    per distance() call, len(row) per distance_row() call. Neighbour lists
+    and batch tour costs (tour_costs, validate_tours) are not counted: they
+    are computed once or outside the search loops.
+    """
+
+    def __init__(self, instance: TSPInstance, instrumentation: Instrumentation):
+        self._instance = instance
+        self._instrumentation = instrumentation
+        self._distance = instance.distance
+        self._distance_row = instance.distance_row
+
+    def distance(self, i: int, j: int) -> int:
+        self._instrumentation.distance_lookups += 1
+        return self._distance(i, j)
+
+    def distance_row(self, i: int) -> List[int]:
+        row = self._distance_row(i)
+        self._instrumentation.distance_lookups += len(row)
+        return row
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self._instance, name)
+
+    def __reduce__(self):
+        # Pickled (e.g. for worker processes) as the plain instance
+        return self._instance.__reduce_ex__(2)
+
 class Solver:
+    # Whether solve() saves and resumes from a Checkpoint (see enable_checkpoint)
+    supports_checkpoint = False
+
     def __init__(self, instance: TSPInstance):
         self.instance = instance
+        # Called with a copy of every new incumbent (may run in a worker thread)
+        self.on_improvement: Optional[Callable[[Solution], None]] = None
+        # Shared with the sub-solvers passed to instrument(), so that a stop
+        # request also interrupts the one currently running
+        self._stop_event = threading.Event()
+        # Off by default: see enable_instrumentation
+        self.instrumentation: Optional[Instrumentation] = None
+        self._record_incumbents = True
+        self.checkpoint: Optional[Checkpoint] = None
+
+    def enable_instrumentation(self, instrumentation: Optional[Instrumentation] = None,
+                               record_incumbents: bool = True) -> Instrumentation:
+        """
+        Collect phase timers, counters and incumbent history during solve().
+        Distance lookups are counted through a proxy instance, so instrumented
+        runs are slower than plain ones.
+        """
+        self.instrumentation = instrumentation or Instrumentation()
+        self._record_incumbents = record_incumbents
+        if not isinstance(self.instance, CountingInstance):
+            self.instance = CountingInstance(self.instance, self.instrumentation)
+        return self.instrumentation
+
+    def enable_checkpoint(self, path: str, interval: float = 60.0) -> Checkpoint:
+        """
+        Periodically save the search state to `path` during solve(), and resume
+        from it if the file already exists.
+        """
+        if not self.supports_checkpoint:
+            raise ValueError(f"{type(self).__name__} does not support checkpoints")
+        self.checkpoint = Checkpoint(path, interval)
+        return self.checkpoint
+
+    def instrument(self, solver: "Solver") -> "Solver":
+        """
+        Share this solver's instrumentation (its incumbents are not recorded)
+        and stop flag with a sub-solver.
+        """
+        solver._stop_event = self._stop_event
+        if self.instrumentation is not None:
+            solver.enable_instrumentation(self.instrumentation, record_incumbents=False)
+        return solver
+
+    def count(self, name: str, amount: int = 1):
+        if self.instrumentation is not None:
+            self.instrumentation.count(name, amount)
+
+    def phase(self, name: str):
+        """Context manager timing a phase (a no-op without instrumentation)."""
+        if self.instrumentation is None:
+            return nullcontext()
+        return self.instrumentation.phase(name)
 
     def solve(self) -> Solution:
         raise NotImplementedError
 
+    def request_stop(self):
+        """Ask a running solve() to return its best solution so far (thread-safe, cooperative)."""
+        self._stop_event.set()
+
+    def stop_requested(self) -> bool:
+        return self._stop_event.is_set()
+
+    def report_incumbent(self, tour: List[int], cost: int):
+        if self.instrumentation is not None and self._record_incumbents:
+            self.instrumentation.record_incumbent(cost)
+        if self.on_improvement is not None:
+            self.on_improvement(Solution(tour[:], cost))
+
     def calculate_cost(self, tour: List[int]) -> int:
         cost = 0
         for i in range(len(tour)):
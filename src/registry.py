@@ -0,0 +1,190 @@
+
+"""
+Registry of the available solvers.
+
+Each solver is described by its name, the module and class implementing it
+and the schema of its tunable parameters. Solver modules are only imported
+when a solver is actually requested, so that scripts running a single method
+do not pay for importing all of them.
+"""
+
+import importlib
+from typing import Any, Dict, List, Optional, Type
+from .model.tsp_model import Solver, TSPInstance
+
+class ParamSpec:
+    def __init__(self, type: type, default: Any, help: str = ""):
+        self.type = type
+        self.default = default
+        self.help = help
+
+    def parse(self, text: str) -> Any:
+        """Convert a command-line string to the parameter type ('none' gives None)."""
+        if text.lower() == "none":
+            return None
+        if self.type is bool:
+            if text.lower() in ("1", "true", "yes", "on"):
+                return True
+            if text.lower() in ("0", "false", "no", "off"):
+                return False
+            raise ValueError(f"Invalid boolean value: {text}")
+        return self.type(text)
+
+class SolverSpec:
+    def __init__(self, name: str, module: str, class_name: str, description: str,
+                 params: Optional[Dict[str, ParamSpec]] = None):
+        self.name = name
+        self.module = module
+        self.class_name = class_name
+        self.description = description
+        self.params = params or {}
+
+    def load(self) -> Type[Solver]:
+        # Relative module names are resolved against this package
+        return getattr(importlib.import_module(self.module, __package__), self.class_name)
+
+SOLVERS: Dict[str, SolverSpec] = {}
+
+def register_solver(spec: SolverSpec):
+    SOLVERS[spec.name] = spec
+
+def available_solvers() -> List[str]:
+    return list(SOLVERS)
+
+def get_spec(name: str) -> SolverSpec:
+    if name not in SOLVERS:
+        raise KeyError(f"Unknown method: {name} (available: {', '.join(SOLVERS)})")
+    return SOLVERS[name]
+
+def get_solver_class(name: str) -> Type[Solver]:
+    return get_spec(name).load()
+
+def create_solver(name: str, instance: TSPInstance, **params) -> Solver:
+    """Instantiate a registered solver; params are passed to its constructor."""
+    return get_solver_class(name)(instance, **params)
+
+def parse_params(name: str, assignments: List[str]) -> Dict[str, Any]:
+    """Parse 'key=value' strings against the parameter schema of a solver."""
+    values = {}
+    for assignment in assignments:
+        key, sep, value = assignment.partition("=")
+        if not sep:
+            raise ValueError(f"Expected key=value, got: {assignment}")
+        values[key.strip()] = value.strip()
+    return convert_params(name, values)
+
+def convert_params(name: str, values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Check parameter names against the schema of a solver and convert their
+    values (strings, or JSON scalars) with ParamSpec.parse.
+    """
+    spec = get_spec(name)
+    params = {}
+    for key, value in values.items():
+        key = key.replace("-", "_")
+        if key not in spec.params:
+            raise ValueError(f"Unknown parameter '{key}' for {name} (available: {', '.join(spec.params)})")
+        params[key] = spec.params[key].parse(str(value))
+    return params
+
+register_solver(SolverSpec(
+    "exact", ".exact.branch_and_bound", "BranchAndBoundSolver",
+    "Branch and Bound (DFS, MST lower bound)",
+    {
+        "time_limit": ParamSpec(int, 300, "time limit in seconds"),
+        "initial_solution": ParamSpec(str, None, "warm start: .out file of a previous run"),
+    },
+))
+register_solver(SolverSpec(
+    "held_karp", ".exact.held_karp", "HeldKarpSolver",
+    "Held-Karp dynamic programming (exact, small instances only)",
+    {"max_size": ParamSpec(int, 16, "refuse larger instances")},
+))
+register_solver(SolverSpec(
+    "constructive", ".constructive.nearest_neighbor", "ConstructiveSolver",
+    "Nearest neighbour heuristic",
+))
+register_solver(SolverSpec(
+    "local_search", ".local_search.two_opt", "LocalSearchSolver",
+    "2-opt descent from the nearest neighbour tour",
+    {
+        "neighbor_list_size": ParamSpec(int, None, "restrict 2-opt to the k nearest neighbours"),
+        "initial_solution": ParamSpec(str, None, "warm start: .out file of a previous run"),
+    },
+))
+register_solver(SolverSpec(
+    "grasp", ".grasp.grasp_solver", "GRASPSolver",
+    "GRASP (randomized greedy + 2-opt)",
+    {
+        "max_iterations": ParamSpec(int, 50, "number of iterations"),
+        "alpha": ParamSpec(float, 0.2, "RCL threshold"),
+        "reactive": ParamSpec(bool, False, "learn alpha online"),
+        "path_relinking": ParamSpec(str, None, "forward, backward or mixed"),
+        "elite_size": ParamSpec(int, 10, "elite pool size"),
+        "max_no_improvement": ParamSpec(int, None, "stop after k iterations without improvement"),
+        "target_cost": ParamSpec(int, None, "stop once this cost is reached"),
+        "time_limit": ParamSpec(float, None, "time limit in seconds"),
+        "min_improvement_probability": ParamSpec(float, None, "stop when improving becomes unlikely"),
+        "cache_size": ParamSpec(int, 1024, "constructed tour cache size"),
+        "candidate_list_size": ParamSpec(int, None, "maximum RCL size (cheapest candidates)"),
+        "neighbor_list_size": ParamSpec(int, None, "2-opt on k-nearest neighbour lists (None: full 2-opt)"),
+        "tour_merging": ParamSpec(bool, False, "merge the best elite tours at the end"),
+        "merge_top_k": ParamSpec(int, 5, "elite tours merged"),
+        "initial_solution": ParamSpec(str, None, "warm start: .out file of a previous run"),
+        "seed": ParamSpec(int, None, "random seed"),
+    },
+))
+register_solver(SolverSpec(
+    "ils", ".ils.ils_solver", "IteratedLocalSearchSolver",
+    "Iterated Local Search (double bridge + neighbour-list 2-opt)",
+    {
+        "max_iterations": ParamSpec(int, 1000, "number of kicks"),
+        "time_limit": ParamSpec(float, None, "time limit in seconds"),
+        "neighbor_list_size": ParamSpec(int, 10, "neighbour list size"),
+        "segment_length": ParamSpec(int, 50, "maximum double-bridge segment length"),
+        "acceptance": ParamSpec(str, "better", "better, better_or_equal or walk"),
+        "initial_solution": ParamSpec(str, None, "warm start: .out file of a previous run"),
+        "seed": ParamSpec(int, None, "random seed"),
+    },
+))
+register_solver(SolverSpec(
+    "annealing", ".annealing.annealing_solver", "SimulatedAnnealingSolver",
+    "Simulated annealing (2-opt / Or-opt moves)",
+    {
+        "time_limit": ParamSpec(float, 1.0, "time budget in seconds"),
+        "max_moves": ParamSpec(int, None, "move budget"),
+        "neighbor_list_size": ParamSpec(int, 10, "neighbour list size"),
+        "or_opt_probability": ParamSpec(float, 0.3, "share of Or-opt moves"),
+        "initial_solution": ParamSpec(str, None, "warm start: .out file of a previous run"),
+        "seed": ParamSpec(int, None, "random seed"),
+    },
+))
+register_solver(SolverSpec(
+    "genetic", ".genetic.genetic_solver", "GeneticSolver",
+    "Genetic algorithm (OX / EAX crossover + 2-opt)",
+    {
+        "population_size": ParamSpec(int, 30, "population size"),
+        "generations": ParamSpec(int, 100, "number of generations"),
+        "time_limit": ParamSpec(float, None, "time limit in seconds"),
+        "crossover": ParamSpec(str, "ox", "ox or eax"),
+        "mutation_rate": ParamSpec(float, 0.2, "mutation probability"),
+        "workers": ParamSpec(int, 1, "processes for the offspring local search"),
+        "initial_solution": ParamSpec(str, None, "warm start: .out file of a previous run"),
+        "seed": ParamSpec(int, None, "random seed"),
+    },
+))
+register_solver(SolverSpec(
+    "decomposition", ".decomposition.decomposition_solver", "DecompositionSolver",
+    "Decomposition for large instances (cluster paths + 2-opt + POPMUSIC windows)",
+    {
+        "cluster_size": ParamSpec(int, 200, "cities per cluster"),
+        "window_size": ParamSpec(int, 100, "cities per re-optimized window"),
+        "method": ParamSpec(str, "ils", "solver of the clusters and windows"),
+        "sub_iterations": ParamSpec(int, 200, "max_iterations of the sub-problem solver"),
+        "max_passes": ParamSpec(int, 5, "window passes over the tour"),
+        "time_limit": ParamSpec(float, None, "time limit in seconds"),
+        "workers": ParamSpec(int, 1, "processes for the sub-problems"),
+        "initial_solution": ParamSpec(str, None, "warm start: .out file of a previous run"),
+        "seed": ParamSpec(int, None, "random seed"),
+    },
+))
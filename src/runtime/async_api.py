@@ -0,0 +1,78 @@
+
+"""
+Asyncio front-end for the solvers.
+
+    run = submit("grasp", instance, max_iterations=None, time_limit=30)
+    async for incumbent in run.incumbents():
+        print(incumbent.cost)
+    best = await run.result()
+
+A run executes in a thread pool; cancelling it asks the solver to stop at its
+next check and still returns the best tour found so far.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Executor
+from typing import AsyncIterator, Optional, Tuple
+from ..model.tsp_model import Solution, Solver, TSPInstance
+from ..registry import create_solver
+
+_DONE = object()
+
+class SolverRun:
+    def __init__(self, solver: Solver, executor: Optional[Executor] = None):
+        self.solver = solver
+        self.best: Optional[Solution] = None
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        solver.on_improvement = self._improvement_from_thread
+        self._future = self._loop.run_in_executor(executor, solver.solve)
+        self._future.add_done_callback(lambda _: self._queue.put_nowait(_DONE))
+
+    def _improvement_from_thread(self, solution: Solution):
+        self._loop.call_soon_threadsafe(self._on_improvement, solution)
+
+    def _on_improvement(self, solution: Solution):
+        if self.best is None or solution.cost < self.best.cost:
+            self.best = solution
+            self._queue.put_nowait(solution)
+
+    async def incumbents(self) -> AsyncIterator[Solution]:
+        """Every improving incumbent, until the run finishes (single consumer)."""
+        while True:
+            item = await self._queue.get()
+            if item is _DONE:
+                return
+            yield item
+
+    async def result(self) -> Solution:
+        solution = await asyncio.shield(self._future)
+        if solution is not None and (self.best is None or solution.cost <= self.best.cost):
+            self.best = solution
+        return self.best
+
+    async def cancel(self) -> Optional[Solution]:
+        """Stop the solver and return the best solution found so far."""
+        self.solver.request_stop()
+        return await self.result()
+
+    def done(self) -> bool:
+        return self._future.done()
+
+def submit(method: str, instance: TSPInstance, executor: Optional[Executor] = None, **params) -> SolverRun:
+    """Start a registered solver in `executor` (default: the loop's thread pool)."""
+    return SolverRun(create_solver(method, instance, **params), executor)
+
+async def solve_with_timeout(method: str, instance: TSPInstance, timeout: Optional[float],
+                             executor: Optional[Executor] = None, **params) -> Tuple[Optional[Solution], str, float]:
+    """Run a solver for at most `timeout` seconds; returns (best solution, status, elapsed)."""
+    start = time.perf_counter()
+    run = submit(method, instance, executor, **params)
+    try:
+        solution = await asyncio.wait_for(run.result(), timeout)
+        status = "completed"
+    except asyncio.TimeoutError:
+        solution = await run.cancel()
+        status = "timeout"
+    return solution, status, time.perf_counter() - start
@@ -0,0 +1,105 @@
+
+"""
+Batch solving: every (instance, method) pair runs as a job on a process pool.
+"""
+
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+from ..model.tsp_model import TSPInstance, load_instance
+from ..registry import create_solver
+
+class BatchJob:
+    def __init__(self, instance_file: str, method: str, params: Optional[Dict[str, Any]] = None,
+                 output_dir: str = "."):
+        self.instance_file = instance_file
+        self.method = method
+        self.params = params or {}
+        self.output_dir = output_dir
+
+    def output_file(self) -> str:
+        base_name = os.path.splitext(os.path.basename(self.instance_file))[0]
+        return os.path.join(self.output_dir, f"{base_name}_{self.method}.out")
+
+def expand_instances(patterns: List[str]) -> List[str]:
+    """Instance files matching the given files, directories (*.in, *.tsp) or glob patterns."""
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            files.extend(glob.glob(os.path.join(pattern, "*.in")))
+            files.extend(glob.glob(os.path.join(pattern, "*.tsp")))
+        else:
+            files.extend(glob.glob(pattern))
+    # Small instances first, duplicates removed
+    return sorted(set(files), key=lambda f: (os.path.getsize(f), f))
+
+@lru_cache(maxsize=4)
+def _load_instance(instance_file: str) -> TSPInstance:
+    # Per-process cache: a worker running several methods on one file loads it once
+    return load_instance(instance_file)
+
+def run_job(job: BatchJob) -> Dict[str, Any]:
+    row = {
+        "instance": os.path.basename(job.instance_file),
+        "method": job.method,
+        "size": None,
+        "cost": None,
+        "time": None,
+        "output": None,
+        "status": "completed",
+    }
+    try:
+        instance = _load_instance(job.instance_file)
+        row["size"] = instance.n
+        solver = create_solver(job.method, instance, **job.params)
+        start = time.perf_counter()
+        solution = solver.solve()
+        row["time"] = time.perf_counter() - start
+        row["cost"] = solution.cost
+        os.makedirs(job.output_dir, exist_ok=True)
+        solution.write(job.output_file())
+        row["output"] = job.output_file()
+    except Exception as e:
+        row["status"] = f"error: {e}"
+    return row
+
+def run_batch(jobs: List[BatchJob], workers: int = 1, verbose: bool = True) -> List[Dict[str, Any]]:
+    """Run the jobs on `workers` processes; results come back in job order."""
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+    if workers <= 1:
+        for index, job in enumerate(jobs):
+            results[index] = run_job(job)
+            if verbose:
+                _print_progress(index, results, len(jobs))
+        return results
+
+    with ProcessPoolExecutor(workers) as executor:
+        futures = {executor.submit(run_job, job): index for index, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            index = futures[future]
+            results[index] = future.result()
+            if verbose:
+                _print_progress(index, results, len(jobs))
+    return results
+
+def _print_progress(index: int, results: List[Optional[Dict[str, Any]]], total: int):
+    done = sum(r is not None for r in results)
+    row = results[index]
+    if row["status"] == "completed":
+        print(f"[{done}/{total}] {row['instance']} {row['method']}: {row['cost']} ({row['time']:.3f}s)")
+    else:
+        print(f"[{done}/{total}] {row['instance']} {row['method']}: {row['status']}")
+
+def print_summary(results: List[Dict[str, Any]], elapsed: float):
+    print(f"\n{'Instance':<15} {'Size':>6} {'Method':<14} {'Cost':>10} {'Time (s)':>10}  Status")
+    print("-" * 70)
+    for row in results:
+        size = row["size"] if row["size"] is not None else "-"
+        cost = row["cost"] if row["cost"] is not None else "-"
+        duration = f"{row['time']:.3f}" if row["time"] is not None else "-"
+        print(f"{row['instance']:<15} {size:>6} {row['method']:<14} {cost:>10} {duration:>10}  {row['status']}")
+    failed = sum(row["status"] != "completed" for row in results)
+    print(f"\n{len(results)} jobs, {failed} failed, wall time {elapsed:.2f}s")
@@ -0,0 +1,161 @@
+
+"""
+Run solvers in child processes with a wall-clock deadline and a memory cap.
+
+The child sends every incumbent over a pipe, so a run killed at its deadline
+still returns the best tour found so far. Several runs can be started at
+once and are supervised together.
+
+Reported times are solve() times: the child times solve() itself, so that
+process start-up and instance transfer are not counted. The deadline, on
+the other hand, runs from the start of the process.
+"""
+
+import multiprocessing as mp
+import time
+from multiprocessing.connection import wait
+from typing import Any, Dict, List, Optional
+from ..model.tsp_model import TSPInstance
+from ..registry import create_solver
+
+# Time given to a child to exit after SIGTERM before it is killed
+TERMINATE_GRACE = 1.0
+
+class RunSpec:
+    def __init__(self, method: str, timeout: Optional[float] = None,
+                 memory_limit_mb: Optional[int] = None, **params):
+        self.method = method
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.params = params
+
+def _child(connection, method: str, instance: TSPInstance, params: Dict[str, Any],
+           memory_limit_mb: Optional[int]):
+    try:
+        if memory_limit_mb:
+            import resource  # POSIX only
+            limit = memory_limit_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        solver = create_solver(method, instance, **params)
+        solver.on_improvement = lambda s: connection.send(("incumbent", s.tour, s.cost))
+        connection.send(("started",))
+        start = time.perf_counter()
+        solution = solver.solve()
+        connection.send(("done", solution.tour, solution.cost, time.perf_counter() - start))
+    except MemoryError:
+        connection.send(("error", "memory limit exceeded"))
+    except Exception as e:
+        connection.send(("error", str(e)))
+    finally:
+        connection.close()
+
+class _Run:
+    def __init__(self, spec: RunSpec, instance: TSPInstance, context):
+        self.spec = spec
+        self.connection, child_connection = context.Pipe(duplex=False)
+        self.process = context.Process(
+            target=_child,
+            args=(child_connection, spec.method, instance, spec.params, spec.memory_limit_mb),
+            daemon=True,
+        )
+        self.start = time.perf_counter()
+        self.process.start()
+        child_connection.close()
+        self.deadline = self.start + spec.timeout if spec.timeout else None
+        # When the child's "started" message arrived: solve() began then
+        self.solve_start = None
+        self.tour = None
+        self.cost = float('inf')
+        self.status = None
+        self.elapsed = None
+
+    def receive(self):
+        """Read every pending message; sets the status once the child is finished."""
+        try:
+            while self.connection.poll():
+                message = self.connection.recv()
+                if message[0] == "started":
+                    self.solve_start = time.perf_counter()
+                elif message[0] in ("incumbent", "done"):
+                    if message[2] <= self.cost:
+                        self.tour, self.cost = message[1], message[2]
+                    if message[0] == "done":
+                        self._finish("completed", message[3])
+                else:
+                    self._finish(f"error: {message[1]}")
+        except (EOFError, OSError):
+            # Pipe closed without a final message: the child died
+            self.process.join()
+            self._finish(f"error: process exited with code {self.process.exitcode}")
+
+    def kill(self):
+        # Pending messages first: the solve() start time, or a result sent just in time
+        self.receive()
+        if self.status is not None:
+            self.process.join()
+            return
+        self.process.terminate()
+        self.process.join(TERMINATE_GRACE)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        # Set first, so that the closed pipe is not reported as a crash
+        self._finish("timeout")
+        self.receive()
+
+    def _finish(self, status: str, elapsed: Optional[float] = None):
+        if self.status is None:
+            self.status = status
+            if elapsed is None:
+                # Timeout or crash: solve() time as seen from the parent
+                elapsed = time.perf_counter() - (self.solve_start or self.start)
+            self.elapsed = elapsed
+
+    def result(self) -> Dict[str, Any]:
+        return {
+            'solution': self.tour,
+            'cost': self.cost,
+            'time': self.elapsed,
+            'status': self.status,
+        }
+
+def run_many(instance: TSPInstance, specs: List[RunSpec], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Run the specs, each in its own process, at most `workers` at a time (all
+    at once by default; use 1 when the times are compared). Results are
+    dicts with 'solution' (best tour or None), 'cost', 'time' and 'status'
+    ('completed', 'timeout' or 'error: ...'), in the order of `specs`.
+    """
+    context = mp.get_context()
+    pending = list(specs)
+    runs = []
+    active = []
+    while pending or active:
+        while pending and (workers is None or len(active) < workers):
+            run = _Run(pending.pop(0), instance, context)
+            runs.append(run)
+            active.append(run)
+        now = time.perf_counter()
+        for run in [r for r in active if r.deadline is not None and r.deadline <= now]:
+            run.kill()
+            active.remove(run)
+        if not active:
+            continue
+
+        deadlines = [r.deadline for r in active if r.deadline is not None]
+        timeout = max(0.0, min(deadlines) - time.perf_counter()) if deadlines else None
+        ready = wait([r.connection for r in active], timeout)
+        for run in [r for r in active if r.connection in ready]:
+            run.receive()
+            if run.status is not None:
+                run.process.join()
+                active.remove(run)
+
+    for run in runs:
+        run.connection.close()
+    return [run.result() for run in runs]
+
+def run_isolated(method: str, instance: TSPInstance, timeout: Optional[float] = None,
+                 memory_limit_mb: Optional[int] = None, **params) -> Dict[str, Any]:
+    """Single-run shortcut for run_many."""
+    return run_many(instance, [RunSpec(method, timeout, memory_limit_mb, **params)])[0]
@@ -0,0 +1,183 @@
+
+"""
+Long-running solve service.
+
+Requests and responses are JSON objects, one per line:
+
+    {"id": 1, "instance": "instances/new_instances/51.in", "method": "grasp",
+     "params": {"alpha": 0.3}, "time_budget": 2.0}
+    {"id": 1, "status": "ok", "cost": 426, "tour": [...], "time": 1.98, "cache_hit": true}
+
+`params` are checked and converted like solve.py --param before the job is
+queued. `time_budget` is the solver's time_limit unless params set one;
+whole-second limits (branch and bound) are rounded up.
+
+Jobs run on a process pool. Every worker keeps the instances it has loaded,
+with their neighbour lists, in an LRU cache keyed by the file content hash,
+so repeated requests on the same distance matrix skip parsing. At most
+`max_pending` jobs are in flight: beyond that the reader blocks, which pushes
+back on the client.
+"""
+
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, IO, Optional
+from ..model.tsp_model import TSPInstance, load_instance
+from ..registry import convert_params, create_solver, get_spec
+
+# Neighbour list size precomputed for every cached instance
+NEIGHBOR_LIST_SIZE = 10
+# File hashes remembered by the service, keyed by (path, mtime, size)
+DIGEST_CACHE_SIZE = 256
+
+def file_digest(filepath: str) -> str:
+    digest = hashlib.sha1()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+class InstanceCache:
+    """LRU cache of loaded instances keyed by file content hash."""
+
+    def __init__(self, max_size: int = 8):
+        self.max_size = max_size
+        self._instances: "OrderedDict[str, TSPInstance]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, filepath: str, digest: Optional[str] = None):
+        """Return (instance, hit)."""
+        digest = digest or file_digest(filepath)
+        if digest in self._instances:
+            self._instances.move_to_end(digest)
+            self.hits += 1
+            return self._instances[digest], True
+
+        self.misses += 1
+        instance = load_instance(filepath)
+        instance.neighbor_lists(NEIGHBOR_LIST_SIZE)
+        self._instances[digest] = instance
+        if len(self._instances) > self.max_size:
+            self._instances.popitem(last=False)
+        return instance, False
+
+# Worker-side cache (one per process)
+_worker_cache: Optional[InstanceCache] = None
+
+def _init_worker(cache_size: int):
+    global _worker_cache
+    _worker_cache = InstanceCache(cache_size)
+
+def _solve(instance_file: str, digest: str, method: str, params: Dict[str, Any],
+           time_budget: Optional[float]) -> Dict[str, Any]:
+    instance, hit = _worker_cache.get(instance_file, digest)
+    params = dict(params)
+    spec = get_spec(method).params.get("time_limit")
+    if time_budget is not None and spec is not None:
+        # Whole-second limits are rounded up: int(0.5) would stop at once
+        time_limit = max(1, math.ceil(time_budget)) if spec.type is int else float(time_budget)
+        params.setdefault("time_limit", time_limit)
+    solver = create_solver(method, instance, **params)
+    start = time.perf_counter()
+    solution = solver.solve()
+    return {
+        "cost": solution.cost,
+        "tour": solution.tour,
+        "time": time.perf_counter() - start,
+        "size": instance.n,
+        "cache_hit": hit,
+    }
+
+class SolveService:
+    def __init__(self, workers: int = 1, max_pending: int = 16, cache_size: int = 8):
+        self.executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(cache_size,))
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._digests: "OrderedDict[tuple, str]" = OrderedDict()
+
+    def submit(self, request: Dict[str, Any], respond):
+        """Queue a job; blocks while max_pending jobs are in flight. `respond` gets the response dict."""
+        job_id = request.get("id")
+        try:
+            method = request["method"]
+            instance_file = request["instance"]
+            # Same names and conversions as solve.py --param
+            params = convert_params(method, request.get("params") or {})
+            digest = self._digest(instance_file)
+        except Exception as e:
+            respond({"id": job_id, "status": "error", "error": str(e)})
+            return
+
+        self._slots.acquire()
+        try:
+            future = self.executor.submit(_solve, instance_file, digest, method, params,
+                                          request.get("time_budget"))
+        except Exception as e:
+            # e.g. a broken or shut down pool: the job never runs, so its slot is free again
+            self._slots.release()
+            respond({"id": job_id, "status": "error", "error": str(e)})
+            return
+
+        def done(future):
+            self._slots.release()
+            try:
+                respond(dict({"id": job_id, "status": "ok"}, **future.result()))
+            except Exception as e:
+                respond({"id": job_id, "status": "error", "error": str(e)})
+
+        future.add_done_callback(done)
+
+    def _digest(self, filepath: str) -> str:
+        # Hash once per (path, mtime, size); the workers key their caches on it
+        stat = os.stat(filepath)
+        key = (os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
+        if key not in self._digests:
+            self._digests[key] = file_digest(filepath)
+            if len(self._digests) > DIGEST_CACHE_SIZE:
+                self._digests.popitem(last=False)
+        return self._digests[key]
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
+def serve_stream(service: SolveService, infile: IO[str], outfile: IO[str]):
+    """JSON-lines loop: one request per input line, one response per line (in completion order)."""
+    lock = threading.Lock()
+
+    def respond(response: Dict[str, Any]):
+        with lock:
+            outfile.write(json.dumps(response) + "\n")
+            outfile.flush()
+
+    pending = []
+    for line in infile:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            respond({"id": None, "status": "error", "error": f"invalid JSON: {e}"})
+            continue
+        if not isinstance(request, dict):
+            respond({"id": None, "status": "error", "error": "a request must be a JSON object"})
+            continue
+        finished = threading.Event()
+        pending.append(finished)
+
+        def respond_once(response, finished=finished):
+            respond(response)
+            finished.set()
+
+        service.submit(request, respond_once)
+        pending = [event for event in pending if not event.is_set()]
+
+    # Input closed: wait for the remaining answers before returning
+    for event in pending:
+        event.wait()
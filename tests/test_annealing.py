@@ -0,0 +1,69 @@
+"""Simulated annealing: O(1) move deltas and the temperature schedule."""
+
+import random
+import pytest
+from src.annealing.annealing_solver import SimulatedAnnealingSolver
+from src.constructive.nearest_neighbor import ConstructiveSolver
+from src.model.tsp_model import Solver, TSPInstance
+
+INSTANCE = "instances/new_instances/51.in"
+
+@pytest.fixture(scope="module")
+def instance():
+    return TSPInstance(INSTANCE)
+
+@pytest.mark.parametrize("or_opt_probability", [0.0, 1.0])
+def test_move_deltas_match_the_applied_moves(instance, or_opt_probability):
+    solver = SimulatedAnnealingSolver(instance, or_opt_probability=or_opt_probability, seed=0)
+    tour = list(range(instance.n))
+    random.Random(0).shuffle(tour)
+    solver._tour = tour
+    solver._positions = [0] * instance.n
+    for i, city in enumerate(tour):
+        solver._positions[city] = i
+    solver._neighbors = instance.neighbor_lists(10)
+    cost = solver.calculate_cost(tour)
+    applied = 0
+    for _ in range(500):
+        move = solver._sample_move()
+        if move is None:
+            continue
+        solver._apply(move)
+        cost += move[0]
+        applied += 1
+        assert cost == solver.calculate_cost(tour)
+        assert all(tour[solver._positions[city]] == city for city in range(instance.n))
+    assert applied > 400
+
+def test_cooling_from_the_calibrated_temperature(instance):
+    solver = SimulatedAnnealingSolver(instance, time_limit=None, max_moves=20000, seed=0)
+    solution = solver.solve()
+    assert sorted(solution.tour) == list(range(instance.n))
+    assert solution.cost == solver.calculate_cost(solution.tour)
+    stats = solution.stats
+    assert stats["moves"] == 20000
+    assert stats["initial_temperature"] > stats["final_temperature"] > 0
+
+def test_a_budget_is_required(instance):
+    with pytest.raises(ValueError):
+        SimulatedAnnealingSolver(instance, time_limit=None, max_moves=None)
+
+@pytest.mark.parametrize("initial_acceptance, final_acceptance", [
+    (0.3, 0.0), (0.3, 0.5), (0.3, 0.3), (1.0, 1e-4), (1.5, 1e-4), (0.3, -0.1),
+])
+def test_acceptance_probabilities_must_decrease_within_0_and_1(instance, initial_acceptance, final_acceptance):
+    with pytest.raises(ValueError):
+        SimulatedAnnealingSolver(instance, initial_acceptance=initial_acceptance,
+                                 final_acceptance=final_acceptance)
+
+def test_the_starting_tour_is_built_by_an_instrumented_sub_solver(instance, monkeypatch):
+    instrumented = []
+    original = Solver.instrument
+    def instrument(self, solver):
+        instrumented.append(type(solver))
+        return original(self, solver)
+    monkeypatch.setattr(Solver, "instrument", instrument)
+    solver = SimulatedAnnealingSolver(instance, time_limit=None, max_moves=1000, seed=0)
+    solver.enable_instrumentation()
+    solver.solve()
+    assert ConstructiveSolver in instrumented
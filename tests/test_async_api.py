@@ -0,0 +1,60 @@
+"""Asyncio front-end: incumbent streaming and cancellation."""
+
+import asyncio
+import pytest
+from src.grasp.grasp_solver import GRASPSolver
+from src.local_search.two_opt import LocalSearchSolver
+from src.model.coordinate_instance import CoordinateInstance
+from src.model.generator import generate_points, write_coordinate_instance
+from src.model.tsp_model import TSPInstance
+from src.runtime.async_api import solve_with_timeout, submit
+
+INSTANCE = "instances/new_instances/51.in"
+
+@pytest.fixture(scope="module")
+def instance():
+    return TSPInstance(INSTANCE)
+
+def test_incumbents_improve_until_the_result(instance):
+    async def main():
+        run = submit("grasp", instance, max_iterations=20, seed=0)
+        costs = [incumbent.cost async for incumbent in run.incumbents()]
+        return costs, await run.result()
+
+    costs, best = asyncio.run(main())
+    assert costs and costs == sorted(set(costs), reverse=True)
+    assert best.cost == costs[-1]
+
+@pytest.mark.parametrize("method, params", [
+    ("grasp", {"max_iterations": None, "time_limit": 60}),
+    ("ils", {"max_iterations": None, "time_limit": 60}),
+    ("annealing", {"time_limit": 60}),
+    ("genetic", {"generations": None, "time_limit": 60}),
+])
+def test_timeout_stops_the_solver_and_keeps_its_best_tour(instance, method, params):
+    solution, status, elapsed = asyncio.run(solve_with_timeout(method, instance, 0.5, seed=0, **params))
+    assert status == "timeout"
+    assert elapsed < 5
+    assert instance.validate_tours([solution.tour])[0]
+    assert solution.cost == instance.tour_costs([solution.tour])[0]
+
+def test_stop_requests_reach_instrumented_sub_solvers(instance):
+    parent = GRASPSolver(instance, max_iterations=1)
+    child = parent.instrument(LocalSearchSolver(instance))
+    assert not child.stop_requested()
+    parent.request_stop()
+    assert child.stop_requested()
+    # A stopped descent still returns a tour with its cost
+    solution = child.solve()
+    assert instance.validate_tours([solution.tour])[0]
+    assert solution.cost == instance.tour_costs([solution.tour])[0]
+
+def test_timeout_stops_the_decomposition_sub_solvers(tmp_path):
+    path = str(tmp_path / "euclidean_3000.tsp")
+    write_coordinate_instance(path, "euclidean_3000", generate_points("euclidean", 3000, 0))
+    large = CoordinateInstance(path)
+    solution, status, elapsed = asyncio.run(solve_with_timeout(
+        "decomposition", large, 0.5, cluster_size=1500, sub_iterations=1000, seed=0))
+    assert status == "timeout"
+    assert elapsed < 5
+    assert large.validate_tours([solution.tour])[0]
@@ -0,0 +1,45 @@
+"""Batch mode: instance expansion, output files and per-job errors."""
+
+import os
+import shutil
+import pytest
+from src.runtime.batch import BatchJob, expand_instances, run_batch
+
+SMALL = "instances/new_instances/17.in"
+MEDIUM = "instances/new_instances/51.in"
+
+@pytest.fixture
+def instance_dir(tmp_path):
+    directory = tmp_path / "instances"
+    directory.mkdir()
+    shutil.copy(MEDIUM, directory / "51.in")
+    shutil.copy(SMALL, directory / "17.in")
+    (directory / "notes.txt").write_text("not an instance")
+    return directory
+
+def test_expand_instances_sorts_by_size_without_duplicates(instance_dir):
+    files = expand_instances([str(instance_dir), str(instance_dir / "51.in"), str(instance_dir / "*.in")])
+    assert [os.path.basename(f) for f in files] == ["17.in", "51.in"]
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_results_come_back_in_job_order_with_their_out_files(instance_dir, tmp_path, workers):
+    output_dir = str(tmp_path / "out")
+    files = expand_instances([str(instance_dir)])
+    jobs = [BatchJob(f, method, {}, output_dir) for f in files for method in ("constructive", "local_search")]
+    results = run_batch(jobs, workers, verbose=False)
+    assert [(r["instance"], r["method"]) for r in results] == [
+        ("17.in", "constructive"), ("17.in", "local_search"), ("51.in", "constructive"), ("51.in", "local_search")]
+    for row in results:
+        assert row["status"] == "completed"
+        with open(row["output"]) as f:
+            tour = list(map(int, f.readline().split()))
+            cost = int(f.readline())
+        assert sorted(tour) == list(range(row["size"])) and cost == row["cost"]
+
+def test_a_failing_job_does_not_stop_the_batch(tmp_path):
+    jobs = [BatchJob(str(tmp_path / "missing.in"), "constructive", {}, str(tmp_path)),
+            BatchJob(SMALL, "grasp", {"max_iterations": 2, "colour": "red"}, str(tmp_path)),
+            BatchJob(SMALL, "constructive", {}, str(tmp_path))]
+    statuses = [row["status"] for row in run_batch(jobs, verbose=False)]
+    assert statuses[0].startswith("error:") and statuses[1].startswith("error:")
+    assert statuses[2] == "completed"
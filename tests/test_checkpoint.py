@@ -0,0 +1,110 @@
+"""A run resumed from its checkpoint ends where an uninterrupted run ends."""
+
+import argparse
+import csv
+import json
+import os
+import pytest
+from src.benchmarking.harness import BenchmarkCase, RunCheckpoint, add_arguments, run_case, run_from_args
+from src.model.tsp_model import TSPInstance
+from src.registry import create_solver
+
+INSTANCE = "instances/new_instances/51.in"
+
+def _sub_instance(tmp_path, source: str, n: int) -> TSPInstance:
+    # The first n cities of an instance, small enough for branch and bound
+    matrix = TSPInstance(source).matrix
+    path = tmp_path / f"first_{n}.in"
+    path.write_text(f"{n}\n" + "".join(" ".join(map(str, row[:n])) + "\n" for row in matrix[:n]))
+    return TSPInstance(str(path))
+
+def test_grasp_resume_matches_an_uninterrupted_run(tmp_path):
+    instance = TSPInstance(INSTANCE)
+    path = str(tmp_path / "grasp.json")
+    first = create_solver("grasp", instance, max_iterations=6, seed=1)
+    first.enable_checkpoint(path, interval=0)
+    first.solve()
+
+    resumed = create_solver("grasp", instance, max_iterations=12, seed=1)
+    resumed.enable_checkpoint(path, interval=0)
+    resumed_solution = resumed.solve()
+    uninterrupted = create_solver("grasp", instance, max_iterations=12, seed=1).solve()
+
+    assert resumed_solution.tour == uninterrupted.tour
+    assert resumed_solution.cost == uninterrupted.cost
+    assert resumed_solution.stats["iterations"] == 12
+    assert resumed_solution.stats["trace"] == uninterrupted.stats["trace"]
+    assert resumed_solution.stats["best_trace"] == uninterrupted.stats["best_trace"]
+
+def test_branch_and_bound_returns_a_proven_optimum_from_its_checkpoint(tmp_path):
+    instance = _sub_instance(tmp_path, "instances/new_instances/17.in", 10)
+    path = str(tmp_path / "exact.json")
+    first = create_solver("exact", instance, time_limit=30)
+    first.enable_checkpoint(path, interval=0)
+    optimum = first.solve()
+    assert first.search_complete and first.nodes_expanded > 0
+
+    resumed = create_solver("exact", instance, time_limit=30)
+    resumed.enable_checkpoint(path, interval=0)
+    solution = resumed.solve()
+    assert (solution.tour, solution.cost) == (optimum.tour, optimum.cost)
+    # Nothing searched again: the checkpoint says the tour is optimal
+    assert resumed.nodes_expanded == 0
+
+def test_benchmark_cells_are_not_run_again(tmp_path):
+    instance = TSPInstance(INSTANCE)
+    case = BenchmarkCase("GRASP", "grasp", {"max_iterations": 2})
+    path = str(tmp_path / "bench_checkpoint.jsonl")
+    rows = run_case(instance, "51.in", case, repeats=2, seeds=[0, 1], warmup=0, verbose=False,
+                    checkpoint=RunCheckpoint(path))
+    with open(path, "a") as f:
+        f.write('{"cell": ["51.in", "GRASP", 2], "rows": [')  # killed while writing seed 2
+
+    checkpoint = RunCheckpoint(path, resume=True)
+    assert set(checkpoint.cells) == {("51.in", "GRASP", 0), ("51.in", "GRASP", 1)}
+    resumed = run_case(instance, "51.in", case, repeats=2, seeds=[0, 1, 2], warmup=0, verbose=False,
+                       checkpoint=checkpoint)
+    # Seeds 0 and 1 come from the log, times included; only seed 2 runs
+    assert resumed[:4] == rows
+    assert [row["seed"] for row in resumed[4:]] == [2, 2]
+    with open(path) as f:
+        assert [json.loads(line)["cell"][2] for line in f] == [0, 1, 2]
+
+def test_a_logged_campaign_is_never_overwritten_without_resume(tmp_path):
+    path = tmp_path / "bench_checkpoint.jsonl"
+    RunCheckpoint(str(path))  # no log yet
+    RunCheckpoint(str(path)).record("51.in", "GRASP", 0, [{"cost": 1}])
+    logged = path.read_text()
+    with pytest.raises(FileExistsError, match="--resume"):
+        RunCheckpoint(str(path))
+    assert path.read_text() == logged
+    assert RunCheckpoint(str(path), resume=True).cells == {("51.in", "GRASP", 0): [{"cost": 1}]}
+
+@pytest.mark.parametrize("flags", [[], ["--fresh"], ["--resume"]])
+def test_campaign_flags_for_an_existing_log(tmp_path, capsys, flags):
+    parser = argparse.ArgumentParser()
+    add_arguments(parser)
+    args = parser.parse_args(["--repeats", "1", "--warmup", "0", "--seeds", "0", "1"] + flags)
+    prefix = str(tmp_path / "bench")
+    case = BenchmarkCase("GRASP", "grasp", {"max_iterations": 1})
+    # A fake logged cell: its cost shows whether the log was reused
+    logged = {"instance": "17.in", "size": 17, "case": "GRASP", "method": "grasp", "seed": 0, "repeat": 0,
+              "cost": 1, "time": 0.0, "status": "completed"}
+    RunCheckpoint(f"{prefix}_checkpoint.jsonl").record("17.in", "GRASP", 0, [logged])
+    if not flags:
+        with pytest.raises(SystemExit):
+            run_from_args(args, ["instances/new_instances/17.in"], [case], prefix)
+        assert "--fresh" in capsys.readouterr().out
+        return
+    run_from_args(args, ["instances/new_instances/17.in"], [case], prefix)
+    with open(f"{prefix}_runs.csv") as f:
+        costs = [row["cost"] for row in csv.DictReader(f)]
+    assert len(costs) == 2
+    assert ("1" in costs) == (flags == ["--resume"])
+    assert not os.path.exists(f"{prefix}_checkpoint.jsonl")
+
+def test_resume_and_fresh_exclude_each_other():
+    parser = argparse.ArgumentParser()
+    add_arguments(parser)
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--resume", "--fresh"])
@@ -0,0 +1,53 @@
+"""Benchmark comparison: Mann-Whitney test, verdicts and result formats."""
+
+import csv
+import json
+import pytest
+from src.benchmarking.compare import compare, load_samples, main, mann_whitney_greater
+
+def test_mann_whitney_without_ties():
+    # U = 9 of 9 pairs, mean 4.5, variance 5.25: z = (9 - 4.5 - 0.5) / sqrt(5.25)
+    assert mann_whitney_greater([1, 2, 3], [4, 5, 6]) == pytest.approx(0.040428, abs=1e-6)
+    assert mann_whitney_greater([4, 5, 6], [1, 2, 3]) == pytest.approx(0.985452, abs=1e-6)
+
+def test_mann_whitney_with_ties():
+    baseline, current = [1, 1, 2, 3], [2, 3, 3, 4]
+    u = sum((y > x) + 0.5 * (y == x) for x in baseline for y in current)
+    assert u == 13.5
+    # Tie groups of sizes 2, 2, 3, 1: variance 16/12 * (9 - 36/56), z = 5 / sqrt(11.1429)
+    assert mann_whitney_greater(baseline, current) == pytest.approx(0.067085, abs=1e-6)
+    assert mann_whitney_greater([5, 5], [5, 5]) == 1.0
+
+def test_verdicts():
+    key = lambda case, metric: ("a.in", case, metric)
+    baseline = {key("slow", "time"): [1.0, 1.1, 0.9, 1.0, 1.05], key("fast", "time"): [1.0, 1.1, 0.9, 1.0, 1.05],
+                key("noisy", "time"): [1.0, 2.0, 1.5], key("single", "cost"): [100],
+                key("same", "cost"): [100, 100]}
+    current = {key("slow", "time"): [1.5, 1.6, 1.4, 1.55, 1.45], key("fast", "time"): [0.5, 0.6, 0.4, 0.55, 0.45],
+               key("noisy", "time"): [1.2, 2.2, 1.4], key("single", "cost"): [101],
+               key("same", "cost"): [100, 100], key("new", "cost"): [1]}
+    verdicts = {r["case"]: r["verdict"] for r in compare(baseline, current)}
+    assert verdicts == {"slow": "regression", "fast": "improvement", "noisy": "unchanged",
+                        "single": "regression", "same": "unchanged"}
+    # A tolerated cost increase
+    assert compare({key("single", "cost"): [100]}, {key("single", "cost"): [101]},
+                   thresholds={"time": 0.05, "cost": 0.02})[0]["verdict"] == "unchanged"
+
+def test_long_and_wide_formats(tmp_path):
+    runs = [{"instance": "a.in", "case": "grasp", "cost": 10, "time": 1.0, "status": "completed"},
+            {"instance": "a.in", "case": "grasp", "cost": None, "time": None, "status": "error: boom"}]
+    (tmp_path / "base.json").write_text(json.dumps({"runs": runs}))
+    with open(tmp_path / "wide.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Instance", "Size", "GRASP_Cost", "GRASP_Time", "Exact_Cost", "Exact_Time"])
+        writer.writerow(["a.in", 17, 12, 1.0, "N/A", "N/A"])
+    assert load_samples(str(tmp_path / "base.json")) == {("a.in", "grasp", "cost"): [10.0],
+                                                          ("a.in", "grasp", "time"): [1.0]}
+    assert load_samples(str(tmp_path / "wide.csv")) == {("a.in", "grasp", "cost"): [12.0],
+                                                         ("a.in", "grasp", "time"): [1.0]}
+    # Cost went from 10 to 12: regression, exit status 1
+    assert main([str(tmp_path / "base.json"), str(tmp_path / "wide.csv")]) == 1
+    assert main([str(tmp_path / "base.json"), str(tmp_path / "base.json")]) == 0
+    (tmp_path / "bad.csv").write_text("x,y\n1,2\n")
+    with pytest.raises(ValueError):
+        load_samples(str(tmp_path / "bad.csv"))
@@ -0,0 +1,54 @@
+"""Coordinate instances: grid neighbour lists against brute force, TSPLIB header size."""
+
+import random
+import pytest
+from src.grasp.tuning import instance_size
+from src.model.coordinate_instance import CoordinateInstance, tsplib_dimension
+from src.model.generator import generate_points, write_coordinate_instance
+
+def _instance(tmp_path, family: str, n: int, seed: int = 0) -> CoordinateInstance:
+    path = str(tmp_path / f"{family}_{n}.tsp")
+    write_coordinate_instance(path, f"{family}_{n}", generate_points(family, n, seed))
+    return CoordinateInstance(path)
+
+@pytest.mark.parametrize("family", ["euclidean", "clustered"])
+@pytest.mark.parametrize("k", [1, 5, 10])
+def test_grid_neighbor_lists_match_brute_force(tmp_path, family, k):
+    instance = _instance(tmp_path, family, 300)
+    for city, neighbors in enumerate(instance.neighbor_lists(k)):
+        distances = sorted(instance.distance(city, other) for other in range(instance.n) if other != city)
+        assert len(neighbors) == k and city not in neighbors
+        # Same distances as the k nearest; ties on rounded distances in city order
+        assert [instance.distance(city, other) for other in neighbors] == distances[:k]
+        assert neighbors == sorted(neighbors, key=lambda other: (instance.distance(city, other), other))
+
+def test_neighbor_lists_of_a_tiny_instance_hold_every_other_city(tmp_path):
+    instance = _instance(tmp_path, "euclidean", 6)
+    for city, neighbors in enumerate(instance.neighbor_lists(10)):
+        assert sorted(neighbors) == [other for other in range(6) if other != city]
+
+def test_instance_size_of_a_tsplib_file_reads_the_header(tmp_path):
+    instance = _instance(tmp_path, "clustered", 40)
+    assert tsplib_dimension(instance.filepath) == 40
+    assert instance_size(instance.filepath) == 40
+    assert instance_size("instances/new_instances/17.in") == 17
+
+def test_instance_size_without_a_dimension_header_loads_the_file(tmp_path):
+    path = tmp_path / "no_dimension.tsp"
+    path.write_text("NAME : tiny\nEDGE_WEIGHT_TYPE : EUC_2D\nNODE_COORD_SECTION\n1 0 0\n2 3 4\n3 6 0\nEOF\n")
+    assert tsplib_dimension(str(path)) is None
+    assert instance_size(str(path)) == 3
+
+@pytest.mark.parametrize("side", [8, 14, 20])
+@pytest.mark.parametrize("k", [4, 8, 12, 20])
+def test_grid_neighbor_lists_break_ties_like_the_matrix(tmp_path, side, k):
+    # Integer grid points in shuffled order: many equal distances, some at cell borders
+    points = [(float(x), float(y)) for x in range(side) for y in range(side)]
+    random.Random(side).shuffle(points)
+    path = str(tmp_path / f"grid_{side}.tsp")
+    write_coordinate_instance(path, f"grid_{side}", points)
+    instance = CoordinateInstance(path)
+    for city, neighbors in enumerate(instance.neighbor_lists(k)):
+        expected = sorted((other for other in range(instance.n) if other != city),
+                          key=lambda other: (instance.distance(city, other), other))[:k]
+        assert neighbors == expected
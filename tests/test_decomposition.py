@@ -0,0 +1,109 @@
+"""Sub-problems of the decomposition: forced path end points and cluster portals."""
+
+import itertools
+import time
+import pytest
+from src.decomposition import decomposition_solver
+from src.decomposition.decomposition_solver import (DecompositionSolver, _path_cost, _path_from_cycle,
+                                                    _path_instance)
+from src.model.coordinate_instance import CoordinateInstance
+from src.model.generator import generate_points, write_coordinate_instance
+from src.model.reordering import hilbert_order
+from src.model.tsp_model import CountingInstance, load_instance
+
+INSTANCE = "instances/new_instances/51.in"
+
+def test_path_from_cycle_in_both_directions():
+    assert _path_from_cycle([2, 4, 0, 1, 3], 5) == [0, 1, 3, 2, 4]
+    assert _path_from_cycle([3, 1, 0, 4, 2], 5) == [0, 1, 3, 2, 4]
+
+def test_path_from_cycle_without_the_forced_edge():
+    assert _path_from_cycle([0, 4, 1, 5, 2, 3], 6) is None
+
+def test_solved_paths_keep_their_end_points_and_are_optimal():
+    instance = load_instance(INSTANCE)
+    solver = DecompositionSolver(instance, method="exact", window_size=8)
+    windows = [[5, 17, 3, 40, 22, 9, 31], [0, 1, 2, 3], [12, 7, 44]]
+    for window, path in zip(windows, solver._solve_paths(windows, None)):
+        assert (path[0], path[-1]) == (window[0], window[-1])
+        assert sorted(path) == sorted(window)
+        best = min(_path_cost(instance, [window[0], *middle, window[-1]])
+                   for middle in itertools.permutations(window[1:-1]))
+        assert _path_cost(instance, path) == best
+
+def test_path_instance_forces_the_end_point_edge():
+    instance = load_instance(INSTANCE)
+    window = [5, 17, 3, 40, 22, 9]
+    local = _path_instance(instance, window)
+    m = len(window)
+    assert local.distance(0, m - 1) == 0
+    # Every other edge keeps its order and stays non-negative
+    penalty = local.distance(0, 1) - instance.distance(window[0], window[1])
+    assert penalty > 0
+    assert all(local.distance(i, j) == instance.distance(window[i], window[j]) + penalty
+               for i in range(m) for j in range(m) if i != j and {i, j} != {0, m - 1})
+
+def test_portals_are_distinct_and_chain_the_clusters():
+    instance = load_instance(INSTANCE)
+    solver = DecompositionSolver(instance, cluster_size=10)
+    clusters = solver._clusters()
+    portals = solver._portals(clusters)
+    assert sorted(c for cluster in clusters for c in cluster) == list(range(instance.n))
+    for cluster, (entry, exit) in zip(clusters, portals):
+        assert entry != exit
+        assert entry in cluster and exit in cluster
+    tour = solver._cluster_paths(clusters, portals, None)
+    assert instance.validate_tours([tour])[0]
+    # Every path starts at its entry and ends at its exit
+    position = 0
+    for cluster, (entry, exit) in zip(clusters, portals):
+        assert tour[position] == entry
+        position += len(cluster)
+        assert tour[position - 1] == exit
+
+def test_window_batch_gain_is_the_cost_decrease():
+    instance = load_instance(INSTANCE)
+    solver = DecompositionSolver(instance, window_size=8, sub_iterations=20, seed=0)
+    tour = list(range(instance.n))
+    before = instance.tour_costs([tour])[0]
+    gain = solver._window_batch(tour, 0, None)
+    assert gain > 0
+    assert instance.validate_tours([tour])[0]
+    assert instance.tour_costs([tour])[0] == before - gain
+
+def test_instrumented_runs_cluster_coordinate_instances_along_the_hilbert_curve(tmp_path):
+    path = str(tmp_path / "clustered_300.tsp")
+    write_coordinate_instance(path, "clustered_300", generate_points("clustered", 300, 0))
+    instance = CoordinateInstance(path)
+    plain = DecompositionSolver(instance, cluster_size=30)
+    instrumented = DecompositionSolver(instance, cluster_size=30)
+    instrumented.enable_instrumentation()
+    assert isinstance(instrumented.instance, CountingInstance)
+    assert instrumented._clusters() == plain._clusters()
+    # Clusters are runs of the Hilbert order, not of the nearest-neighbour chain
+    hilbert = hilbert_order(instance)
+    assert sorted(map(sorted, plain._clusters())) == sorted(
+        sorted(hilbert[k:k + 30]) for k in range(0, 300, 30))
+
+def test_unknown_sub_problem_method():
+    instance = load_instance(INSTANCE)
+    with pytest.raises(ValueError, match="simplex"):
+        DecompositionSolver(instance, method="simplex")
+
+def test_sequential_cluster_jobs_stop_at_the_time_limit(monkeypatch):
+    instance = load_instance(INSTANCE)
+    created = []
+    original = decomposition_solver.create_solver
+    def create_solver(method, sub, **params):
+        created.append(sub.n)
+        # Each sub-problem uses up the time budget
+        time.sleep(0.2)
+        return original(method, sub, **params)
+    monkeypatch.setattr(decomposition_solver, "create_solver", create_solver)
+    solver = DecompositionSolver(instance, cluster_size=10, time_limit=0.1, seed=0)
+    solution = solver.solve()
+    # The first job runs, the four others keep their entry-to-exit order
+    assert len(created) == 1
+    assert instance.validate_tours([solution.tour])[0]
+    assert solution.cost == instance.tour_costs([solution.tour])[0]
+    assert solution.stats["passes"] == 0
@@ -0,0 +1,29 @@
+"""Elite pool: duplicates, diversity and replacement of the most similar worse member."""
+
+from src.grasp.elite_pool import ElitePool, tour_distance, tour_edges
+from src.model.tsp_model import Solution
+
+def test_tour_edges_ignore_rotation_and_direction():
+    assert tour_edges([0, 1, 2, 3, 4]) == tour_edges([2, 3, 4, 0, 1]) == tour_edges([4, 3, 2, 1, 0])
+    assert tour_distance(tour_edges([0, 1, 2, 3, 4]), tour_edges([0, 2, 1, 3, 4])) == 2
+
+def test_duplicates_and_close_tours_are_rejected():
+    pool = ElitePool(max_size=3, min_distance=3)
+    assert pool.add(Solution([0, 1, 2, 3, 4, 5], 10))
+    assert not pool.add(Solution([3, 4, 5, 0, 1, 2], 10))
+    # Two edges away: not diverse enough
+    assert not pool.add(Solution([0, 2, 1, 3, 4, 5], 9))
+    assert len(pool) == 1
+
+def test_full_pool_replaces_the_most_similar_worse_member():
+    pool = ElitePool(max_size=2, min_distance=1)
+    far = Solution([0, 2, 4, 1, 3, 5], 30)
+    near = Solution([0, 1, 2, 3, 5, 4], 20)
+    pool.add(far)
+    pool.add(near)
+    assert not pool.add(Solution([0, 3, 1, 4, 2, 5], 40))  # worse than the worst
+    candidate = Solution([0, 1, 2, 3, 4, 5], 10)
+    assert pool.add(candidate)
+    # Both members are worse; `near` shares the most edges with the candidate
+    assert pool.solutions == [far, candidate]
+    assert pool.best() is candidate and pool.worst() is far
@@ -0,0 +1,47 @@
+"""Seeded instance generator and the scaling fit."""
+
+import math
+import pytest
+from src.benchmarking.scaling import fit_exponent, log_sizes, run_scaling
+from src.model.generator import FAMILIES, generate_instance, generate_rows
+from src.model.tsp_model import TSPInstance
+
+@pytest.mark.parametrize("family", FAMILIES)
+def test_instances_are_symmetric_metric_and_reproducible(family):
+    rows = list(generate_rows(family, 30, seed=5))
+    assert rows == list(generate_rows(family, 30, seed=5))
+    assert rows != list(generate_rows(family, 30, seed=6))
+    n = len(rows)
+    for i in range(n):
+        assert rows[i][i] == 0
+        for j in range(n):
+            assert rows[i][j] == rows[j][i]
+            # Rounding may break the triangle inequality by at most 1
+            assert all(rows[i][j] <= rows[i][k] + rows[k][j] + 1 for k in range(n))
+
+def test_random_metric_weights_stay_in_range():
+    rows = list(generate_rows("random_metric", 40, seed=0))
+    assert all(500 <= w <= 1000 for i, row in enumerate(rows) for j, w in enumerate(row) if i != j)
+
+def test_generated_files_load_and_are_not_rewritten(tmp_path):
+    path = generate_instance("euclidean", 25, seed=1, output_dir=str(tmp_path))
+    assert path.endswith("euclidean_25_s1.in")
+    assert TSPInstance(path).n == 25
+    mtime = (tmp_path / "euclidean_25_s1.in").stat().st_mtime_ns
+    assert generate_instance("euclidean", 25, seed=1, output_dir=str(tmp_path)) == path
+    assert (tmp_path / "euclidean_25_s1.in").stat().st_mtime_ns == mtime
+
+def test_log_sizes_and_power_law_fit():
+    assert log_sizes(10, 1000, 3) == [10, 100, 1000]
+    assert log_sizes(10, 12, 5) == [10, 11, 12]
+    fit = fit_exponent([10, 100, 1000], [2 * n ** 1.5 for n in (10, 100, 1000)])
+    assert fit["exponent"] == pytest.approx(1.5) and fit["a"] == pytest.approx(2.0)
+    assert fit["r2"] == pytest.approx(1.0)
+    assert fit_exponent([10], [1.0]) is None
+
+def test_scaling_rows_and_fits(tmp_path):
+    rows, fits = run_scaling(["random_metric"], [20, 40], ["load", "constructive"], repeats=2,
+                             instance_dir=str(tmp_path), verbose=False)
+    assert len(rows) == 2 * 2 * 2
+    assert {(f["family"], f["phase"]) for f in fits} == {("random_metric", "load"), ("random_metric", "constructive")}
+    assert all(math.isfinite(f["exponent"]) for f in fits)
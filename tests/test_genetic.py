@@ -0,0 +1,69 @@
+"""Genetic algorithm: crossovers and survivors."""
+
+import random
+import pytest
+from src.genetic.genetic_solver import GeneticSolver
+from src.grasp.elite_pool import tour_edges
+from src.model.tsp_model import Solution, TSPInstance
+
+INSTANCE = "instances/new_instances/51.in"
+
+@pytest.fixture(scope="module")
+def instance():
+    return TSPInstance(INSTANCE)
+
+def _random_tours(n, count, seed):
+    rng = random.Random(seed)
+    tours = []
+    for _ in range(count):
+        tour = list(range(n))
+        rng.shuffle(tour)
+        tours.append(tour)
+    return tours
+
+def test_order_crossover_children_are_tours(instance):
+    solver = GeneticSolver(instance, seed=0)
+    parent_a, parent_b = _random_tours(instance.n, 2, 0)
+    for _ in range(50):
+        child = solver.order_crossover(parent_a, parent_b)
+        assert sorted(child) == list(range(instance.n))
+
+def test_eax_children_are_tours(instance):
+    solver = GeneticSolver(instance, crossover="eax", seed=0)
+    parent_a, parent_b = _random_tours(instance.n, 2, 1)
+    for _ in range(50):
+        child = solver.eax_crossover(parent_a, parent_b)
+        assert sorted(child) == list(range(instance.n))
+    assert solver.eax_crossover(parent_a, parent_a) == parent_a
+
+def test_survivors_are_the_best_distinct_tours(instance):
+    solver = GeneticSolver(instance, population_size=2, seed=0)
+    a, b = _random_tours(instance.n, 2, 3)
+    rotated = a[5:] + a[:5]
+    survivors = solver._survivors([Solution(b, 30), Solution(a, 10), Solution(rotated, 10)])
+    assert [tour_edges(s.tour) for s in survivors] == [tour_edges(a), tour_edges(b)]
+
+@pytest.mark.parametrize("crossover", ["ox", "eax"])
+def test_best_tour_has_its_cost(instance, crossover):
+    solver = GeneticSolver(instance, population_size=10, generations=3, crossover=crossover, seed=0)
+    solution = solver.solve()
+    assert sorted(solution.tour) == list(range(instance.n))
+    assert solution.cost == solver.calculate_cost(solution.tour)
+    trace = solution.stats["best_trace"]
+    assert len(trace) == 4 and trace == sorted(trace, reverse=True)
+
+def test_initial_population_is_reported_before_the_first_generation(instance):
+    solver = GeneticSolver(instance, population_size=10, generations=0, seed=0)
+    incumbents = []
+    solver.on_improvement = incumbents.append
+    solution = solver.solve()
+    assert [(s.tour, s.cost) for s in incumbents] == [(solution.tour, solution.cost)]
+
+def test_warm_start_is_reported_at_once(instance):
+    tour = list(range(instance.n))
+    solver = GeneticSolver(instance, population_size=10, generations=0, initial_solution=tour, seed=0)
+    incumbents = []
+    solver.on_improvement = incumbents.append
+    solver.solve()
+    assert incumbents[0].tour == tour
+    assert [s.cost for s in incumbents] == sorted({s.cost for s in incumbents}, reverse=True)
@@ -0,0 +1,99 @@
+"""GRASPSolver on the 17-city instance."""
+
+import pytest
+from src.grasp.grasp_solver import GRASPSolver
+from src.grasp.path_relinking import path_relinking
+from src.model.tsp_model import TSPInstance
+
+INSTANCE = "instances/new_instances/17.in"
+
+@pytest.fixture(scope="module")
+def instance():
+    return TSPInstance(INSTANCE)
+
+def test_reactive_update_favours_the_alpha_with_the_best_average(instance):
+    solver = GRASPSolver(instance, alphas=[0.1, 0.5, 0.9], reactive_delta=10.0)
+    solver._alpha_cost_sums = [2 * 100.0, 2 * 200.0, 0.0]
+    solver._alpha_counts = [2, 2, 0]
+    solver._update_alpha_probabilities(100)
+    low, high, untried = solver.alpha_probabilities
+    assert sum(solver.alpha_probabilities) == pytest.approx(1.0)
+    assert low > high
+    assert high == pytest.approx(low * 0.5 ** 10)
+    # Never drawn yet: scored like the best alpha so that it still gets explored
+    assert untried == pytest.approx(low)
+
+def test_reactive_update_without_samples_keeps_the_probabilities(instance):
+    solver = GRASPSolver(instance, alphas=[0.1, 0.5])
+    solver._update_alpha_probabilities(100)
+    assert solver.alpha_probabilities == [0.5, 0.5]
+
+def test_reactive_solve_returns_a_tour_with_its_cost(instance):
+    solver = GRASPSolver(instance, max_iterations=12, reactive=True, reactive_period=4, seed=0)
+    solution = solver.solve()
+    assert sorted(solution.tour) == list(range(instance.n))
+    assert solution.cost == solver.calculate_cost(solution.tour)
+
+def test_same_seed_same_tour(instance):
+    first = GRASPSolver(instance, max_iterations=5, reactive=True, seed=3).solve()
+    second = GRASPSolver(instance, max_iterations=5, reactive=True, seed=3).solve()
+    assert (first.tour, first.cost) == (second.tour, second.cost)
+
+@pytest.mark.parametrize("mode", ["forward", "backward", "mixed"])
+def test_path_relinking_intermediate_tours_have_their_cost(instance, mode):
+    solver = GRASPSolver(instance, max_iterations=6, path_relinking=mode, seed=1)
+    solution = solver.solve()
+    assert sorted(solution.tour) == list(range(instance.n))
+    assert solution.cost == solver.calculate_cost(solution.tour)
+    initial, guiding = solver.elite_pool.solutions[:2]
+    intermediate = path_relinking(instance, initial, guiding, mode)
+    if intermediate is not None:
+        assert sorted(intermediate.tour) == list(range(instance.n))
+        assert intermediate.cost == solver.calculate_cost(intermediate.tour)
+
+def test_unknown_path_relinking_mode_is_rejected(instance):
+    with pytest.raises(ValueError):
+        GRASPSolver(instance, path_relinking="sideways")
+
+def test_stopping_rules_and_traces(instance):
+    solution = GRASPSolver(instance, max_iterations=None, max_no_improvement=3, seed=0).solve()
+    stats = solution.stats
+    assert stats["stop_reason"] == "no_improvement"
+    assert len(stats["trace"]) == len(stats["best_trace"]) == stats["iterations"]
+    assert stats["best_trace"] == sorted(stats["best_trace"], reverse=True)
+    assert stats["best_trace"][-1] == solution.cost == min(stats["trace"])
+    # Stopped 3 iterations after the last improvement
+    assert stats["best_trace"][-4:].count(solution.cost) == 4
+
+def test_target_cost_stops_at_once(instance):
+    solution = GRASPSolver(instance, target_cost=10**9, seed=0).solve()
+    assert solution.stats["stop_reason"] == "target_cost"
+    assert solution.stats["iterations"] == 1
+
+def test_at_least_one_stopping_rule_is_required(instance):
+    with pytest.raises(ValueError):
+        GRASPSolver(instance, max_iterations=None)
+
+def test_zero_iterations_need_a_warm_start(instance):
+    with pytest.raises(ValueError):
+        GRASPSolver(instance, max_iterations=0)
+    tour = list(range(instance.n))
+    solution = GRASPSolver(instance, max_iterations=0, initial_solution=tour).solve()
+    assert solution.tour == tour
+    assert solution.cost == instance.tour_costs([tour])[0]
+
+def test_improvement_probability():
+    assert GRASPSolver.improvement_probability([100] * 5, 90) == 1.0  # too few samples
+    assert GRASPSolver.improvement_probability([100] * 10, 100) == 0.0
+    trace = [100, 110] * 5
+    # Mean 105, deviation 5: P(cost <= 104.5) = Phi(-0.1)
+    assert GRASPSolver.improvement_probability(trace, 105) == pytest.approx(0.4602, abs=1e-4)
+
+def test_cache_skips_repeated_constructions_without_changing_the_result(instance):
+    # alpha = 0: the construction only depends on the start city, so 30
+    # iterations on 17 cities construct some tours more than once
+    cached = GRASPSolver(instance, max_iterations=30, alpha=0.0, seed=2).solve()
+    uncached = GRASPSolver(instance, max_iterations=30, alpha=0.0, cache_size=0, seed=2).solve()
+    assert cached.stats["cache"]["hits"] >= 30 - instance.n
+    assert uncached.stats["cache"]["hits"] == 0
+    assert (cached.tour, cached.cost, cached.stats["trace"]) == (uncached.tour, uncached.cost, uncached.stats["trace"])
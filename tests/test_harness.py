@@ -0,0 +1,60 @@
+"""Benchmark harness: run rows, summary statistics and the wide report layout."""
+
+import csv
+import json
+import pytest
+from src.benchmarking.harness import (BenchmarkCase, add_gaps, run_benchmark, summarize, wide_rows,
+                                      write_results)
+
+SMALL = "instances/new_instances/17.in"
+MEDIUM = "instances/new_instances/51.in"
+
+def _row(instance, case, cost, time, status="completed"):
+    return {"instance": instance, "size": 10, "case": case, "method": "m", "seed": 0, "repeat": 0,
+            "cost": cost, "time": time, "status": status}
+
+def test_summary_median_iqr_and_min():
+    rows = [_row("a", "x", cost, time) for cost, time in [(10, 1.0), (14, 2.0), (12, 3.0), (20, 4.0), (16, 5.0)]]
+    rows.append(_row("a", "x", None, None, "error: boom"))
+    entry, = summarize(rows)
+    assert (entry["runs"], entry["errors"]) == (5, 1)
+    assert (entry["cost_median"], entry["cost_min"]) == (14, 10)
+    # Inclusive quartiles of 10 12 14 16 20: 12 and 16
+    assert entry["cost_iqr"] == 4
+    assert entry["time_median"] == 3.0 and entry["time_iqr"] == pytest.approx(2.0)
+
+def test_summary_of_failed_and_single_runs():
+    failed, single = summarize([_row("a", "x", None, None, "error: boom"), _row("a", "y", 7, 0.5)])
+    assert failed["runs"] == 0 and failed["cost_median"] is None
+    assert (single["cost_median"], single["cost_iqr"]) == (7, 0)
+
+def test_seeds_repeats_and_size_limits():
+    cases = [BenchmarkCase("GRASP", "grasp", {"max_iterations": 2}),
+             BenchmarkCase("NN", "constructive"),
+             BenchmarkCase("Small only", "local_search", max_size=20)]
+    rows, instances = run_benchmark([SMALL, MEDIUM], cases, repeats=2, seeds=[0, 1], warmup=0, verbose=False)
+    assert set(instances) == {"17.in", "51.in"}
+    counts = {}
+    for row in rows:
+        assert row["status"] == "completed"
+        counts[(row["instance"], row["case"])] = counts.get((row["instance"], row["case"]), 0) + 1
+    # Seeded: 2 seeds x 2 repeats; deterministic: one seed (None)
+    assert counts == {("17.in", "GRASP"): 4, ("17.in", "NN"): 2, ("17.in", "Small only"): 2,
+                      ("51.in", "GRASP"): 4, ("51.in", "NN"): 2}
+    assert {row["seed"] for row in rows if row["case"] == "NN"} == {None}
+
+def test_written_results_and_wide_rows(tmp_path):
+    rows = [_row("a", "x", 110, 1.0), _row("a", "ref", 100, 2.0), _row("b", "ref", 50, 1.0)]
+    summary = summarize(rows)
+    paths = write_results(str(tmp_path / "bench"), rows, summary, {"host": "test"})
+    with open(paths[0]) as f:
+        assert len(list(csv.DictReader(f))) == 3
+    with open(paths[2]) as f:
+        assert json.load(f)["metadata"] == {"host": "test"}
+
+    wide = wide_rows(summary, {"a": {"size": 10}, "b": {"size": 10}, "c": {"size": 10}},
+                     {"ref": "Ref", "x": "X"})
+    add_gaps(wide, "Ref", ["X"])
+    assert [row["Instance"] for row in wide] == ["a", "b"]
+    assert wide[0]["X_Gap"] == pytest.approx(10.0)
+    assert wide[1]["X_Cost"] == "N/A" and wide[1]["X_Gap"] == ""
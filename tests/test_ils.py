@@ -0,0 +1,64 @@
+"""Iterated Local Search: double-bridge kicks and acceptance."""
+
+import pytest
+from src.ils.ils_solver import IteratedLocalSearchSolver
+from src.local_search.two_opt import undo_reversals
+from src.model.tsp_model import TSPInstance
+
+INSTANCE = "instances/new_instances/51.in"
+
+@pytest.fixture(scope="module")
+def instance():
+    return TSPInstance(INSTANCE)
+
+def test_double_bridge_delta_and_positions(instance):
+    solver = IteratedLocalSearchSolver(instance, segment_length=5, seed=0)
+    tour = list(range(instance.n))
+    positions = list(range(instance.n))
+    cost = solver.calculate_cost(tour)
+    for _ in range(20):
+        cost, touched, _ = solver._double_bridge(tour, positions, cost)
+        assert cost == solver.calculate_cost(tour)
+        assert sorted(tour) == list(range(instance.n))
+        assert all(tour[positions[city]] == city for city in range(instance.n))
+        assert len(touched) == 6
+
+def test_rejected_kicks_are_undone_exactly(instance):
+    solver = IteratedLocalSearchSolver(instance, segment_length=5, seed=0)
+    tour = list(range(instance.n))
+    positions = list(range(instance.n))
+    cost = solver.calculate_cost(tour)
+    for _ in range(20):
+        saved = tour[:]
+        reversals = []
+        new_cost, touched, kick = solver._double_bridge(tour, positions, cost)
+        new_cost = solver.local_search.two_opt_neighbors_inplace(tour, positions, new_cost, touched, reversals)
+        assert new_cost == solver.calculate_cost(tour)
+        undo_reversals(tour, positions, reversals)
+        solver._undo_double_bridge(tour, positions, kick)
+        assert tour == saved
+        assert all(tour[positions[city]] == city for city in range(instance.n))
+        # Keep the kicked tour for the next round
+        cost, touched, _ = solver._double_bridge(tour, positions, cost)
+
+@pytest.mark.parametrize("acceptance", ["better", "better_or_equal", "walk"])
+def test_best_tour_has_its_cost(instance, acceptance):
+    solver = IteratedLocalSearchSolver(instance, max_iterations=300, acceptance=acceptance, seed=0)
+    solution = solver.solve()
+    assert sorted(solution.tour) == list(range(instance.n))
+    assert solution.cost == solver.calculate_cost(solution.tour)
+    assert solution.stats["iterations"] == 300
+    assert solution.stats["improvements"] <= solution.stats["accepted"]
+    if acceptance == "walk":
+        assert solution.stats["accepted"] == 300
+
+def test_same_seed_same_tour(instance):
+    first = IteratedLocalSearchSolver(instance, max_iterations=100, seed=4).solve()
+    second = IteratedLocalSearchSolver(instance, max_iterations=100, seed=4).solve()
+    assert (first.tour, first.cost) == (second.tour, second.cost)
+
+def test_invalid_settings_are_rejected(instance):
+    with pytest.raises(ValueError):
+        IteratedLocalSearchSolver(instance, acceptance="sometimes")
+    with pytest.raises(ValueError):
+        IteratedLocalSearchSolver(instance, max_iterations=None)
@@ -0,0 +1,64 @@
+"""Opt-in instrumentation: phase timers, counters and incumbent history."""
+
+import csv
+import pytest
+from src.benchmarking.harness import BenchmarkCase, run_case, summarize, write_results
+from src.model.tsp_model import CountingInstance, Instrumentation, TSPInstance
+from src.registry import create_solver
+
+INSTANCE = "instances/new_instances/51.in"
+
+@pytest.fixture(scope="module")
+def instance():
+    return TSPInstance(INSTANCE)
+
+def test_off_by_default(instance):
+    solver = create_solver("grasp", instance, max_iterations=2, seed=0)
+    solver.solve()
+    assert solver.instrumentation is None and solver.instance is instance
+
+def test_grasp_phases_counters_and_incumbents(instance):
+    plain = create_solver("grasp", instance, max_iterations=5, seed=0).solve()
+    solver = create_solver("grasp", instance, max_iterations=5, seed=0)
+    instrumentation = solver.enable_instrumentation()
+    solution = solver.solve()
+    assert (solution.tour, solution.cost) == (plain.tour, plain.cost)
+
+    data = instrumentation.as_dict()
+    assert {"construction", "local_search"} <= set(data["timers"])
+    assert data["counters"]["iterations"] == 5
+    # Lookups of the sub-solvers (2-opt) are counted too
+    assert data["counters"]["distance_lookups"] > 5 * instance.n
+    costs = [cost for _, cost in data["incumbents"]]
+    times = [seconds for seconds, _ in data["incumbents"]]
+    # Only GRASP's own incumbents: strictly improving, ending at the result
+    assert costs == sorted(set(costs), reverse=True) and costs[-1] == solution.cost
+    assert times == sorted(times)
+
+def test_distance_rows_count_one_lookup_per_city(instance):
+    instrumentation = Instrumentation()
+    counting = CountingInstance(instance, instrumentation)
+    assert counting.distance_row(3) == instance.distance_row(3)
+    counting.distance(0, 1)
+    assert instrumentation.distance_lookups == instance.n + 1
+    counting.neighbor_lists(5)
+    counting.tour_costs([list(range(instance.n))])
+    assert instrumentation.distance_lookups == instance.n + 1
+
+def test_held_karp_lookups_are_counted():
+    small = TSPInstance("instances/new_instances/17.in")
+    solver = create_solver("held_karp", small, max_size=17)
+    instrumentation = solver.enable_instrumentation()
+    solver.solve()
+    assert instrumentation.as_dict()["counters"]["distance_lookups"] >= small.n * small.n
+
+def test_harness_rows_get_instrumentation_columns(instance, tmp_path):
+    rows = run_case(instance, "51.in", BenchmarkCase("ILS", "ils", {"max_iterations": 50}),
+                    repeats=1, warmup=0, verbose=False, instrument=True)
+    row, = rows
+    assert row["n_distance_lookups"] > 0 and row["incumbents"] >= 1
+    assert row["time_to_best"] > 0
+    paths = write_results(str(tmp_path / "bench"), rows, summarize(rows), {})
+    with open(paths[0]) as f:
+        header = next(csv.reader(f))
+    assert "n_distance_lookups" in header and "incumbent_history" not in header
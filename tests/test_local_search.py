@@ -0,0 +1,60 @@
+"""Neighbour lists, segment reversals and 2-opt on matrix instances."""
+
+import pytest
+from src.constructive.nearest_neighbor import ConstructiveSolver
+from src.local_search.two_opt import LocalSearchSolver, reverse_segment
+from src.model.tsp_model import TSPInstance
+
+INSTANCE = "instances/new_instances/51.in"
+
+@pytest.fixture(scope="module")
+def instance():
+    return TSPInstance(INSTANCE)
+
+def test_neighbor_lists_are_the_nearest_cities_by_distance_then_number(instance):
+    for k in (1, 5, 10):
+        for city, neighbors in enumerate(instance.neighbor_lists(k)):
+            others = sorted((j for j in range(instance.n) if j != city),
+                            key=lambda j: (instance.distance(city, j), j))
+            assert neighbors == others[:k]
+    assert len(instance.neighbor_lists(1000)[0]) == instance.n - 1
+
+def test_neighbor_two_opt_returns_a_better_tour_with_its_cost(instance):
+    start = ConstructiveSolver(instance).solve()
+    solver = LocalSearchSolver(instance, neighbor_list_size=8)
+    solution = solver.two_opt_neighbors(start.tour, start.cost)
+    assert sorted(solution.tour) == list(range(instance.n))
+    assert solution.cost == solver.calculate_cost(solution.tour)
+    assert solution.cost <= start.cost
+    # Local optimum: no improving 2-opt move left between neighbours
+    tour, n = solution.tour, instance.n
+    position = {city: i for i, city in enumerate(tour)}
+    neighbors = instance.neighbor_lists(8)
+    for i, a in enumerate(tour):
+        b = tour[(i + 1) % n]
+        for c in neighbors[a]:
+            d = tour[(position[c] + 1) % n]
+            if c != b and d != a:
+                assert (instance.distance(a, c) + instance.distance(b, d)
+                        >= instance.distance(a, b) + instance.distance(c, d))
+
+def test_exhaustive_two_opt_returns_a_better_tour_with_its_cost(instance):
+    start = ConstructiveSolver(instance).solve()
+    solver = LocalSearchSolver(instance, start)
+    solution = solver.solve()
+    assert solution.cost == solver.calculate_cost(solution.tour) <= start.cost
+
+@pytest.mark.parametrize("i, j", [(2, 5), (7, 1), (0, 9), (4, 4)])
+def test_reverse_segment_keeps_positions_and_the_cycle(i, j):
+    n = 10
+    tour = list(range(n))
+    positions = list(range(n))
+    reverse_segment(tour, positions, i, j)
+    assert all(tour[positions[city]] == city for city in range(n))
+    # Same cycle as reversing tour[i..j] cyclically
+    expected = list(range(n))
+    segment = [(i + k) % n for k in range((j - i) % n + 1)]
+    for position, city in zip(segment, reversed([expected[p] for p in segment])):
+        expected[position] = city
+    edges = lambda t: {frozenset((t[k], t[k - 1])) for k in range(n)}
+    assert edges(tour) == edges(expected)
@@ -0,0 +1,84 @@
+"""Isolated runs: results, deadline kills, memory caps and errors."""
+
+import multiprocessing as mp
+import sys
+import time
+import pytest
+from src.model.tsp_model import Solution, Solver, TSPInstance
+from src.registry import SOLVERS, SolverSpec
+from src.runtime.process_runner import TERMINATE_GRACE, RunSpec, run_isolated, run_many
+
+INSTANCE = "instances/new_instances/51.in"
+
+@pytest.fixture(scope="module")
+def instance():
+    return TSPInstance(INSTANCE)
+
+def _is_tour_with_cost(instance, result):
+    return (instance.validate_tours([result["solution"]])[0]
+            and result["cost"] == instance.tour_costs([result["solution"]])[0])
+
+def test_completed_run(instance):
+    result = run_isolated("grasp", instance, timeout=60, max_iterations=3, seed=0)
+    assert result["status"] == "completed"
+    assert _is_tour_with_cost(instance, result)
+    assert 0 < result["time"] < 60
+
+def test_deadline_kills_the_child_and_keeps_its_last_incumbent(instance):
+    result = run_isolated("ils", instance, timeout=1.0, max_iterations=None, time_limit=600, seed=0)
+    assert result["status"] == "timeout"
+    assert _is_tour_with_cost(instance, result)
+    # Timed from the start of solve(), which comes after the process start
+    assert 0.5 < result["time"] < 1.0 + TERMINATE_GRACE + 1.0
+
+class MemoryHogSolver(Solver):
+    """Allocates 64 MiB before returning the identity tour."""
+
+    def solve(self) -> Solution:
+        block = bytearray(64 * 2**20)
+        del block
+        tour = list(range(self.instance.n))
+        return Solution(tour, self.calculate_cost(tour))
+
+class SleepySolver(Solver):
+    """Sleeps 0.3 s before returning the identity tour."""
+
+    def solve(self) -> Solution:
+        time.sleep(0.3)
+        tour = list(range(self.instance.n))
+        return Solution(tour, self.calculate_cost(tour))
+
+# Test solvers are registered in the parent, so children must be forked
+needs_fork = pytest.mark.skipif(mp.get_start_method() != "fork", reason="test solvers need fork")
+
+@needs_fork
+@pytest.mark.parametrize("workers", [1, None])
+def test_workers_limit_simultaneous_runs_but_not_their_times(instance, monkeypatch, workers):
+    monkeypatch.setitem(SOLVERS, "sleepy", SolverSpec("sleepy", __name__, "SleepySolver", "test"))
+    start = time.perf_counter()
+    results = run_many(instance, [RunSpec("sleepy")] * 3, workers)
+    wall = time.perf_counter() - start
+    assert [r["status"] for r in results] == ["completed"] * 3
+    # Each time is the child's own solve(), whatever the scheduling
+    assert all(0.3 <= r["time"] < 0.6 for r in results)
+    if workers == 1:
+        assert wall >= 0.9
+    else:
+        assert wall < 0.9
+
+@needs_fork
+@pytest.mark.skipif(sys.platform == "win32", reason="RLIMIT_AS is POSIX only")
+def test_memory_cap_fails_the_run_but_not_its_neighbours(instance, monkeypatch):
+    monkeypatch.setitem(SOLVERS, "memory_hog", SolverSpec("memory_hog", __name__, "MemoryHogSolver", "test"))
+    results = run_many(instance, [
+        RunSpec("memory_hog"),
+        RunSpec("memory_hog", memory_limit_mb=32),
+        RunSpec("constructive"),
+    ])
+    assert [r["status"] for r in results] == ["completed", "error: memory limit exceeded", "completed"]
+    assert results[1]["solution"] is None
+
+def test_solver_errors_are_reported(instance):
+    result = run_isolated("grasp", instance, timeout=10, colour="red")
+    assert result["status"].startswith("error:")
+    assert result["solution"] is None and result["cost"] == float("inf")
@@ -0,0 +1,57 @@
+"""Profiling of a single run: cProfile and stack sampling outputs."""
+
+import json
+import os
+import pstats
+import subprocess
+import sys
+import pytest
+import solve
+from src.benchmarking.profiling import PROFILE_MODES, profile_call, profile_prefix
+from src.model.tsp_model import TSPInstance
+from src.registry import create_solver
+
+INSTANCE = "instances/new_instances/51.in"
+
+@pytest.fixture(scope="module")
+def solver():
+    return create_solver("grasp", TSPInstance(INSTANCE), max_iterations=3, seed=0)
+
+def test_cprofile_run(solver, tmp_path):
+    prefix = str(tmp_path / "profiles" / "grasp")
+    solution, summary = profile_call(solver.solve, prefix, "cprofile", description={"method": "grasp"})
+    assert solution.cost > 0
+    assert summary["files"] == [f"{prefix}.pstats", f"{prefix}.txt"]
+    functions = {name for _, _, name in pstats.Stats(f"{prefix}.pstats").stats}
+    assert "construct_randomized_greedy" in functions
+    with open(f"{prefix}.json") as f:
+        saved = json.load(f)
+    assert saved["description"] == {"method": "grasp"} and saved["peak_memory_bytes"] > 0
+
+def test_sampled_run_writes_collapsed_stacks(solver, tmp_path):
+    prefix = str(tmp_path / "sampled")
+    _, summary = profile_call(solver.solve, prefix, "sample", interval=0.0005)
+    with open(f"{prefix}.collapsed") as f:
+        lines = f.read().splitlines()
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == summary["samples"]
+    if lines:
+        assert any("solve (grasp_solver.py" in line for line in lines)
+
+def test_unknown_mode_and_prefix(tmp_path):
+    with pytest.raises(ValueError):
+        profile_call(lambda: None, str(tmp_path / "x"), "perf")
+    assert profile_prefix("out", "instances/a/51.in", "grasp", None, "sample") == os.path.join("out", "51_grasp_sample")
+
+def test_solve_script_imports_the_profiler_only_when_asked():
+    code = "import sys, solve; assert 'src.benchmarking.profiling' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+    parser_choices = {action.dest: action.choices for action in solve.build_parser()._actions}
+    assert tuple(parser_choices["profile"]) == PROFILE_MODES
+
+def test_solve_script_profile_run(tmp_path):
+    # Run from tmp_path: solve.py writes its .out file to the current directory
+    subprocess.run([sys.executable, os.path.abspath("solve.py"), os.path.abspath(INSTANCE), "constructive",
+                    "--profile", "cprofile", "--profile-dir", "profiles"],
+                   cwd=tmp_path, check=True, stdout=subprocess.DEVNULL)
+    assert (tmp_path / "profiles" / "51_constructive_cprofile.pstats").exists()
+    assert (tmp_path / "51_constructive.out").exists()
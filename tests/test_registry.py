@@ -0,0 +1,40 @@
+"""Solver registry: lazy loading and command-line parameter parsing."""
+
+import subprocess
+import sys
+import pytest
+from src.registry import ParamSpec, convert_params, get_spec, parse_params
+
+def test_solver_modules_are_imported_on_demand():
+    code = ("import sys; from src.registry import create_solver, available_solvers; "
+            "assert available_solvers(); "
+            "assert not [m for m in sys.modules if m.startswith(('src.genetic', 'src.grasp', 'src.annealing'))]")
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+def test_parse_params_converts_to_the_schema_types():
+    params = parse_params("grasp", ["max_iterations=7", "alpha=0.5", "reactive=yes",
+                                    "path-relinking=mixed", "time_limit=none"])
+    assert params == {"max_iterations": 7, "alpha": 0.5, "reactive": True,
+                      "path_relinking": "mixed", "time_limit": None}
+
+@pytest.mark.parametrize("assignment", ["max_iterations", "iterations=5", "max_iterations=many", "reactive=maybe"])
+def test_parse_params_rejects_bad_assignments(assignment):
+    with pytest.raises(ValueError):
+        parse_params("grasp", [assignment])
+
+def test_convert_params_accepts_json_scalars():
+    params = convert_params("grasp", {"max_iterations": 7, "alpha": 1, "reactive": False,
+                                      "path-relinking": "mixed", "time_limit": None})
+    assert params == {"max_iterations": 7, "alpha": 1.0, "reactive": False,
+                      "path_relinking": "mixed", "time_limit": None}
+    assert type(params["alpha"]) is float
+    with pytest.raises(ValueError):
+        convert_params("exact", {"time_limit": 0.5})
+
+def test_unknown_method():
+    with pytest.raises(KeyError):
+        get_spec("simplex")
+
+def test_param_spec_parse():
+    assert ParamSpec(bool, False).parse("off") is False
+    assert ParamSpec(int, 1).parse("None") is None
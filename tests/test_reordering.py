@@ -0,0 +1,53 @@
+"""Renumbered instances: valid orderings and tours mapped back to the original cities."""
+
+import pytest
+from src.model.coordinate_instance import CoordinateInstance
+from src.model.generator import generate_points, write_coordinate_instance
+from src.model.reordering import ORDERINGS, default_ordering, reorder, to_original, to_reordered
+from src.model.tsp_model import CountingInstance, Instrumentation, TSPInstance
+from src.registry import create_solver
+
+@pytest.fixture(scope="module")
+def matrix_instance():
+    return TSPInstance("instances/new_instances/51.in")
+
+@pytest.fixture(scope="module")
+def coordinate_instance(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("reordering") / "clustered_200.tsp")
+    write_coordinate_instance(path, "clustered_200", generate_points("clustered", 200, 0))
+    return CoordinateInstance(path)
+
+def _instances(matrix_instance, coordinate_instance, method):
+    if method == "hilbert":
+        return [coordinate_instance]
+    return [matrix_instance, coordinate_instance]
+
+@pytest.mark.parametrize("method", sorted(ORDERINGS) + ["auto"])
+def test_orderings_are_permutations_preserving_distances(matrix_instance, coordinate_instance, method):
+    for instance in _instances(matrix_instance, coordinate_instance, method):
+        reordered, order = reorder(instance, method)
+        assert sorted(order) == list(range(instance.n))
+        assert reordered.n == instance.n
+        for a in range(0, instance.n, 7):
+            for b in range(instance.n):
+                assert reordered.distance(a, b) == instance.distance(order[a], order[b])
+
+@pytest.mark.parametrize("method", ["nn", "rcm"])
+def test_solving_the_reordered_instance_maps_back_at_the_same_cost(matrix_instance, method):
+    reordered, order = reorder(matrix_instance, method)
+    solution = create_solver("local_search", reordered).solve()
+    tour = to_original(solution.tour, order)
+    assert matrix_instance.validate_tours([tour])[0]
+    assert matrix_instance.tour_costs([tour])[0] == solution.cost
+    assert to_reordered(tour, order) == solution.tour
+
+def test_hilbert_needs_coordinates(matrix_instance):
+    with pytest.raises(ValueError):
+        reorder(matrix_instance, "hilbert")
+    with pytest.raises(ValueError):
+        reorder(matrix_instance, "spiral")
+
+def test_default_ordering_sees_through_the_instrumentation_proxy(matrix_instance, coordinate_instance):
+    assert default_ordering(matrix_instance) == "rcm"
+    assert default_ordering(coordinate_instance) == "hilbert"
+    assert default_ordering(CountingInstance(coordinate_instance, Instrumentation())) == "hilbert"
@@ -0,0 +1,98 @@
+"""Solve service: JSON-lines protocol, worker instance cache and errors."""
+
+import io
+import json
+import shutil
+import pytest
+from src.runtime import service as service_module
+from src.runtime.service import InstanceCache, SolveService, serve_stream
+
+INSTANCE = "instances/new_instances/17.in"
+
+@pytest.fixture
+def service():
+    service = SolveService(workers=1, max_pending=2)
+    yield service
+    service.shutdown()
+
+def _serve(service, requests):
+    infile = io.StringIO("".join(json.dumps(r) + "\n" if not isinstance(r, str) else r + "\n" for r in requests))
+    outfile = io.StringIO()
+    serve_stream(service, infile, outfile)
+    return {response["id"]: response for response in map(json.loads, outfile.getvalue().splitlines())}
+
+def test_repeated_instances_hit_the_worker_cache(service, tmp_path):
+    copy = tmp_path / "copy.in"
+    shutil.copy(INSTANCE, copy)
+    responses = _serve(service, [
+        {"id": 1, "instance": INSTANCE, "method": "constructive"},
+        {"id": 2, "instance": INSTANCE, "method": "grasp", "params": {"max_iterations": 2, "seed": 0}},
+        # Same content under another name: same digest
+        {"id": 3, "instance": str(copy), "method": "local_search"},
+    ])
+    assert [responses[i]["status"] for i in (1, 2, 3)] == ["ok"] * 3
+    assert [responses[i]["cache_hit"] for i in (1, 2, 3)] == [False, True, True]
+    for response in responses.values():
+        assert sorted(response["tour"]) == list(range(response["size"]))
+
+def test_bad_requests_get_error_responses(service, tmp_path):
+    responses = _serve(service, [
+        "{not json",
+        "[1, 2]",
+        {"id": 1, "instance": INSTANCE, "method": "simplex"},
+        {"id": 2, "instance": str(tmp_path / "missing.in"), "method": "constructive"},
+        {"id": 3, "method": "constructive"},
+        {"id": 4, "instance": INSTANCE, "method": "constructive"},
+    ])
+    assert responses[None]["status"] == "error"
+    assert [responses[i]["status"] for i in (1, 2, 3, 4)] == ["error", "error", "error", "ok"]
+
+def test_params_are_checked_and_converted_like_the_command_line(service):
+    responses = _serve(service, [
+        {"id": 1, "instance": INSTANCE, "method": "grasp", "params": {"colour": "red"}},
+        {"id": 2, "instance": INSTANCE, "method": "grasp", "params": {"max_iterations": 0.5}},
+        {"id": 3, "instance": INSTANCE, "method": "grasp", "params": {"reactive": "maybe"}},
+        # Strings and JSON scalars both go through ParamSpec.parse
+        {"id": 4, "instance": INSTANCE, "method": "grasp",
+         "params": {"max-iterations": "2", "reactive": True, "seed": 0, "time_limit": None}},
+    ])
+    assert [responses[i]["status"] for i in (1, 2, 3, 4)] == ["error", "error", "error", "ok"]
+    assert "colour" in responses[1]["error"]
+
+@pytest.mark.parametrize("method, time_budget, time_limit", [
+    ("exact", 0.5, 1), ("exact", 2.1, 3), ("grasp", 0.5, 0.5),
+])
+def test_time_budget_becomes_the_time_limit(monkeypatch, method, time_budget, time_limit):
+    created = []
+    constructive = service_module.create_solver
+    def create_solver(method, instance, **params):
+        # Record the parameters, then run something quick
+        created.append(params)
+        return constructive("constructive", instance)
+    monkeypatch.setattr(service_module, "create_solver", create_solver)
+    service_module._init_worker(1)
+    service_module._solve(INSTANCE, "digest", method, {}, time_budget)
+    assert created == [{"time_limit": time_limit}]
+
+def test_a_failed_submission_frees_its_slot():
+    service = SolveService(workers=1, max_pending=1)
+    service.shutdown()
+    responses = []
+    # With the slot kept, the second submission would block forever
+    for job_id in (1, 2):
+        service.submit({"id": job_id, "instance": INSTANCE, "method": "constructive"}, responses.append)
+    assert [(r["id"], r["status"]) for r in responses] == [(1, "error"), (2, "error")]
+
+def test_instance_cache_evicts_the_least_recently_used(tmp_path):
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.in"
+        path.write_text(f"3\n0 1 {len(name) + len(paths)}\n1 0 1\n{len(name) + len(paths)} 1 0\n")
+        paths.append(str(path))
+    cache = InstanceCache(max_size=2)
+    cache.get(paths[0])
+    cache.get(paths[1])
+    assert cache.get(paths[0])[1]
+    cache.get(paths[2])  # evicts b
+    assert not cache.get(paths[1])[1]
+    assert (cache.hits, cache.misses) == (1, 4)
@@ -0,0 +1,40 @@
+"""Every registered solver returns a tour of all the cities with its true cost."""
+
+import pytest
+from src.model.tsp_model import TSPInstance
+from src.registry import available_solvers, create_solver, get_spec
+
+INSTANCES = ["instances/new_instances/17.in", "instances/new_instances/51.in"]
+
+# Small budgets so that the whole matrix runs in seconds
+FAST_PARAMS = {
+    "exact": {"time_limit": 2},
+    "held_karp": {"max_size": 17},
+    "grasp": {"max_iterations": 5},
+    "ils": {"max_iterations": 200},
+    "annealing": {"time_limit": None, "max_moves": 20000},
+    "genetic": {"population_size": 10, "generations": 3},
+    "decomposition": {"cluster_size": 10, "window_size": 8, "sub_iterations": 20},
+}
+
+@pytest.fixture(scope="module", params=INSTANCES)
+def instance(request):
+    return TSPInstance(request.param)
+
+@pytest.mark.parametrize("method", available_solvers())
+def test_solution_is_a_tour_with_its_true_cost(method, instance):
+    if method == "held_karp" and instance.n > 17:
+        pytest.skip("Held-Karp is exponential in n")
+    params = dict(FAST_PARAMS.get(method, {}))
+    if "seed" in get_spec(method).params:
+        params["seed"] = 0
+    solution = create_solver(method, instance, **params).solve()
+    assert instance.validate_tours([solution.tour])[0]
+    assert solution.cost == instance.tour_costs([solution.tour])[0]
+
+def test_held_karp_is_optimal_and_bounds_tour_merging():
+    instance = TSPInstance("instances/new_instances/17.in")
+    held_karp = create_solver("held_karp", instance, max_size=17).solve()
+    merged = create_solver("grasp", instance, max_iterations=30, tour_merging=True, seed=0).solve()
+    assert held_karp.cost == 2085
+    assert merged.cost >= held_karp.cost
@@ -0,0 +1,25 @@
+"""Canonical tour keys and the LRU tour cache."""
+
+from src.grasp.tour_cache import TourCache, canonical_tour
+
+def test_canonical_tour_is_rotation_and_direction_invariant():
+    key = canonical_tour([3, 1, 4, 0, 2])
+    assert key == (0, 2, 3, 1, 4)
+    assert canonical_tour([4, 0, 2, 3, 1]) == key
+    assert canonical_tour([2, 0, 4, 1, 3]) == key
+    assert canonical_tour([0, 1, 2, 3, 4]) != key
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TourCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.put("c", 3)
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.get("b") is None
+    assert cache.counters() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "evictions": 1, "size": 2}
+
+def test_zero_size_cache_stores_nothing():
+    cache = TourCache(max_size=0)
+    cache.put("a", 1)
+    assert len(cache) == 0 and cache.get("a") is None
@@ -0,0 +1,53 @@
+"""Tour merging: consensus edges, contracted instances and merged tours."""
+
+import pytest
+from src.grasp.elite_pool import tour_edges
+from src.grasp.tour_merging import ReducedInstance, consensus_edges, merge_tours
+from src.model.tsp_model import Solution, TSPInstance
+from src.registry import create_solver
+
+@pytest.fixture(scope="module")
+def instance():
+    return TSPInstance("instances/new_instances/51.in")
+
+@pytest.fixture(scope="module")
+def solutions(instance):
+    return [create_solver("grasp", instance, max_iterations=3, seed=seed).solve() for seed in range(4)]
+
+def test_consensus_edges_are_shared_by_every_tour():
+    tours = [[0, 1, 2, 3, 4, 5], [0, 1, 2, 4, 3, 5], [1, 2, 0, 3, 4, 5]]
+    assert consensus_edges(tours) == tour_edges(tours[0]) & tour_edges(tours[1]) & tour_edges(tours[2])
+    assert consensus_edges(tours[:1]) == tour_edges(tours[0])
+
+def test_reduced_tours_expand_back_to_the_same_tour(instance, solutions):
+    tour = solutions[0].tour
+    # Two fixed paths of the tour; the reversed tour walks them the other way
+    fixed = frozenset((min(a, b), max(a, b)) for a, b in
+                      list(zip(tour[:10], tour[1:11])) + list(zip(tour[20:24], tour[21:25])))
+    reduction = ReducedInstance(instance, fixed)
+    assert reduction.reduced.n == instance.n - 9 - 3
+    for candidate in (tour, tour[::-1]):
+        expanded = reduction.expand_tour(reduction.reduce_tour(candidate))
+        assert instance.validate_tours([expanded])[0]
+        assert instance.tour_costs([expanded])[0] == solutions[0].cost
+
+def test_reduced_tours_without_a_forced_edge_do_not_expand(instance):
+    reduction = ReducedInstance(instance, frozenset({(0, 1), (1, 2)}))
+    assert reduction.reduced.n == instance.n - 1
+    position = {city: i for i, city in enumerate(reduction.nodes)}
+    # The end points 0 and 2 of the fixed path are not consecutive
+    order = [0, 3, 2] + list(range(4, instance.n))
+    assert reduction.expand_tour([position[city] for city in order]) is None
+    assert reduction.expand_tour([position[city] for city in [0, 2] + order[3:] + [3]]) is not None
+
+def test_merged_tour_is_never_worse_than_the_best_input(instance, solutions):
+    merged, stats = merge_tours(instance, solutions, seed=0)
+    assert instance.validate_tours([merged.tour])[0]
+    assert merged.cost == instance.tour_costs([merged.tour])[0]
+    assert merged.cost <= min(s.cost for s in solutions)
+    assert stats["tours"] == len(solutions)
+
+def test_a_single_tour_is_returned_unchanged(instance, solutions):
+    merged, stats = merge_tours(instance, solutions[:1])
+    assert merged is solutions[0]
+    assert stats["method"] is None
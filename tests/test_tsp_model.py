@@ -0,0 +1,34 @@
+"""TSPInstance batch evaluation, with and without NumPy."""
+
+import random
+import pytest
+from src.model import tsp_model
+from src.model.tsp_model import TSPInstance
+
+INSTANCE = "instances/new_instances/17.in"
+
+@pytest.fixture(params=["numpy", "python"])
+def instance(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(tsp_model, "np", None)
+    elif tsp_model.np is None:
+        pytest.skip("NumPy is not installed")
+    return TSPInstance(INSTANCE)
+
+def _cost(instance, tour):
+    return sum(instance.distance(tour[i - 1], tour[i]) for i in range(len(tour)))
+
+def test_tour_costs_match_a_loop(instance):
+    rng = random.Random(0)
+    tours = [rng.sample(range(instance.n), instance.n) for _ in range(20)]
+    assert instance.tour_costs(tours) == [_cost(instance, tour) for tour in tours]
+    assert list(instance.iter_tour_costs(iter(tours), chunk_size=3)) == instance.tour_costs(tours)
+    assert instance.tour_costs([]) == []
+
+def test_validate_tours(instance):
+    n = instance.n
+    valid = list(range(n))
+    duplicate = [0] + list(range(n - 1))
+    short = list(range(n - 1))
+    assert instance.validate_tours([valid, duplicate, short, valid[::-1]]) == [True, False, False, True]
+    assert instance.validate_tours([]) == []
@@ -0,0 +1,52 @@
+"""GRASP tuning: size classes, successive halving and the tuned table."""
+
+import pytest
+import tune_grasp
+from src.grasp.grasp_solver import DEFAULT_REACTIVE_ALPHAS, GRASPSolver
+from src.grasp.tuning import (SuccessiveHalving, config_grid, instance_size, load_tuned_params, save_table,
+                              size_class_bounds)
+from src.model.tsp_model import TSPInstance
+
+SMALL = "instances/new_instances/17.in"
+
+def test_size_classes():
+    assert [size_class_bounds([500, 100], n) for n in (17, 100, 101, 501)] == [100, 100, 500, None]
+    assert instance_size(SMALL) == 17
+
+def test_successive_halving_keeps_the_best_half_each_round():
+    configs = config_grid([0.0, 0.3], [1, 4], [None], [None, 3])
+    assert len(configs) == 8
+    evaluations = [(SMALL, 0), (SMALL, 1), (SMALL, 2), (SMALL, 3)]
+    race = SuccessiveHalving(configs, evaluations, eta=2, time_weight=0.0, verbose=False)
+    config, score = race.run()
+    # 8 configurations x 1 evaluation, the best 4 x 2, the best 2 x 4; no pair runs twice
+    assert sorted(len(r) for r in race.results) == [1, 1, 1, 1, 2, 2, 4, 4]
+    winner = configs.index(config)
+    assert score == race.score(winner, 4) >= 0
+    assert all(race.score(winner, 4) <= race.score(c, 4) for c in range(8) if len(race.results[c]) == 4)
+
+def test_tuned_table_lookup(tmp_path):
+    path = str(tmp_path / "tuned.json")
+    save_table(path, [{"max_size": 100, "config": {"alpha": 0.1}}, {"max_size": 500, "config": {"alpha": 0.2}}])
+    assert [load_tuned_params(path, n) for n in (50, 300, 5000)] == [{"alpha": 0.1}, {"alpha": 0.2}, {"alpha": 0.2}]
+    save_table(path, [{"max_size": None, "config": {"alpha": 0.3}}, {"max_size": 100, "config": {"alpha": 0.1}}])
+    assert load_tuned_params(path, 5000) == {"alpha": 0.3}
+
+def test_candidate_list_of_one_is_the_nearest_neighbour():
+    instance = TSPInstance(SMALL)
+    solver = GRASPSolver(instance, alpha=1.0, candidate_list_size=1, seed=0)
+    tour = solver.construct_randomized_greedy()
+    for a, b in zip(tour, tour[1:]):
+        remaining = set(range(instance.n)) - set(tour[:tour.index(b)])
+        assert instance.distance(a, b) == min(instance.distance(a, c) for c in remaining)
+
+def test_alpha_sweep_is_reproducible(capsys):
+    outputs = []
+    for _ in range(2):
+        tune_grasp.alpha_sweep(SMALL, iterations=2, runs=2)
+        # Costs only: times vary between runs
+        outputs.append([line.split("|")[:3] for line in capsys.readouterr().out.splitlines() if "|" in line])
+    rows = outputs[0]
+    assert outputs[1] == rows
+    assert len(rows) == 1 + len(DEFAULT_REACTIVE_ALPHAS) + 1
+    assert rows[-1][0].strip() == "Reactive"
@@ -0,0 +1,57 @@
+"""Warm starts from a tour, a Solution or a previous .out file."""
+
+import pytest
+from src.model.tsp_model import Solution, TSPInstance, load_initial_solution
+from src.registry import create_solver
+
+INSTANCE = "instances/new_instances/51.in"
+
+@pytest.fixture(scope="module")
+def instance():
+    return TSPInstance(INSTANCE)
+
+@pytest.fixture(scope="module")
+def local_optimum(instance):
+    return create_solver("local_search", instance).solve()
+
+def test_out_file_round_trip(instance, local_optimum, tmp_path):
+    path = str(tmp_path / "51_local_search.out")
+    local_optimum.write(path)
+    loaded = Solution.from_file(path)
+    assert (loaded.tour, loaded.cost) == (local_optimum.tour, local_optimum.cost)
+    checked = load_initial_solution(instance, path)
+    assert (checked.tour, checked.cost) == (local_optimum.tour, local_optimum.cost)
+
+def test_a_tour_gets_its_cost_recomputed(instance):
+    tour = list(range(instance.n))
+    solution = load_initial_solution(instance, tour)
+    assert solution.tour == tour
+    assert solution.cost == instance.tour_costs([tour])[0]
+    assert load_initial_solution(instance, None) is None
+
+@pytest.mark.parametrize("tour", [[0, 1, 2], list(range(50)) + [0], list(range(1, 52))])
+def test_a_tour_of_other_cities_is_rejected(instance, tour):
+    with pytest.raises(ValueError):
+        load_initial_solution(instance, tour)
+
+def test_an_empty_out_file_is_rejected(instance, tmp_path):
+    path = tmp_path / "empty.out"
+    path.write_text("")
+    with pytest.raises(ValueError):
+        load_initial_solution(instance, str(path))
+
+@pytest.mark.parametrize("method, params", [
+    ("local_search", {}),
+    ("grasp", {"max_iterations": 3, "seed": 0}),
+    ("ils", {"max_iterations": 50, "seed": 0}),
+    ("annealing", {"max_moves": 5000, "seed": 0}),
+    ("genetic", {"population_size": 10, "generations": 3, "seed": 0}),
+])
+def test_solvers_never_return_worse_than_their_warm_start(instance, local_optimum, method, params):
+    solution = create_solver(method, instance, initial_solution=local_optimum, **params).solve()
+    assert instance.validate_tours([solution.tour])[0]
+    assert solution.cost <= local_optimum.cost
+
+def test_local_search_keeps_a_local_optimum(instance, local_optimum):
+    solution = create_solver("local_search", instance, initial_solution=local_optimum.tour).solve()
+    assert (solution.tour, solution.cost) == (local_optimum.tour, local_optimum.cost)
@@ -1,53 +1,101 @@
 
+import argparse
+import glob
 import os
-import time
 import statistics
-from src.model.tsp_model import TSPInstance
-from src.grasp.grasp_solver import GRASPSolver
-
-def run_experiment():
-    instance_path = "instances/new_instances/51.in"
-    if not os.path.exists(instance_path):
-        print(f"Instance {instance_path} not found.")
-        return
-
-    try:
-        instance = TSPInstance(instance_path)
-    except Exception as e:
-        print(f"Error loading {instance_path}: {e}")
-        return
-
-    alphas = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
-    iterations = 50
-    num_runs = 5
+import time
+from src.benchmarking.harness import machine_metadata
+from src.grasp.grasp_solver import DEFAULT_REACTIVE_ALPHAS
+from src.grasp.tuning import DEFAULT_SIZE_CLASSES, config_grid, instance_size, save_table, tune
+from src.model.tsp_model import load_instance
+from src.registry import create_solver
 
-    results = {}
+def optional_int(text):
+    return None if text.lower() == "none" else int(text)
 
-    print(f"Running tuning on {instance_path} with {iterations} iterations, {num_runs} runs per alpha.")
+def alpha_sweep(instance_path, iterations, runs):
+    """Fixed-alpha sweep on one instance, followed by reactive GRASP on the same alpha grid."""
+    instance = load_instance(instance_path)
+    print(f"Running tuning on {instance_path} with {iterations} iterations, {runs} runs per alpha.")
     print("Alpha | Avg Cost | Best Cost | Avg Time")
     print("-" * 40)
 
-    for alpha in alphas:
+    def measure(**params):
         costs = []
         times = []
-        for _ in range(num_runs):
-            solver = GRASPSolver(instance, max_iterations=iterations, alpha=alpha)
-            start_time = time.time()
-            solution = solver.solve()
-            end_time = time.time()
-            
-            costs.append(solution.cost)
-            times.append(end_time - start_time)
-        
-        avg_cost = statistics.mean(costs)
-        best_cost = min(costs)
-        avg_time = statistics.mean(times)
-        
+        for seed in range(runs):
+            solver = create_solver("grasp", instance, max_iterations=iterations, seed=seed, **params)
+            start_time = time.perf_counter()
+            costs.append(solver.solve().cost)
+            times.append(time.perf_counter() - start_time)
+        return statistics.mean(costs), min(costs), statistics.mean(times)
+
+    results = {}
+    for alpha in DEFAULT_REACTIVE_ALPHAS:
+        avg_cost, best_cost, avg_time = measure(alpha=alpha)
         results[alpha] = avg_cost
         print(f"{alpha:5.1f} | {avg_cost:8.2f} | {best_cost:9.2f} | {avg_time:8.4f}s")
+    print("\nBest Alpha based on Avg Cost:", min(results, key=results.get))
+
+    # Reactive GRASP: alpha is learned online, no sweep required
+    avg_cost, best_cost, avg_time = measure(reactive=True, alphas=DEFAULT_REACTIVE_ALPHAS)
+    print(f"Reactive | {avg_cost:8.2f} | {best_cost:9.2f} | {avg_time:8.4f}s")
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Tune GRASP per instance size class by successive halving")
+    parser.add_argument("--instances", nargs="+", default=["instances/new_instances/*.in"],
+                        help="training instance files or glob patterns")
+    parser.add_argument("--max-size", type=int, default=1000, help="ignore larger instances (default: 1000)")
+    parser.add_argument("--alphas", type=float, nargs="+", default=[0.1, 0.2, 0.3, 0.5])
+    parser.add_argument("--iterations", type=int, nargs="+", default=[20, 50, 100])
+    parser.add_argument("--neighbor-list-sizes", type=optional_int, nargs="+", default=[None, 10],
+                        help="local search variants: none (full 2-opt) or k (default: none 10)")
+    parser.add_argument("--candidate-list-sizes", type=optional_int, nargs="+", default=[None, 5, 10],
+                        help="RCL size caps, none for no cap (default: none 5 10)")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2, 3])
+    parser.add_argument("--size-classes", type=int, nargs="+", default=DEFAULT_SIZE_CLASSES,
+                        help="upper bounds of the size classes (default: 100 500)")
+    parser.add_argument("--eta", type=int, default=2, help="keep 1/eta of the configurations per round")
+    parser.add_argument("--time-weight", type=float, default=0.1,
+                        help="score penalty, in gap percent, per second of run time (default: 0.1)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output", default="report/grasp_tuned.json")
+    parser.add_argument("--sweep", metavar="INSTANCE",
+                        help="instead of tuning, sweep alpha on one instance and compare with reactive GRASP")
+    parser.add_argument("--sweep-iterations", type=int, default=50, help="GRASP iterations per sweep run")
+    parser.add_argument("--sweep-runs", type=int, default=5, help="seeded runs per alpha in the sweep")
+    args = parser.parse_args()
+
+    if args.sweep:
+        alpha_sweep(args.sweep, args.sweep_iterations, args.sweep_runs)
+        return
+
+    files = sorted({f for pattern in args.instances for f in glob.glob(pattern)}, key=os.path.getsize)
+    files = [f for f in files if instance_size(f) <= args.max_size]
+    if not files:
+        print("No training instances found")
+        return
+
+    configs = config_grid(args.alphas, args.iterations, args.neighbor_list_sizes, args.candidate_list_sizes)
+    print(f"{len(configs)} configurations, {len(files)} instances, {len(args.seeds)} seeds, "
+          f"{args.workers} workers")
+    start = time.perf_counter()
+    table = tune(files, configs, args.seeds, args.size_classes, args.eta,
+                 time_weight=args.time_weight, workers=args.workers)
+
+    print(f"\n{'Size class':<12} {'alpha':>6} {'iters':>6} {'LS k':>6} {'RCL':>6} {'score':>8}")
+    for entry in table:
+        config = entry["config"]
+        bound = f"<= {entry['max_size']}" if entry["max_size"] is not None else "larger"
+        print(f"{bound:<12} {config['alpha']:>6} {config['max_iterations']:>6} "
+              f"{str(config['neighbor_list_size']):>6} {str(config['candidate_list_size']):>6} {entry['score']:>8.3f}")
 
-    best_alpha = min(results, key=results.get)
-    print("\nBest Alpha based on Avg Cost:", best_alpha)
+    metadata = machine_metadata()
+    metadata["config"] = vars(args)
+    metadata["elapsed"] = time.perf_counter() - start
+    save_table(args.output, table, metadata)
+    print(f"\nConfiguration table saved to {args.output} (wall time {metadata['elapsed']:.1f}s)")
 
 if __name__ == "__main__":
-    run_experiment()
+    main()